@@ -14,8 +14,10 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 from app.db.base import Base
 from app.models.project import Project
 from app.models.episode import Episode
-from app.models.story import Story
-from app.models.screenplay import Screenplay, Scene
+from app.models.story import Story, StoryRevision
+from app.models.screenplay import Screenplay, Scene, SceneContent, SceneCharacter
+from app.models.rate_limit import AIRateLimitBucket
+from app.models.screenplay_batch import ScreenplayBatchJob, ScreenplayBatchEpisode
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -30,6 +32,13 @@ if config.config_file_name is not None:
 # for 'autogenerate' support
 target_metadata = Base.metadata
 
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Leave the pg_trgm indexes (created only where the extension exists, see app.db.ddl) to their migration."""
+    return not (type_ == "index" and reflected and name.endswith("_trgm"))
+
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -60,6 +69,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -94,7 +104,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,50 @@
+"""add_server_timestamps_and_updated_at_triggers
+
+Revision ID: 5d2f8e6a1c94
+Revises: c3a9d41e7b52
+Create Date: 2026-10-19 15:08:51.774120
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2f8e6a1c94'
+down_revision: Union[str, Sequence[str], None] = 'c3a9d41e7b52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('projects', 'episodes', 'stories', 'screenplays', 'scenes')
+
+
+def upgrade() -> None:
+    """Upgrade schema: Generate created_at/updated_at in the database."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = timezone('utc', now());
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=sa.text("timezone('utc', now())"))
+        op.alter_column(table, 'updated_at', server_default=sa.text("timezone('utc', now())"))
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
+    
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
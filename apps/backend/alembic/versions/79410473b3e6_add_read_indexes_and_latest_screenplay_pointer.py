@@ -0,0 +1,53 @@
+"""add_read_indexes_and_latest_screenplay_pointer
+
+Revision ID: 79410473b3e6
+Revises: f65fae8aab0e
+Create Date: 2026-10-19 11:03:27.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '79410473b3e6'
+down_revision: Union[str, Sequence[str], None] = 'f65fae8aab0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add composite read indexes and episodes.latest_screenplay_id."""
+    op.create_index('ix_screenplays_episode_id_created_at', 'screenplays', ['episode_id', 'created_at'], unique=False)
+    op.create_index('ix_scenes_screenplay_id_scene_number', 'scenes', ['screenplay_id', 'scene_number'], unique=False)
+    op.create_index('ix_episodes_project_id_episode_number', 'episodes', ['project_id', 'episode_number'], unique=False)
+    
+    op.add_column('episodes', sa.Column('latest_screenplay_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key(
+        'fk_episodes_latest_screenplay_id', 'episodes', 'screenplays',
+        ['latest_screenplay_id'], ['id'], ondelete='SET NULL'
+    )
+    
+    # Backfill the pointer with each episode's most recent screenplay
+    op.execute("""
+        UPDATE episodes
+        SET latest_screenplay_id = (
+            SELECT screenplays.id
+            FROM screenplays
+            WHERE screenplays.episode_id = episodes.id
+            ORDER BY screenplays.created_at DESC
+            LIMIT 1
+        )
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_episodes_latest_screenplay_id', 'episodes', type_='foreignkey')
+    op.drop_column('episodes', 'latest_screenplay_id')
+    op.drop_index('ix_episodes_project_id_episode_number', table_name='episodes')
+    op.drop_index('ix_scenes_screenplay_id_scene_number', table_name='scenes')
+    op.drop_index('ix_screenplays_episode_id_created_at', table_name='screenplays')
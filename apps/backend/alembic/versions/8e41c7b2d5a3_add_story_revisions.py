@@ -0,0 +1,75 @@
+"""add_story_revisions
+
+Revision ID: 8e41c7b2d5a3
+Revises: 5d2f8e6a1c94
+Create Date: 2026-10-19 16:21:37.902614
+
+"""
+from typing import Sequence, Union
+import uuid
+import zlib
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e41c7b2d5a3'
+down_revision: Union[str, Sequence[str], None] = '5d2f8e6a1c94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add story_revisions and stories.revision."""
+    op.create_table('story_revisions',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('story_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('revision', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('content_length', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=True),
+    sa.ForeignKeyConstraint(['story_id'], ['stories.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('story_id', 'revision', name='uq_story_revisions_story_id_revision')
+    )
+    op.add_column('stories', sa.Column('revision', sa.Integer(), server_default=sa.text('0'), nullable=False))
+    
+    # Existing content becomes revision 1, stored as a compressed snapshot
+    conn = op.get_bind()
+    stories = conn.execute(sa.text("SELECT id, content FROM stories WHERE content IS NOT NULL"))
+    revisions = sa.table(
+        'story_revisions',
+        sa.column('id', postgresql.UUID(as_uuid=True)),
+        sa.column('story_id', postgresql.UUID(as_uuid=True)),
+        sa.column('revision', sa.Integer()),
+        sa.column('kind', sa.String()),
+        sa.column('data', sa.LargeBinary()),
+        sa.column('content_length', sa.Integer()),
+    )
+    rows = [
+        {
+            'id': uuid.uuid4(),
+            'story_id': story_id,
+            'revision': 1,
+            'kind': 'snapshot',
+            'data': zlib.compress(content.encode('utf-8')),
+            'content_length': len(content),
+        }
+        for story_id, content in stories
+    ]
+    if rows:
+        op.bulk_insert(revisions, rows)
+    
+    # Keep updated_at (and so ETags) unchanged by the backfill
+    op.execute("ALTER TABLE stories DISABLE TRIGGER trg_stories_updated_at")
+    op.execute("UPDATE stories SET revision = 1 WHERE content IS NOT NULL")
+    op.execute("ALTER TABLE stories ENABLE TRIGGER trg_stories_updated_at")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('stories', 'revision')
+    op.drop_table('story_revisions')
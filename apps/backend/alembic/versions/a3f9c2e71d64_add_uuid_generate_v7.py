@@ -0,0 +1,37 @@
+"""add_uuid_generate_v7
+
+Revision ID: a3f9c2e71d64
+Revises: d5e2a8c47f19
+Create Date: 2026-10-19 22:03:17.482915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f9c2e71d64'
+down_revision: Union[str, Sequence[str], None] = 'd5e2a8c47f19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add a SQL generator for time-ordered (version 7) UUIDs."""
+    # Same layout as app.core.ids.uuid7: the first eight bytes of a random v4 UUID are
+    # replaced by the millisecond timestamp, version 7 and 12 bits of sub-millisecond time
+    # (28672 is 0x7000); the variant and random bits that follow are kept
+    op.execute("""
+        CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+            SELECT encode(overlay(uuid_send(gen_random_uuid()) PLACING int8send(
+                (micros / 1000) << 16 | 28672 | (micros % 1000) * 4096 / 1000
+            ) FROM 1 FOR 8), 'hex')::uuid
+            FROM (SELECT (extract(epoch FROM clock_timestamp()) * 1000000)::bigint AS micros) clock
+        $$ LANGUAGE sql VOLATILE
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP FUNCTION IF EXISTS uuid_generate_v7()")
@@ -0,0 +1,138 @@
+"""deduplicate_scene_contents
+
+Revision ID: a7c3e9f15b20
+Revises: 8e41c7b2d5a3
+Create Date: 2026-10-19 18:32:10.417285
+
+"""
+import hashlib
+import json
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e9f15b20'
+down_revision: Union[str, Sequence[str], None] = '8e41c7b2d5a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Frozen copies of app.models.screenplay's SCENE_CONTENT_FIELDS and scene_content_hash as of
+# this revision, so later changes to the model can't change what this migration does
+SCENE_CONTENT_FIELDS = ('title', 'duration_seconds', 'characters', 'dialogue', 'prompt')
+
+
+def scene_content_hash(values) -> str:
+    body = [values[field] for field in SCENE_CONTENT_FIELDS]
+    encoded = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def upgrade() -> None:
+    """Upgrade schema: Move scene bodies into content-addressed scene_contents."""
+    op.create_table('scene_contents',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('title', sa.String(length=255), nullable=False),
+    sa.Column('duration_seconds', sa.Integer(), nullable=False),
+    sa.Column('characters', sa.JSON(), nullable=False),
+    sa.Column('dialogue', sa.JSON(), nullable=False),
+    sa.Column('prompt', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=True),
+    sa.PrimaryKeyConstraint('content_hash')
+    )
+    op.add_column('scenes', sa.Column('content_hash', sa.String(length=64), nullable=True))
+    
+    # Hash existing scenes in Python so the digests match the ones the application computes
+    conn = op.get_bind()
+    contents = sa.table(
+        'scene_contents',
+        sa.column('content_hash', sa.String()),
+        sa.column('title', sa.String()),
+        sa.column('duration_seconds', sa.Integer()),
+        sa.column('characters', sa.JSON()),
+        sa.column('dialogue', sa.JSON()),
+        sa.column('prompt', sa.Text()),
+    )
+    # Keep updated_at (and so ETags) unchanged by the backfill
+    op.execute("ALTER TABLE scenes DISABLE TRIGGER trg_scenes_updated_at")
+    scenes = conn.execute(
+        sa.text(f"SELECT id, {', '.join(SCENE_CONTENT_FIELDS)} FROM scenes").execution_options(yield_per=BATCH_SIZE)
+    )
+    for batch in scenes.partitions():
+        rows = {}
+        assignments = []
+        for scene in batch:
+            body = {field: getattr(scene, field) for field in SCENE_CONTENT_FIELDS}
+            content_hash = scene_content_hash(body)
+            rows[content_hash] = {'content_hash': content_hash, **body}
+            assignments.append({'scene_id': scene.id, 'content_hash': content_hash})
+        conn.execute(
+            postgresql.insert(contents).on_conflict_do_nothing(index_elements=['content_hash']),
+            [rows[content_hash] for content_hash in sorted(rows)]
+        )
+        conn.execute(
+            sa.text("UPDATE scenes SET content_hash = :content_hash WHERE id = :scene_id"),
+            assignments
+        )
+    scenes.close()
+    op.execute("ALTER TABLE scenes ENABLE TRIGGER trg_scenes_updated_at")
+    
+    op.alter_column('scenes', 'content_hash', nullable=False)
+    op.create_foreign_key(
+        'scenes_content_hash_fkey', 'scenes', 'scene_contents', ['content_hash'], ['content_hash']
+    )
+    op.create_index('ix_scenes_content_hash', 'scenes', ['content_hash'], unique=False)
+    for field in SCENE_CONTENT_FIELDS:
+        op.drop_column('scenes', field)
+    
+    # Drop bodies no longer referenced by any scene once their last scene is deleted or repointed
+    op.execute("""
+        CREATE OR REPLACE FUNCTION delete_orphaned_scene_contents() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM scene_contents c
+            USING (SELECT DISTINCT content_hash FROM old_scenes) o
+            WHERE c.content_hash = o.content_hash
+              AND NOT EXISTS (SELECT 1 FROM scenes s WHERE s.content_hash = c.content_hash);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    for event in ('DELETE', 'UPDATE'):
+        op.execute(
+            f"CREATE TRIGGER trg_scenes_{event.lower()}_orphaned_contents AFTER {event} ON scenes "
+            f"REFERENCING OLD TABLE AS old_scenes "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION delete_orphaned_scene_contents()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for event in ('delete', 'update'):
+        op.execute(f"DROP TRIGGER IF EXISTS trg_scenes_{event}_orphaned_contents ON scenes")
+    op.execute("DROP FUNCTION IF EXISTS delete_orphaned_scene_contents()")
+    
+    op.add_column('scenes', sa.Column('title', sa.String(length=255), nullable=True))
+    op.add_column('scenes', sa.Column('duration_seconds', sa.Integer(), nullable=True))
+    op.add_column('scenes', sa.Column('characters', sa.JSON(), nullable=True))
+    op.add_column('scenes', sa.Column('dialogue', sa.JSON(), nullable=True))
+    op.add_column('scenes', sa.Column('prompt', sa.Text(), nullable=True))
+    op.execute("ALTER TABLE scenes DISABLE TRIGGER trg_scenes_updated_at")
+    op.execute(f"""
+        UPDATE scenes s
+        SET {', '.join(f'{field} = c.{field}' for field in SCENE_CONTENT_FIELDS)}
+        FROM scene_contents c
+        WHERE c.content_hash = s.content_hash
+    """)
+    op.execute("ALTER TABLE scenes ENABLE TRIGGER trg_scenes_updated_at")
+    for field in SCENE_CONTENT_FIELDS:
+        op.alter_column('scenes', field, nullable=False)
+    
+    op.drop_index('ix_scenes_content_hash', table_name='scenes')
+    op.drop_constraint('scenes_content_hash_fkey', 'scenes', type_='foreignkey')
+    op.drop_column('scenes', 'content_hash')
+    op.drop_table('scene_contents')
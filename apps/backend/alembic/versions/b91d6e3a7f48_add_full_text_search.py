@@ -0,0 +1,86 @@
+"""add_full_text_search
+
+Revision ID: b91d6e3a7f48
+Revises: f2b8d4c61e07
+Create Date: 2026-10-19 19:41:08.552371
+
+"""
+from typing import Sequence, Union
+import logging
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b91d6e3a7f48'
+down_revision: Union[str, Sequence[str], None] = 'f2b8d4c61e07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger('alembic.runtime.migration')
+
+DIALOGUE_LINES = "jsonb_path_query_array(dialogue, '$[*].line')"
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add generated search columns with full-text and trigram indexes."""
+    op.add_column('stories', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "to_tsvector('english'::regconfig, coalesce(content, '')) || "
+            "to_tsvector('simple'::regconfig, coalesce(content, ''))",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.add_column('scene_contents', sa.Column(
+        'search_text',
+        sa.Text(),
+        sa.Computed(f"title || ' ' || prompt || ' ' || {DIALOGUE_LINES}::text", persisted=True),
+        nullable=True
+    ))
+    op.add_column('scene_contents', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(
+            "setweight(to_tsvector('english'::regconfig, title) || to_tsvector('simple'::regconfig, title), 'A') || "
+            f"setweight(to_tsvector('english'::regconfig, {DIALOGUE_LINES}) || "
+            f"to_tsvector('simple'::regconfig, {DIALOGUE_LINES}), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, prompt) || to_tsvector('simple'::regconfig, prompt), 'C')",
+            persisted=True
+        ),
+        nullable=True
+    ))
+    op.create_index('ix_stories_search_vector', 'stories', ['search_vector'], unique=False, postgresql_using='gin')
+    op.create_index(
+        'ix_scene_contents_search_vector', 'scene_contents', ['search_vector'], unique=False, postgresql_using='gin'
+    )
+    
+    # pg_trgm ships with PostgreSQL's contrib package; without it substring search still works, just unindexed
+    conn = op.get_bind()
+    if not conn.scalar(sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")):
+        logger.warning("pg_trgm is not available; skipping trigram indexes for substring search")
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_stories_content_trgm', 'stories', ['content'], unique=False,
+        postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_scene_contents_search_text_trgm', 'scene_contents', ['search_text'], unique=False,
+        postgresql_using='gin', postgresql_ops={'search_text': 'gin_trgm_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP INDEX IF EXISTS ix_scene_contents_search_text_trgm")
+    op.execute("DROP INDEX IF EXISTS ix_stories_content_trgm")
+    op.drop_index('ix_scene_contents_search_vector', table_name='scene_contents')
+    op.drop_index('ix_stories_search_vector', table_name='stories')
+    op.drop_column('scene_contents', 'search_vector')
+    op.drop_column('scene_contents', 'search_text')
+    op.drop_column('stories', 'search_vector')
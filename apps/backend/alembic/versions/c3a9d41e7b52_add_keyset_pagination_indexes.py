@@ -0,0 +1,38 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: c3a9d41e7b52
+Revises: 79410473b3e6
+Create Date: 2026-10-19 13:42:10.318457
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3a9d41e7b52'
+down_revision: Union[str, Sequence[str], None] = '79410473b3e6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Index the full (sort key, id) of each paginated list."""
+    op.create_index('ix_projects_created_at_id', 'projects', ['created_at', 'id'], unique=False)
+    
+    # Extend the existing read indexes with the id tie-breaker used by the cursors
+    op.create_index('ix_episodes_project_id_episode_number_id', 'episodes', ['project_id', 'episode_number', 'id'], unique=False)
+    op.drop_index('ix_episodes_project_id_episode_number', table_name='episodes')
+    op.create_index('ix_screenplays_episode_id_created_at_id', 'screenplays', ['episode_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_screenplays_episode_id_created_at', table_name='screenplays')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_screenplays_episode_id_created_at', 'screenplays', ['episode_id', 'created_at'], unique=False)
+    op.drop_index('ix_screenplays_episode_id_created_at_id', table_name='screenplays')
+    op.create_index('ix_episodes_project_id_episode_number', 'episodes', ['project_id', 'episode_number'], unique=False)
+    op.drop_index('ix_episodes_project_id_episode_number_id', table_name='episodes')
+    op.drop_index('ix_projects_created_at_id', table_name='projects')
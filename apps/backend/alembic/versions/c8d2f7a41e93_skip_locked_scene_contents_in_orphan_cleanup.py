@@ -0,0 +1,52 @@
+"""skip_locked_scene_contents_in_orphan_cleanup
+
+Revision ID: c8d2f7a41e93
+Revises: a3f9c2e71d64
+Create Date: 2026-10-20 09:14:52.306118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d2f7a41e93'
+down_revision: Union[str, Sequence[str], None] = 'a3f9c2e71d64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Leave scene bodies that another transaction is about to reference to it."""
+    # Writers key-share lock the bodies their new scenes will reference; skipping those rows
+    # instead of waiting on them keeps the DELETE from failing on the new scenes' foreign keys
+    op.execute("""
+        CREATE OR REPLACE FUNCTION delete_orphaned_scene_contents() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM scene_contents c
+            WHERE c.content_hash IN (
+                SELECT u.content_hash FROM scene_contents u
+                WHERE u.content_hash IN (SELECT content_hash FROM old_scenes)
+                  AND NOT EXISTS (SELECT 1 FROM scenes s WHERE s.content_hash = u.content_hash)
+                FOR UPDATE SKIP LOCKED
+            );
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        CREATE OR REPLACE FUNCTION delete_orphaned_scene_contents() RETURNS trigger AS $$
+        BEGIN
+            DELETE FROM scene_contents c
+            USING (SELECT DISTINCT content_hash FROM old_scenes) o
+            WHERE c.content_hash = o.content_hash
+              AND NOT EXISTS (SELECT 1 FROM scenes s WHERE s.content_hash = c.content_hash);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
@@ -0,0 +1,38 @@
+"""add_soft_delete
+
+Revision ID: d5e2a8c47f19
+Revises: b91d6e3a7f48
+Create Date: 2026-10-19 21:12:44.106318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e2a8c47f19'
+down_revision: Union[str, Sequence[str], None] = 'b91d6e3a7f48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add deleted_at to projects and episodes for soft deletes."""
+    for table in ('projects', 'episodes'):
+        op.add_column(table, sa.Column('deleted_at', sa.DateTime(), nullable=True))
+        op.create_index(
+            f'ix_{table}_deleted_at', table, ['deleted_at'],
+            unique=False, postgresql_where=sa.text('deleted_at IS NOT NULL')
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Rows still waiting for the purger are removed, as a hard delete would have done
+    op.execute("DELETE FROM projects WHERE deleted_at IS NOT NULL")
+    op.execute("DELETE FROM episodes WHERE deleted_at IS NOT NULL")
+    for table in ('episodes', 'projects'):
+        op.drop_index(f'ix_{table}_deleted_at', table_name=table)
+        op.drop_column(table, 'deleted_at')
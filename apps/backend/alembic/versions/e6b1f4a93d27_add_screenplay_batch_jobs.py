@@ -0,0 +1,60 @@
+"""add_screenplay_batch_jobs
+
+Revision ID: e6b1f4a93d27
+Revises: c8d2f7a41e93
+Create Date: 2026-10-20 10:41:08.592374
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e6b1f4a93d27'
+down_revision: Union[str, Sequence[str], None] = 'c8d2f7a41e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Store screenplay batch jobs and their per-episode progress."""
+    op.create_table('screenplay_batch_jobs',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('mode', sa.String(length=20), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('provider_batch_id', sa.String(length=255), nullable=True),
+    sa.Column('lease_expires_at', sa.DateTime(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("timezone('utc', now())"), nullable=True),
+    sa.Column('finished_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(
+        'ix_screenplay_batch_jobs_unfinished', 'screenplay_batch_jobs', ['lease_expires_at'], unique=False,
+        postgresql_where=sa.text('finished_at IS NULL')
+    )
+    op.create_index(
+        'ix_screenplay_batch_jobs_finished_at', 'screenplay_batch_jobs', ['finished_at'], unique=False,
+        postgresql_where=sa.text('finished_at IS NOT NULL')
+    )
+    op.create_table('screenplay_batch_episodes',
+    sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('episode_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.Column('screenplay_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('scene_count', sa.Integer(), nullable=True),
+    sa.Column('error', sa.Text(), nullable=True),
+    sa.ForeignKeyConstraint(['job_id'], ['screenplay_batch_jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'episode_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('screenplay_batch_episodes')
+    op.drop_index('ix_screenplay_batch_jobs_finished_at', table_name='screenplay_batch_jobs')
+    op.drop_index('ix_screenplay_batch_jobs_unfinished', table_name='screenplay_batch_jobs')
+    op.drop_table('screenplay_batch_jobs')
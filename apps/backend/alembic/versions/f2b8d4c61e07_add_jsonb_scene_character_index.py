@@ -0,0 +1,72 @@
+"""add_jsonb_scene_character_index
+
+Revision ID: f2b8d4c61e07
+Revises: a7c3e9f15b20
+Create Date: 2026-10-19 19:02:44.183950
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b8d4c61e07'
+down_revision: Union[str, Sequence[str], None] = 'a7c3e9f15b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+JSON_COLUMNS = ('characters', 'dialogue')
+
+
+def upgrade() -> None:
+    """Upgrade schema: Store scene characters and dialogue as JSONB and index characters per scene body."""
+    for column in JSON_COLUMNS:
+        op.alter_column(
+            'scene_contents', column,
+            type_=postgresql.JSONB(astext_type=sa.Text()),
+            postgresql_using=f'{column}::jsonb'
+        )
+        op.create_index(
+            f'ix_scene_contents_{column}', 'scene_contents', [column], unique=False,
+            postgresql_using='gin', postgresql_ops={column: 'jsonb_path_ops'}
+        )
+    
+    op.create_table('scene_characters',
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('name', sa.Text(), nullable=False),
+    sa.Column('line_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['content_hash'], ['scene_contents.content_hash'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('content_hash', 'name')
+    )
+    op.create_index('ix_scene_characters_name_content_hash', 'scene_characters', ['name', 'content_hash'], unique=False)
+    
+    # Same rule as scene_character_line_counts: listed characters plus every speaker
+    op.execute("""
+        INSERT INTO scene_characters (content_hash, name, line_count)
+        SELECT content_hash, name, sum(is_line)::int
+        FROM (
+            SELECT content_hash, jsonb_array_elements_text(characters) AS name, 0 AS is_line
+            FROM scene_contents
+            UNION ALL
+            SELECT content_hash, line->>'character', 1
+            FROM scene_contents, jsonb_array_elements(dialogue) AS line
+        ) appearances
+        WHERE name <> ''
+        GROUP BY content_hash, name
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scene_characters_name_content_hash', table_name='scene_characters')
+    op.drop_table('scene_characters')
+    for column in JSON_COLUMNS:
+        op.drop_index(f'ix_scene_contents_{column}', table_name='scene_contents')
+        op.alter_column(
+            'scene_contents', column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json'
+        )
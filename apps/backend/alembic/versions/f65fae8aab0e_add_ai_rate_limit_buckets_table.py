@@ -0,0 +1,34 @@
+"""add_ai_rate_limit_buckets_table
+
+Revision ID: f65fae8aab0e
+Revises: 0b5a3a92462d
+Create Date: 2026-10-19 09:12:41.208114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f65fae8aab0e'
+down_revision: Union[str, Sequence[str], None] = '0b5a3a92462d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema: Add shared token-bucket state for AI rate limiting."""
+    op.create_table('ai_rate_limit_buckets',
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('request_tokens', sa.Float(), nullable=False),
+    sa.Column('token_tokens', sa.Float(), nullable=False),
+    sa.Column('updated_at', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('model')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('ai_rate_limit_buckets')
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.db import get_db
+from app.schemas.character import CharacterAppearanceResponse, CharacterLineResponse, EpisodeCharacterResponse
+from app.services.character import CharacterService
+
+router = APIRouter(prefix="/characters", tags=["characters"])
+
+
+def get_character_service(db: Session = Depends(get_db)) -> CharacterService:
+    return CharacterService(db)
+
+
+@router.get("/project/{project_id}/appearances", response_model=list[CharacterAppearanceResponse])
+def get_character_appearances(
+    project_id: UUID,
+    name: str = Query(..., min_length=1),
+    service: CharacterService = Depends(get_character_service),
+):
+    """Scenes of each episode's latest screenplay in which the character appears or speaks."""
+    appearances = service.get_appearances(project_id, name)
+    if appearances is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return appearances
+
+
+@router.get("/project/{project_id}/lines", response_model=list[CharacterLineResponse])
+def get_character_lines(
+    project_id: UUID,
+    name: str = Query(..., min_length=1),
+    service: CharacterService = Depends(get_character_service),
+):
+    """All lines the character speaks across the project's latest screenplays, in script order."""
+    lines = service.get_lines(project_id, name)
+    if lines is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return lines
+
+
+@router.get("/episode/{episode_id}", response_model=list[EpisodeCharacterResponse])
+def get_episode_characters(
+    episode_id: UUID,
+    service: CharacterService = Depends(get_character_service),
+):
+    """Characters of an episode's latest screenplay with their scene and line counts."""
+    characters = service.get_episode_characters(episode_id)
+    if characters is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Episode not found",
+        )
+    return characters
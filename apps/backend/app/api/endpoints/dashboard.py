@@ -0,0 +1,50 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_page_headers
+from app.db import get_db
+from app.schemas.dashboard import ProjectSummaryResponse, ProjectDashboardResponse
+from app.services.dashboard import DashboardService
+
+router = APIRouter(prefix="/dashboard", tags=["dashboard"])
+
+
+def get_dashboard_service(db: Session = Depends(get_db)) -> DashboardService:
+    return DashboardService(db)
+
+
+@router.get("/projects", response_model=list[ProjectSummaryResponse])
+def get_project_summaries(
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    service: DashboardService = Depends(get_dashboard_service),
+):
+    """Projects with their episode counts, paged like GET /projects."""
+    try:
+        page = service.get_project_summaries(limit=limit, cursor=cursor, include_total=include_total)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    set_page_headers(response, page)
+    return page.items
+
+
+@router.get("/projects/{project_id}", response_model=ProjectDashboardResponse)
+def get_project_dashboard(
+    project_id: UUID,
+    service: DashboardService = Depends(get_dashboard_service),
+):
+    """A project with story and latest screenplay totals for each of its episodes."""
+    dashboard = service.get_project_dashboard(project_id)
+    if not dashboard:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return dashboard
@@ -1,24 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.http_cache import conditional, etag_matches, has_validator, not_modified, page_etag, rows_etag, set_etag
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_page_headers
 from app.db.session import get_db
 from app.services.episode import EpisodeService
-from app.schemas.episode import EpisodeCreate, EpisodeUpdate, EpisodeResponse
+from app.schemas.episode import EpisodeClone, EpisodeCreate, EpisodeUpdate, EpisodeResponse
 
 router = APIRouter()
 
 
 @router.get("/project/{project_id}", response_model=List[EpisodeResponse])
-def get_episodes_by_project(project_id: UUID, db: Session = Depends(get_db)):
-    """Get all episodes for a project"""
+def get_episodes_by_project(
+    project_id: UUID,
+    request: Request,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: Session = Depends(get_db)
+):
+    """
+    Get the episodes of a project.
+    
+    Without limit or cursor, every episode is returned. With either, the
+    episodes come in pages (DEFAULT_PAGE_SIZE unless limit is given) and the
+    next page's cursor is in X-Next-Cursor.
+    """
+    if limit is None and cursor:
+        limit = DEFAULT_PAGE_SIZE
     service = EpisodeService(db)
-    return service.get_episodes_by_project(project_id)
+    try:
+        if has_validator(request):
+            etag = service.get_episodes_etag(
+                project_id, limit=limit, cursor=cursor, include_total=include_total
+            )
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        page = service.get_episodes_by_project(
+            project_id, limit=limit, cursor=cursor, include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    set_page_headers(response, page)
+    set_etag(response, page_etag(page))
+    return page.items
 
 
 @router.get("/{episode_id}", response_model=EpisodeResponse)
-def get_episode(episode_id: UUID, db: Session = Depends(get_db)):
+def get_episode(episode_id: UUID, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get a specific episode by ID"""
     service = EpisodeService(db)
     episode = service.get_episode(episode_id)
@@ -27,7 +62,7 @@ def get_episode(episode_id: UUID, db: Session = Depends(get_db)):
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Episode not found"
         )
-    return episode
+    return conditional(request, response, rows_etag([episode])) or episode
 
 
 @router.post("/", response_model=EpisodeResponse, status_code=status.HTTP_201_CREATED)
@@ -50,6 +85,19 @@ def update_episode(episode_id: UUID, episode_data: EpisodeUpdate, db: Session =
     return episode
 
 
+@router.post("/{episode_id}/clone", response_model=EpisodeResponse, status_code=status.HTTP_201_CREATED)
+def clone_episode(episode_id: UUID, clone_data: Optional[EpisodeClone] = None, db: Session = Depends(get_db)):
+    """Copy an episode with its story, screenplays and scenes to the end of a project (its own by default)"""
+    service = EpisodeService(db)
+    episode = service.clone_episode(episode_id, clone_data or EpisodeClone())
+    if not episode:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Episode or project not found"
+        )
+    return episode
+
+
 @router.delete("/{episode_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_episode(episode_id: UUID, db: Session = Depends(get_db)):
     """Delete an episode"""
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from app.core.metrics import metrics
+
 router = APIRouter(tags=["health"])
 
 
@@ -17,3 +19,8 @@ async def ping():
 async def health_check():
     return {"status": "healthy"}
 
+
+@router.get("/metrics")
+async def get_metrics():
+    """In-process metrics for this worker."""
+    return metrics.snapshot()
@@ -1,30 +1,106 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from tempfile import SpooledTemporaryFile
+from typing import Optional
 from uuid import UUID
 
+from app.core.http_cache import conditional, etag_matches, has_validator, not_modified, page_etag, rows_etag, set_etag
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_page_headers
 from app.db import get_db
 from app.schemas import ProjectCreate, ProjectUpdate, ProjectResponse
+from app.schemas.project import ProjectClone, ProjectImportResponse
 from app.services import ProjectService
+from app.services.project_transfer import ProjectTransferService, stream_project_export
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
+# Import bodies beyond this size are spooled to a temporary file
+IMPORT_SPOOL_MEMORY_BYTES = 8 * 1024 * 1024
+
 
 def get_project_service(db: Session = Depends(get_db)) -> ProjectService:
     return ProjectService(db)
 
 
+def get_project_transfer_service(db: Session = Depends(get_db)) -> ProjectTransferService:
+    return ProjectTransferService(db)
+
+
 @router.get("", response_model=list[ProjectResponse])
 def get_projects(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    skip: int = Query(0, ge=0, description="Offset of the first page; deprecated in favor of cursor"),
     service: ProjectService = Depends(get_project_service),
 ):
-    return service.get_projects(skip=skip, limit=limit)
+    """Get a page of projects, newest first; the next page's cursor is in X-Next-Cursor"""
+    try:
+        if has_validator(request):
+            etag = service.get_projects_etag(limit=limit, cursor=cursor, include_total=include_total, skip=skip)
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        page = service.get_projects(limit=limit, cursor=cursor, include_total=include_total, skip=skip)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    set_page_headers(response, page)
+    set_etag(response, page_etag(page))
+    return page.items
+
+
+@router.post("/import", response_model=ProjectImportResponse, status_code=status.HTTP_201_CREATED)
+async def import_project(
+    request: Request,
+    service: ProjectTransferService = Depends(get_project_transfer_service),
+):
+    """
+    Create a new project from an NDJSON export (the body of GET /projects/{id}/export).
+    The body is spooled to disk before loading, so large imports don't hold a
+    worker's memory or keep a database transaction open on a slow upload.
+    """
+    with SpooledTemporaryFile(max_size=IMPORT_SPOOL_MEMORY_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        try:
+            return await run_in_threadpool(service.import_project, spool)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e),
+            )
+
+
+@router.get("/{project_id}/export")
+def export_project(
+    project_id: UUID,
+    service: ProjectService = Depends(get_project_service),
+):
+    """Stream the project with its episodes, stories, screenplays and scenes as NDJSON."""
+    if not service.get_project(project_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return StreamingResponse(
+        stream_project_export(project_id),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": f'attachment; filename="project-{project_id}.ndjson"'},
+    )
 
 
 @router.get("/{project_id}", response_model=ProjectResponse)
 def get_project(
     project_id: UUID,
+    request: Request,
+    response: Response,
     service: ProjectService = Depends(get_project_service),
 ):
     project = service.get_project(project_id)
@@ -33,7 +109,7 @@ def get_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    return project
+    return conditional(request, response, rows_etag([project])) or project
 
 
 @router.post("", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
@@ -59,6 +135,22 @@ def update_project(
     return project
 
 
+@router.post("/{project_id}/clone", response_model=ProjectResponse, status_code=status.HTTP_201_CREATED)
+def clone_project(
+    project_id: UUID,
+    clone_data: Optional[ProjectClone] = None,
+    service: ProjectService = Depends(get_project_service),
+):
+    """Copy a project with its episodes, stories, screenplays and scenes into a new project."""
+    project = service.clone_project(project_id, clone_data or ProjectClone())
+    if not project:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return project
+
+
 @router.delete("/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
 def delete_project(
     project_id: UUID,
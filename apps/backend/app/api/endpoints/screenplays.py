@@ -1,14 +1,33 @@
 import logging
-from fastapi import APIRouter, Depends, HTTPException, status
+import time
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
-from app.db.session import get_db
+from app.core.cache import scenes_cache
+from app.core.http_cache import conditional, etag_matches, has_validator, not_modified, page_etag, rows_etag
+from app.core.responses import json_response
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_page_headers
+from app.db.session import get_db, get_async_db
+from app.repositories.aio import AsyncScreenplayRepository, AsyncSceneRepository
 from app.core.dependencies import get_ai_service
 from app.services.screenplay import ScreenplayService
+from app.services.screenplay_batch import ScreenplayBatchService
+from app.services.screenplay_diff import diff_scenes
 from app.services.ai.base_ai_service import BaseAIService
-from app.schemas.screenplay import SceneResponse
+from app.services.ai.rate_limiter import AIRateLimitError
+from app.schemas.screenplay import (
+    SCENE_LIST_ADAPTER,
+    SceneResponse,
+    ScreenplayResponse,
+    ScreenplaySummaryResponse,
+    ScreenplayDiffResponse,
+    ScreenplayBatchRequest,
+    ScreenplayBatchResponse,
+)
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -17,7 +36,9 @@ router = APIRouter()
 @router.get("/episode/{episode_id}", response_model=List[SceneResponse])
 async def get_screenplay_scenes(
     episode_id: UUID,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get the latest screenplay scenes for an episode.
@@ -26,24 +47,34 @@ async def get_screenplay_scenes(
     logger.info(f"Fetching screenplay scenes for episode {episode_id}")
     
     try:
-        from app.repositories.screenplay import ScreenplayRepository
-        from app.repositories.scene import SceneRepository
+        cached = scenes_cache.get(episode_id)
+        if cached is not None:
+            return conditional(request, response, rows_etag(cached)) or json_response(SCENE_LIST_ADAPTER, cached, response)
         
-        screenplay_repo = ScreenplayRepository(db)
-        scene_repo = SceneRepository(db)
+        read_started = time.monotonic()
+        scene_repo = AsyncSceneRepository(db)
         
-        # Get the latest screenplay for the episode
-        screenplay = screenplay_repo.get_by_episode_id(episode_id)
-        if not screenplay:
+        # Revalidation: compare scene versions before loading the dialogue-heavy rows
+        if has_validator(request):
+            etag = rows_etag(await scene_repo.get_latest_versions_by_episode_id(episode_id))
+            if etag_matches(request, etag):
+                return not_modified(etag)
+        
+        # Get all scenes of the latest screenplay for the episode
+        scenes = await scene_repo.get_latest_by_episode_id(episode_id)
+        if not scenes:
             logger.info(f"No screenplay found for episode {episode_id}")
-            return []
+            scenes_cache.set(episode_id, [], read_started)
+            return conditional(request, response, rows_etag([])) or json_response(SCENE_LIST_ADAPTER, [], response)
         
-        # Get all scenes for this screenplay
-        scenes = scene_repo.get_by_screenplay_id(screenplay.id)
-        scene_responses = [SceneResponse.model_validate(scene) for scene in scenes]
+        scene_responses = [SceneResponse.from_row(scene) for scene in scenes]
+        scenes_cache.set(episode_id, scene_responses, read_started)
         
         logger.info(f"Found {len(scene_responses)} scenes for episode {episode_id}")
-        return scene_responses
+        return (
+            conditional(request, response, rows_etag(scene_responses))
+            or json_response(SCENE_LIST_ADAPTER, scene_responses, response)
+        )
     except Exception as e:
         logger.error(
             f"Error fetching screenplay scenes for episode {episode_id}: {str(e)}",
@@ -55,10 +86,101 @@ async def get_screenplay_scenes(
         )
 
 
+@router.get("/episode/{episode_id}/history", response_model=List[ScreenplaySummaryResponse])
+async def get_screenplay_history(
+    episode_id: UUID,
+    request: Request,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get a page of an episode's screenplays, newest first, without their scenes.
+    The cursor for the next page is returned in the X-Next-Cursor header.
+    """
+    screenplay_repo = AsyncScreenplayRepository(db)
+    try:
+        page = await screenplay_repo.get_page_by_episode_id(
+            episode_id, limit=limit, cursor=cursor, include_total=include_total
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    
+    set_page_headers(response, page)
+    return (
+        conditional(request, response, page_etag(page))
+        or [ScreenplaySummaryResponse.model_validate(screenplay) for screenplay in page.items]
+    )
+
+
+@router.get("/episode/{episode_id}/diff", response_model=ScreenplayDiffResponse)
+async def diff_screenplays(
+    episode_id: UUID,
+    from_screenplay_id: UUID = Query(..., alias="from"),
+    to_screenplay_id: Optional[UUID] = Query(None, alias="to"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Compare two screenplay versions of an episode scene by scene.
+    Defaults to comparing against the latest screenplay when "to" is omitted.
+    """
+    screenplay_repo = AsyncScreenplayRepository(db)
+    base = await screenplay_repo.get_by_id(from_screenplay_id)
+    if to_screenplay_id is None:
+        target = await screenplay_repo.get_by_episode_id(episode_id)
+    else:
+        target = await screenplay_repo.get_by_id(to_screenplay_id)
+    if not base or not target or base.episode_id != episode_id or target.episode_id != episode_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Screenplay not found for this episode"
+        )
+    
+    scene_repo = AsyncSceneRepository(db)
+    old = await scene_repo.get_outline_by_screenplay_id(base.id)
+    new = await scene_repo.get_outline_by_screenplay_id(target.id)
+    return ScreenplayDiffResponse(
+        from_screenplay_id=base.id,
+        to_screenplay_id=target.id,
+        scenes=diff_scenes(old, new)
+    )
+
+
+@router.get("/{screenplay_id}", response_model=ScreenplayResponse)
+async def get_screenplay(
+    screenplay_id: UUID,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get one screenplay version with all of its scenes."""
+    screenplay = await AsyncScreenplayRepository(db).get_by_id(screenplay_id)
+    if not screenplay:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Screenplay not found"
+        )
+    
+    scenes = await AsyncSceneRepository(db).get_by_screenplay_id(screenplay_id)
+    return ScreenplayResponse(
+        id=screenplay.id,
+        episode_id=screenplay.episode_id,
+        ai_model=screenplay.ai_model,
+        generation_time_seconds=screenplay.generation_time_seconds,
+        scene_count=screenplay.scene_count,
+        scenes=[SceneResponse.from_row(scene) for scene in scenes],
+        created_at=screenplay.created_at,
+        updated_at=screenplay.updated_at
+    )
+
+
 @router.delete("/episode/{episode_id}")
 async def clear_screenplays(
     episode_id: UUID,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Delete all screenplays for an episode.
@@ -67,10 +189,9 @@ async def clear_screenplays(
     logger.info(f"Clearing all screenplays for episode {episode_id}")
     
     try:
-        from app.repositories.screenplay import ScreenplayRepository
-        
-        screenplay_repo = ScreenplayRepository(db)
-        deleted_count = screenplay_repo.delete_all_by_episode_id(episode_id)
+        screenplay_repo = AsyncScreenplayRepository(db)
+        deleted_count = await screenplay_repo.delete_all_by_episode_id(episode_id)
+        await db.execute(scenes_cache.invalidation(episode_id))
         
         logger.info(f"Deleted {deleted_count} screenplay(s) for episode {episode_id}")
         return {"deleted_count": deleted_count}
@@ -107,7 +228,15 @@ async def generate_screenplay(
             f"{scene_count} scenes created"
         )
         
-        return screenplay.scenes
+        return json_response(SCENE_LIST_ADAPTER, screenplay.scenes)
+    except AIRateLimitError as e:
+        logger.warning(f"Screenplay generation rate limited for episode {episode_id}: {str(e)}")
+        headers = {"Retry-After": str(int(e.retry_after) + 1)} if e.retry_after else None
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers=headers
+        )
     except ValueError as e:
         logger.warning(f"Screenplay generation failed for episode {episode_id}: {str(e)}")
         raise HTTPException(
@@ -124,3 +253,47 @@ async def generate_screenplay(
             detail=f"Failed to generate screenplay: {str(e)}"
         )
 
+
+
+@router.post("/batch", response_model=ScreenplayBatchResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_screenplay_batch(
+    batch_request: ScreenplayBatchRequest,
+    ai_service: BaseAIService = Depends(get_ai_service)
+):
+    """
+    Schedule screenplay generation for every episode with a non-empty story,
+    either for a whole project or for a list of episodes.
+    Returns the batch job; poll GET /screenplays/batch/{job_id} for progress.
+    """
+    logger.info(
+        f"Scheduling {batch_request.mode} screenplay batch "
+        f"(project: {batch_request.project_id}, episodes: {batch_request.episode_ids})"
+    )
+    
+    service = ScreenplayBatchService(ai_service)
+    try:
+        job = await run_in_threadpool(
+            service.create_job,
+            project_id=batch_request.project_id,
+            episode_ids=batch_request.episode_ids,
+            mode=batch_request.mode
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    service.start(job.id)
+    return ScreenplayBatchResponse.model_validate(job)
+
+
+@router.get("/batch/{job_id}", response_model=ScreenplayBatchResponse)
+async def get_screenplay_batch(job_id: UUID):
+    """Get the status and per-episode progress of a batch job."""
+    job = await run_in_threadpool(ScreenplayBatchService.get_job, job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Batch job not found"
+        )
+    return ScreenplayBatchResponse.model_validate(job)
@@ -0,0 +1,46 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+
+from app.core.pagination import MAX_PAGE_SIZE, set_page_headers
+from app.db import get_db
+from app.schemas.search import SearchResultResponse
+from app.services.search import SearchService
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def get_search_service(db: Session = Depends(get_db)) -> SearchService:
+    return SearchService(db)
+
+
+@router.get("/project/{project_id}", response_model=list[SearchResultResponse])
+def search_project(
+    project_id: UUID,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    service: SearchService = Depends(get_search_service),
+):
+    """
+    Search a project's stories and the scene titles, prompts and dialogue of
+    each episode's latest screenplay, best matches first. Accepts web-search
+    syntax ("quoted phrases", or, -excluded). The cursor for the next page is
+    returned in the X-Next-Cursor header.
+    """
+    try:
+        page = service.search_project(project_id, q, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        )
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    set_page_headers(response, page)
+    return page.items
@@ -1,19 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
+from typing import List, Optional
 from uuid import UUID
 
+from app.core.http_cache import etag_matches, has_validator, not_modified, rows_etag, set_etag
+from app.core.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, set_page_headers
 from app.db.session import get_db
-from app.services.story import StoryService
-from app.schemas.story import StoryCreate, StoryUpdate, StoryResponse
+from app.services.story import StoryService, StoryRevisionConflictError
+from app.schemas.story import (
+    StoryCreate,
+    StoryUpdate,
+    StoryResponse,
+    StoryRevisionSummaryResponse,
+    StoryRevisionResponse,
+)
 
 router = APIRouter()
 
 
 @router.get("/episode/{episode_id}", response_model=StoryResponse)
-def get_story_by_episode(episode_id: UUID, db: Session = Depends(get_db)):
+def get_story_by_episode(episode_id: UUID, request: Request, response: Response, db: Session = Depends(get_db)):
     """Get story by episode ID, creating it if it doesn't exist"""
     service = StoryService(db)
-    return service.get_or_create_story(episode_id)
+    if has_validator(request):
+        etag = service.get_story_etag(episode_id)
+        if etag and etag_matches(request, etag):
+            return not_modified(etag)
+    story = service.get_or_create_story(episode_id)
+    if not story:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Episode not found"
+        )
+    set_etag(response, rows_etag([story]))
+    return story
 
 
 @router.post("/", response_model=StoryResponse, status_code=status.HTTP_201_CREATED)
@@ -25,9 +45,20 @@ def create_story(story_data: StoryCreate, db: Session = Depends(get_db)):
 
 @router.patch("/episode/{episode_id}", response_model=StoryResponse)
 def update_story(episode_id: UUID, story_data: StoryUpdate, db: Session = Depends(get_db)):
-    """Update story content"""
+    """Update story content, either in full or as text operations against base_revision"""
     service = StoryService(db)
-    story = service.update_story(episode_id, story_data)
+    try:
+        story = service.update_story(episode_id, story_data)
+    except StoryRevisionConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail={"message": str(e), "current_revision": e.current_revision}
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     if not story:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -35,3 +66,42 @@ def update_story(episode_id: UUID, story_data: StoryUpdate, db: Session = Depend
         )
     return story
 
+
+
+@router.get("/episode/{episode_id}/revisions", response_model=List[StoryRevisionSummaryResponse])
+def get_story_revisions(
+    episode_id: UUID,
+    response: Response,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    db: Session = Depends(get_db)
+):
+    """List a story's revisions, newest first; the next page's cursor is in X-Next-Cursor"""
+    service = StoryService(db)
+    try:
+        page = service.get_revisions(episode_id, limit=limit, cursor=cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Story not found"
+        )
+    set_page_headers(response, page)
+    return page.items
+
+
+@router.get("/episode/{episode_id}/revisions/{revision}", response_model=StoryRevisionResponse)
+def get_story_revision(episode_id: UUID, revision: int, db: Session = Depends(get_db)):
+    """Get a story's content as of a revision"""
+    service = StoryService(db)
+    story_revision = service.get_revision(episode_id, revision)
+    if not story_revision:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Story revision not found"
+        )
+    return story_revision
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.endpoints import projects, health, episodes, stories, screenplays, videos
+from app.api.endpoints import projects, health, episodes, stories, screenplays, videos, dashboard, characters, search
 
 api_router = APIRouter()
 
@@ -8,6 +8,9 @@ api_router.include_router(health.router)
 
 # API endpoints
 api_router.include_router(projects.router)
+api_router.include_router(dashboard.router)
+api_router.include_router(characters.router)
+api_router.include_router(search.router)
 api_router.include_router(episodes.router, prefix="/episodes", tags=["episodes"])
 api_router.include_router(stories.router, prefix="/stories", tags=["stories"])
 api_router.include_router(screenplays.router, prefix="/screenplays", tags=["screenplays"])
@@ -0,0 +1,173 @@
+"""
+Command line entry points for the backend.
+
+Usage:
+    python -m app.cli generate-screenplays --project-id <uuid>
+    python -m app.cli generate-screenplays --episode-id <uuid> --episode-id <uuid> --offline
+    python -m app.cli resume-screenplay-batches
+    python -m app.cli export-project --project-id <uuid> --output project.ndjson
+    python -m app.cli import-project --input project.ndjson
+    python -m app.cli purge-deleted
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from uuid import UUID
+
+from app.core.dependencies import get_ai_service
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+
+def _print_progress(episode) -> None:
+    details = f" ({episode.scene_count} scenes)" if episode.scene_count is not None else ""
+    if episode.error:
+        details = f" - {episode.error}"
+    print(f"[{episode.status}] episode {episode.episode_id}{details}", flush=True)
+
+
+async def _generate_screenplays(args: argparse.Namespace) -> int:
+    from app.services.screenplay_batch import ScreenplayBatchService
+    
+    service = ScreenplayBatchService(get_ai_service(), on_progress=_print_progress)
+    if args.concurrency:
+        service.concurrency = args.concurrency
+    try:
+        job = service.create_job(
+            project_id=args.project_id,
+            episode_ids=args.episode_ids,
+            mode="offline" if args.offline else "online"
+        )
+    except ValueError as e:
+        print(f"error: {str(e)}", file=sys.stderr)
+        return 2
+    print(f"Batch {job.id}: {len(job.episodes)} episodes", flush=True)
+    
+    job = await service.run(job.id)
+    if job.provider_batch_id:
+        print(f"Provider batch: {job.provider_batch_id}")
+    completed = sum(1 for episode in job.episodes if episode.status == "completed")
+    print(f"Batch {job.id} {job.status}: {completed}/{len(job.episodes)} episodes completed")
+    return 0 if job.status == "completed" else 1
+
+
+async def _resume_screenplay_batches(args: argparse.Namespace) -> int:
+    from app.services.screenplay_batch import ScreenplayBatchService
+    
+    service = ScreenplayBatchService(get_ai_service(), on_progress=_print_progress)
+    job_ids = service.claim_abandoned_jobs()
+    if not job_ids:
+        print("No screenplay batches to resume", flush=True)
+        return 0
+    print(f"Resuming {len(job_ids)} screenplay batches", flush=True)
+    jobs = await asyncio.gather(*(service.run(job_id) for job_id in job_ids))
+    for job in jobs:
+        completed = sum(1 for episode in job.episodes if episode.status == "completed")
+        print(f"Batch {job.id} {job.status}: {completed}/{len(job.episodes)} episodes completed")
+    return 0 if all(job.status == "completed" for job in jobs) else 1
+
+
+def _export_project(args: argparse.Namespace) -> int:
+    from app.services.project_transfer import stream_project_export
+    
+    output = open(args.output, "wb") if args.output else sys.stdout.buffer
+    size = 0
+    try:
+        for chunk in stream_project_export(args.project_id):
+            output.write(chunk)
+            size += len(chunk)
+    finally:
+        if args.output:
+            output.close()
+    if not size:
+        print(f"Project {args.project_id} not found", file=sys.stderr)
+        return 1
+    print(f"Exported project {args.project_id} ({size} bytes)", file=sys.stderr)
+    return 0
+
+
+def _import_project(args: argparse.Namespace) -> int:
+    from app.db.session import session_scope
+    from app.services.project_transfer import ProjectTransferService
+    
+    source = open(args.input, "rb") if args.input else sys.stdin.buffer
+    try:
+        with session_scope() as db:
+            project = ProjectTransferService(db).import_project(source)
+    except ValueError as e:
+        print(f"Import failed: {str(e)}", file=sys.stderr)
+        return 1
+    finally:
+        if args.input:
+            source.close()
+    print(
+        f"Imported project {project.id}: {project.episode_count} episodes, {project.story_count} stories, "
+        f"{project.screenplay_count} screenplays, {project.scene_count} scenes",
+        file=sys.stderr
+    )
+    return 0
+
+
+def _purge_deleted(args: argparse.Namespace) -> int:
+    from app.services.purger import purger
+    
+    deleted = purger.purge_all()
+    print(f"Purged {deleted} rows of deleted projects and episodes", file=sys.stderr)
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Yashvi Media Studio backend commands")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    
+    generate = subparsers.add_parser(
+        "generate-screenplays",
+        help="Generate screenplays for every episode with a non-empty story"
+    )
+    target = generate.add_mutually_exclusive_group(required=True)
+    target.add_argument("--project-id", type=UUID, help="Generate for all episodes in this project")
+    target.add_argument("--episode-id", dest="episode_ids", type=UUID, action="append",
+                        help="Generate for this episode (repeatable)")
+    generate.add_argument("--offline", action="store_true",
+                          help="Use the provider batch API (cheaper, completes within 24 hours)")
+    generate.add_argument("--concurrency", type=int, default=None,
+                          help="Episodes generated in parallel (online mode)")
+    
+    subparsers.add_parser(
+        "resume-screenplay-batches",
+        help="Finish screenplay batches whose process stopped, e.g. offline batches still at the provider"
+    )
+    
+    export = subparsers.add_parser("export-project", help="Write a project and everything in it as NDJSON")
+    export.add_argument("--project-id", type=UUID, required=True, help="Project to export")
+    export.add_argument("--output", default=None, help="File to write (default: stdout)")
+    
+    load = subparsers.add_parser("import-project", help="Create a new project from an NDJSON export")
+    load.add_argument("--input", default=None, help="File to read (default: stdin)")
+    
+    subparsers.add_parser(
+        "purge-deleted",
+        help="Remove every soft-deleted project and episode now, in throttled batches"
+    )
+    
+    args = parser.parse_args()
+    if args.command == "generate-screenplays":
+        return asyncio.run(_generate_screenplays(args))
+    if args.command == "resume-screenplay-batches":
+        return asyncio.run(_resume_screenplay_batches(args))
+    if args.command == "export-project":
+        return _export_project(args)
+    if args.command == "import-project":
+        return _import_project(args)
+    if args.command == "purge-deleted":
+        return _purge_deleted(args)
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
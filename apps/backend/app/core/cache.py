@@ -0,0 +1,179 @@
+"""
+Bounded in-process read-through caches for hot episode reads.
+
+Entries are evicted least-recently-used and expire after a TTL. Write paths
+invalidate the local entry immediately and publish the key with ``pg_notify``
+inside their own transaction, so every worker's listener drops its copy once
+the write commits. The TTL bounds staleness if a notification is ever missed,
+e.g. while the listener is reconnecting.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import ARRAY, Text, bindparam, func, select
+from sqlalchemy.sql import Select
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+INVALIDATION_CHANNEL = "cache_invalidation"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ``ttl_seconds``."""
+
+    def __init__(self, name: str, max_entries: int, ttl_seconds: float, enabled: bool = True):
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        # When each recently invalidated key was last invalidated, to reject racing fills
+        self._invalidated_at: "OrderedDict[Hashable, float]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None on a miss or expired entry."""
+        if not self.enabled:
+            return None
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        
+        if entry is None:
+            metrics.increment(f"cache_{self.name}_misses_total")
+            return None
+        metrics.increment(f"cache_{self.name}_hits_total")
+        metrics.observe(f"cache_{self.name}_hit_age_seconds", now - entry[0])
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, read_started: Optional[float] = None) -> None:
+        """
+        Cache a value loaded from the database.
+        
+        Pass ``read_started`` (``time.monotonic()`` taken before the read) so a
+        value read before a concurrent invalidation is not cached.
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            invalidated_at = self._invalidated_at.get(key)
+            if read_started is not None and invalidated_at is not None and invalidated_at >= read_started:
+                metrics.increment(f"cache_{self.name}_stale_fills_rejected_total")
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                metrics.increment(f"cache_{self.name}_evictions_total")
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop a key from this worker's cache only."""
+        with self._lock:
+            self._entries.pop(key, None)
+            self._invalidated_at[key] = time.monotonic()
+            self._invalidated_at.move_to_end(key)
+            while len(self._invalidated_at) > self.max_entries:
+                self._invalidated_at.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def invalidation(self, key: Hashable) -> Select:
+        """
+        Invalidate a key locally and return the NOTIFY statement that fans the
+        invalidation out to other workers.
+        
+        Execute the statement in the writing transaction: Postgres only
+        delivers the notification on commit, and this worker's own listener
+        receives it too, which evicts any value re-read before the commit.
+        """
+        self.invalidate(key)
+        metrics.increment(f"cache_{self.name}_invalidations_total")
+        payload = json.dumps({"cache": self.name, "key": str(key), "sent_at": time.time()})
+        return select(func.pg_notify(INVALIDATION_CHANNEL, payload))
+
+    def invalidations(self, keys: Iterable[Hashable]) -> Select:
+        """Like ``invalidation`` for many keys, with one NOTIFY per key sent by a single statement."""
+        sent_at = time.time()
+        payloads = []
+        for key in keys:
+            self.invalidate(key)
+            payloads.append(json.dumps({"cache": self.name, "key": str(key), "sent_at": sent_at}))
+        metrics.increment(f"cache_{self.name}_invalidations_total", len(payloads))
+        rows = func.unnest(bindparam("payloads", payloads, type_=ARRAY(Text))).table_valued("payload").render_derived()
+        return select(func.pg_notify(INVALIDATION_CHANNEL, rows.c.payload))
+
+
+story_cache = TTLCache("story", settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS, settings.CACHE_ENABLED)
+scenes_cache = TTLCache("scenes", settings.CACHE_MAX_ENTRIES, settings.CACHE_TTL_SECONDS, settings.CACHE_ENABLED)
+
+_caches: Dict[str, TTLCache] = {cache.name: cache for cache in (story_cache, scenes_cache)}
+
+
+def _apply_invalidation(payload: str) -> None:
+    # Anything raised here would drop the listener's connection and clear every cache
+    try:
+        message = json.loads(payload)
+        cache = _caches[message["cache"]]
+        # Keys are episode UUIDs, as used by the readers
+        key = UUID(message["key"])
+        sent_at = float(message["sent_at"])
+    except (ValueError, KeyError, TypeError, AttributeError):
+        logger.warning(f"Ignoring malformed cache invalidation: {payload}")
+        return
+    
+    cache.invalidate(key)
+    metrics.observe("cache_invalidation_lag_seconds", max(0.0, time.time() - sent_at))
+
+
+class CacheInvalidationListener:
+    """Background thread that LISTENs for invalidations published by any worker."""
+
+    def __init__(self, conninfo: str, reconnect_seconds: float = 5.0):
+        self.conninfo = conninfo
+        self.reconnect_seconds = reconnect_seconds
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="cache-invalidation-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def _run(self) -> None:
+        import psycopg
+        
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self.conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {INVALIDATION_CHANNEL}")
+                    # Anything cached while we were not listening may have missed an invalidation
+                    for cache in _caches.values():
+                        cache.clear()
+                    logger.info("Cache invalidation listener connected")
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=1.0):
+                            _apply_invalidation(notify.payload)
+            except Exception as e:
+                metrics.increment("cache_listener_errors_total")
+                logger.warning(f"Cache invalidation listener disconnected: {str(e)}")
+                self._stop.wait(self.reconnect_seconds)
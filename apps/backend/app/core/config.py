@@ -10,11 +10,59 @@ class Settings(BaseSettings):
     
     DATABASE_URL: str = ""
     
+    # Read Replica (optional streaming standby for read-only queries)
+    DATABASE_REPLICA_URL: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 2.0  # Read from the primary while the replica is further behind than this
+    REPLICA_CHECK_INTERVAL_SECONDS: float = 1.0  # How often the replica's replay position is checked
+    
+    # AI Provider Configuration
+    AI_PROVIDER: str = "openai"  # Options: openai, stub
+    
     # OpenAI Configuration
     OPENAI_API_KEY: str = ""
+    OPENAI_BASE_URL: str = ""  # OpenAI-compatible endpoint, e.g. a self-hosted server or the stub server (optional)
     OPENAI_MODEL: str = "gpt-5-nano"  # Default model for screenplay generation
     OPENAI_TEMPERATURE: float = 0.7
     OPENAI_MAX_TOKENS: int = 4000  # Maximum tokens for response
+    OPENAI_STRUCTURED_OUTPUT: bool = True  # Request schema-constrained JSON output where the model supports it
+    OPENAI_MAX_CONTINUATIONS: int = 2  # Follow-up requests for the missing tail of a truncated screenplay
+    OPENAI_RPM_LIMIT: int = 500  # Requests per minute allowed for OPENAI_MODEL
+    OPENAI_TPM_LIMIT: int = 200000  # Tokens per minute allowed for OPENAI_MODEL
+    OPENAI_MAX_RETRIES: int = 3  # Retries for 429 responses, honoring the provider's reset hints
+    AI_RATE_LIMIT_BACKEND: str = "postgres"  # Options: postgres (shared by all workers), local (per process)
+    AI_RATE_LIMIT_MAX_WAIT_SECONDS: float = 120.0  # Longest a call may queue for rate limit capacity
+    
+    # Stub AI Provider Configuration (in-process "stub" provider and app.services.ai.stub_server)
+    STUB_AI_LATENCY_SECONDS: float = 0.0  # Fixed delay before each response
+    STUB_AI_TOKENS_PER_SECOND: float = 0.0  # Simulated output speed (0 = instant)
+    STUB_AI_FAILURE_RATE: float = 0.0  # Fraction of calls that fail with a server error
+    STUB_AI_RATE_LIMIT_RATE: float = 0.0  # Fraction of calls rejected with HTTP 429 (stub server only)
+    STUB_AI_TRUNCATE_RATE: float = 0.0  # Fraction of responses cut off mid-output
+    STUB_AI_SEED: int = 42  # Seed for deterministic failure injection
+    
+    # Batch Screenplay Generation
+    SCREENPLAY_BATCH_CONCURRENCY: int = 4  # Episodes generated in parallel by a batch job
+    SCREENPLAY_BATCH_POLL_SECONDS: int = 60  # Poll interval for offline (provider batch) jobs
+    SCREENPLAY_BATCH_LEASE_SECONDS: int = 300  # A job whose runner has not checked in for this long may be resumed elsewhere
+    SCREENPLAY_BATCH_RETENTION_DAYS: int = 7  # Finished jobs are deleted after this many days
+    
+    # Story Revisions
+    STORY_SNAPSHOT_INTERVAL: int = 20  # Store a full snapshot every N revisions, deltas in between
+    STORY_WRITE_BEHIND: bool = False  # Buffer story updates in memory and flush them in the background
+    STORY_FLUSH_DEBOUNCE_SECONDS: float = 2.0  # Flush once a story has had no edits for this long
+    STORY_FLUSH_MAX_DELAY_SECONDS: float = 10.0  # Flush a continuously edited story at least this often (max loss window)
+    STORY_FLUSH_MAX_EDITS: int = 50  # Flush once this many edits have been coalesced
+    
+    # Read Cache (stories and latest screenplay scenes)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024  # Entries kept per cache, least recently used evicted first
+    CACHE_TTL_SECONDS: float = 300.0  # Upper bound on staleness if an invalidation is missed
+    
+    # Purging Deleted Projects and Episodes
+    PURGE_ENABLED: bool = False  # Run the background purger in this process; enable it in one process, not every web worker
+    PURGE_BATCH_SIZE: int = 1000  # Rows deleted per transaction
+    PURGE_BATCH_PAUSE_SECONDS: float = 0.5  # Pause between batches so replicas and other writers keep up
+    PURGE_IDLE_SECONDS: float = 30.0  # How often to look for deleted rows when there is nothing to purge
     
     # Video Generation Configuration
     VIDEO_GENERATION_SERVICE: str = "luma_dream_machine"  # Options: stable_video_diffusion, animatediff, luma_dream_machine
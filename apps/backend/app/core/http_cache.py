@@ -0,0 +1,74 @@
+"""
+HTTP conditional request helpers.
+
+ETags are weak validators derived from row ids and ``updated_at`` values
+(plus paging state for lists), so they can be computed from a narrow version
+query without loading or serializing the body. Responses are sent with
+``Cache-Control: private, no-cache``: clients may keep a copy but must
+revalidate, which costs a 304 with no body when nothing changed.
+"""
+import hashlib
+from typing import Any, Iterable, Optional
+
+from fastapi import Request, Response, status
+
+from app.core.pagination import Page
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from values that change whenever the representation does."""
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:32]}"'
+
+
+def rows_etag(rows: Iterable[Any], *extra: Any) -> str:
+    """ETag for a list of rows or models that expose ``id`` and ``updated_at``."""
+    return make_etag(*(f"{row.id}@{row.updated_at}" for row in rows), *extra)
+
+
+def page_etag(page: Page) -> str:
+    """ETag for a page, including the paging state returned in headers."""
+    return rows_etag(page.items, page.next_cursor, page.total)
+
+
+def has_validator(request: Request) -> bool:
+    """Whether the client sent If-None-Match, i.e. a version check is worth running first."""
+    return "if-none-match" in request.headers
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Weak comparison of the request's If-None-Match against the current ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == current for candidate in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def conditional(request: Request, response: Response, etag: Optional[str]) -> Optional[Response]:
+    """
+    Attach the ETag to the response and return a 304 response if the client
+    already has this version, otherwise None.
+    """
+    if etag is None:
+        return None
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    set_etag(response, etag)
+    return None
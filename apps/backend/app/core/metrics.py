@@ -0,0 +1,48 @@
+"""Lightweight in-process metrics registry.
+
+Counters and timings are kept per worker process and exposed through the
+``/metrics`` health endpoint as a JSON snapshot.
+"""
+import threading
+from typing import Dict
+
+
+class MetricsRegistry:
+    """Thread-safe registry of counters and observed values."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, float] = {}
+        self._observations: Dict[str, Dict[str, float]] = {}
+
+    def increment(self, name: str, value: float = 1) -> None:
+        """Increase a counter by ``value``."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a single observation (e.g. a duration) for ``name``."""
+        with self._lock:
+            stats = self._observations.get(name)
+            if stats is None:
+                self._observations[name] = {"count": 1, "sum": value, "max": value}
+            else:
+                stats["count"] += 1
+                stats["sum"] += value
+                stats["max"] = max(stats["max"], value)
+
+    def get_counter(self, name: str) -> float:
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def snapshot(self) -> dict:
+        """Return a copy of all counters and observation summaries."""
+        with self._lock:
+            observations = {
+                name: {**stats, "avg": stats["sum"] / stats["count"]}
+                for name, stats in self._observations.items()
+            }
+            return {"counters": dict(self._counters), "observations": observations}
+
+
+metrics = MetricsRegistry()
@@ -0,0 +1,124 @@
+"""
+Keyset (cursor) pagination helpers.
+
+List endpoints order by a unique key such as (created_at, id) and continue
+from the last row of the previous page instead of using OFFSET, so every page
+is a bounded index range scan no matter how deep the client has paged.
+Cursors are opaque to clients: a url-safe base64 encoding of the key values.
+"""
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Generic, List, Optional, Sequence, TypeVar
+from uuid import UUID
+
+from fastapi import Response
+from sqlalchemy import Select, tuple_
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+@dataclass
+class Page(Generic[T]):
+    """A page of results plus the cursor for the following page, if any."""
+    items: List[T]
+    next_cursor: Optional[str] = None
+    total: Optional[int] = None
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *parsers: Callable[[Any], Any]) -> tuple:
+    """
+    Decode a cursor back into its sort key values.
+
+    Args:
+        cursor: Cursor produced by encode_cursor
+        parsers: One callable per key column converting the JSON value back,
+            e.g. datetime.fromisoformat, UUID or int
+
+    Returns:
+        Tuple of key values in sort order
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the key
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(parsers):
+            raise ValueError("wrong number of key values")
+        return tuple(parse(value) for parse, value in zip(parsers, values))
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def keyset_query(
+    query: Select,
+    key_columns: Sequence[Any],
+    after: Optional[Sequence[Any]],
+    limit: Optional[int],
+    descending: bool = False,
+    offset: int = 0
+) -> Select:
+    """
+    Restrict a select to the page that follows the given key.
+
+    Uses a row-value comparison on the key columns so PostgreSQL can seek
+    straight into a matching composite index. One extra row is fetched so
+    build_page can tell whether another page exists; a limit of None reads
+    every remaining row. ``offset`` only serves endpoints that still accept
+    the old ``skip`` parameter: the skipped rows are read and thrown away.
+    """
+    if after is not None:
+        key = tuple_(*key_columns)
+        bound = tuple_(*after)
+        query = query.where(key < bound if descending else key > bound)
+    order = [column.desc() if descending else column.asc() for column in key_columns]
+    query = query.order_by(*order)
+    if offset:
+        query = query.offset(offset)
+    return query if limit is None else query.limit(limit + 1)
+
+
+def build_page(
+    rows: Sequence[T],
+    limit: Optional[int],
+    key_of: Callable[[T], Sequence[Any]],
+    total: Optional[int] = None
+) -> Page[T]:
+    """Trim the look-ahead row from a keyset query and compute the next cursor."""
+    if limit is None:
+        return Page(items=list(rows), total=total)
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(key_of(items[-1]))
+    return Page(items=items, next_cursor=next_cursor, total=total)
+
+
+def set_page_headers(response: Response, page: Page) -> None:
+    """Expose the next cursor and optional total count as response headers."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+    if page.total is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(page.total)
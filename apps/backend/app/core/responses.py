@@ -0,0 +1,27 @@
+"""
+Fast JSON response helpers.
+
+The app's default response class is ORJSONResponse. For large lists of
+response models, ``json_response`` goes further: a ``TypeAdapter`` dumps the
+models to JSON bytes in pydantic-core, skipping FastAPI's revalidation against
+``response_model`` and the intermediate conversion to Python dicts.
+"""
+from typing import Any, Optional
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+def json_response(adapter: TypeAdapter, value: Any, response: Optional[Response] = None) -> Response:
+    """
+    Serialize ``value`` with ``adapter`` into a JSON response.
+    
+    Headers already set on the endpoint's injected ``response`` (ETag, paging)
+    are carried over, since FastAPI does not merge them into a returned Response.
+    """
+    json_body = Response(content=adapter.dump_json(value), media_type="application/json")
+    if response is not None:
+        for name, header_value in response.headers.items():
+            if name != "content-length":
+                json_body.headers[name] = header_value
+    return json_body
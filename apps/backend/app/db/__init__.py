@@ -1,5 +1,6 @@
-from app.db.session import SessionLocal, engine, get_db
+from app.db.session import SessionLocal, engine, get_db, session_scope, AsyncSessionLocal, async_engine, get_async_db
 from app.models.project import Base
+from app.db import soft_delete  # noqa: F401  (registers the filter hiding soft-deleted rows)
+from app.db import ddl  # noqa: F401  (creates indexes, functions and triggers the models can't declare)
 
-__all__ = ["SessionLocal", "engine", "get_db", "Base"]
-
+__all__ = ["SessionLocal", "engine", "get_db", "session_scope", "AsyncSessionLocal", "async_engine", "get_async_db", "Base"]
@@ -1,7 +1,9 @@
 from app.models.project import Base, Project
-from app.models.story import Story
+from app.models.story import Story, StoryRevision
 from app.models.episode import Episode
-from app.models.screenplay import Screenplay, Scene
+from app.models.screenplay import Screenplay, Scene, SceneContent, SceneCharacter
+from app.models.rate_limit import AIRateLimitBucket
+from app.models.screenplay_batch import ScreenplayBatchJob, ScreenplayBatchEpisode
 
 # Import all models so Alembic can detect them
-__all__ = ["Base", "Project", "Story", "Episode", "Screenplay", "Scene"]
+__all__ = ["Base", "Project", "Story", "StoryRevision", "Episode", "Screenplay", "Scene", "SceneContent", "SceneCharacter", "AIRateLimitBucket", "ScreenplayBatchJob", "ScreenplayBatchEpisode"]
@@ -0,0 +1,103 @@
+"""
+Database objects that the models can't declare, created with ``create_all``.
+
+Migrated databases get these from their Alembic revisions; a fresh database
+built by ``Base.metadata.create_all`` (app startup, scripts, tests) gets the
+same objects from the listeners below, which run only for tables
+``create_all`` actually creates.
+"""
+import logging
+
+from sqlalchemy import DDL, event, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.schema import Table
+
+from app.models.episode import Episode
+from app.models.project import Base, Project
+from app.models.screenplay import SceneContent, Scene, Screenplay
+from app.models.story import Story
+
+logger = logging.getLogger(__name__)
+
+
+# updated_at is set by the database on every UPDATE, as in migration 5d2f8e6a1c94
+_SET_UPDATED_AT = """
+    CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+    BEGIN
+        NEW.updated_at = timezone('utc', now());
+        RETURN NEW;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+# Time-ordered ids for rows created by INSERT ... SELECT, as in migration a3f9c2e71d64
+# (same layout as app.core.ids.uuid7)
+_UUID_GENERATE_V7 = """
+    CREATE OR REPLACE FUNCTION uuid_generate_v7() RETURNS uuid AS $$
+        SELECT encode(overlay(uuid_send(gen_random_uuid()) PLACING int8send(
+            (micros / 1000) << 16 | 28672 | (micros % 1000) * 4096 / 1000
+        ) FROM 1 FOR 8), 'hex')::uuid
+        FROM (SELECT (extract(epoch FROM clock_timestamp()) * 1000000)::bigint AS micros) clock
+    $$ LANGUAGE sql VOLATILE
+"""
+
+# Scene bodies are dropped once no scene references them, as in migration c8d2f7a41e93;
+# bodies a writer has locked for its new scenes are left to it
+_DELETE_ORPHANED_SCENE_CONTENTS = """
+    CREATE OR REPLACE FUNCTION delete_orphaned_scene_contents() RETURNS trigger AS $$
+    BEGIN
+        DELETE FROM scene_contents c
+        WHERE c.content_hash IN (
+            SELECT u.content_hash FROM scene_contents u
+            WHERE u.content_hash IN (SELECT content_hash FROM old_scenes)
+              AND NOT EXISTS (SELECT 1 FROM scenes s WHERE s.content_hash = u.content_hash)
+            FOR UPDATE SKIP LOCKED
+        );
+        RETURN NULL;
+    END;
+    $$ LANGUAGE plpgsql
+"""
+
+
+@event.listens_for(Base.metadata, "before_create")
+def _create_functions(target, connection: Connection, tables=(), **kw) -> None:
+    # Only when tables are being created, so an existing (migrated) database keeps its own definitions
+    if tables:
+        connection.execute(text(_SET_UPDATED_AT))
+        connection.execute(text(_UUID_GENERATE_V7))
+        connection.execute(text(_DELETE_ORPHANED_SCENE_CONTENTS))
+
+
+for _model in (Project, Episode, Story, Screenplay, Scene):
+    event.listen(_model.__table__, "after_create", DDL(
+        "CREATE TRIGGER trg_%(table)s_updated_at BEFORE UPDATE ON %(table)s "
+        "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+    ))
+
+for _event in ("DELETE", "UPDATE"):
+    event.listen(Scene.__table__, "after_create", DDL(
+        f"CREATE TRIGGER trg_scenes_{_event.lower()}_orphaned_contents AFTER {_event} ON scenes "
+        "REFERENCING OLD TABLE AS old_scenes "
+        "FOR EACH STATEMENT EXECUTE FUNCTION delete_orphaned_scene_contents()"
+    ))
+
+
+def _add_trigram_index(table: Table, column: str, name: str):
+    """
+    Substring (ILIKE) search index; pg_trgm ships with PostgreSQL's contrib
+    package, and without it search still works, just unindexed.
+    """
+
+    def create(target: Table, connection: Connection, **kw) -> None:
+        if not connection.scalar(text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")):
+            logger.warning(f"pg_trgm is not available; skipping trigram index {name}")
+            return
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        connection.execute(text(f"CREATE INDEX {name} ON {target.name} USING gin ({column} gin_trgm_ops)"))
+
+    event.listen(table, "after_create", create)
+
+
+# Also created by migration b91d6e3a7f48, under the same availability check
+_add_trigram_index(Story.__table__, "content", "ix_stories_content_trgm")
+_add_trigram_index(SceneContent.__table__, "search_text", "ix_scene_contents_search_text_trgm")
@@ -0,0 +1,266 @@
+"""
+Read-replica routing.
+
+When DATABASE_REPLICA_URL is set, queries made inside repository methods
+marked with ``@replica_read`` are sent to a streaming replica; everything
+else goes to the primary. A read stays on the primary when:
+
+- the request is not a GET or HEAD, so reads that feed a write see current rows,
+- the session has already written (or locked rows) in this unit of work,
+- the replica is lagging by more than REPLICA_MAX_LAG_SECONDS, has not been
+  checked recently, or has just failed a query,
+- the client has written something the replica has not replayed yet.
+
+Read-your-writes across requests uses the primary's WAL position: a request
+that commits a write returns the LSN just after its commit in the
+``X-Read-After`` header and the ``read_after`` cookie. Clients send either
+back, and their reads go to the replica only once it has replayed that far.
+
+Reads that fill the story and scene caches or compute their ETags are not
+marked: cache invalidations are published by the primary and may arrive
+before the replica replays the write, which would cache a stale copy.
+"""
+import asyncio
+import functools
+import inspect
+import logging
+import re
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.metrics import metrics
+
+logger = logging.getLogger(__name__)
+
+READ_AFTER_HEADER = "X-Read-After"
+READ_AFTER_COOKIE = "read_after"
+
+_LSN_PATTERN = re.compile(r"^([0-9A-Fa-f]{1,8})/([0-9A-Fa-f]{1,8})$")
+
+# Session.info keys
+_REPLICA_READS = "replica_reads"
+_WROTE = "wrote"
+_USED_REPLICA = "used_replica"
+_REPLICA_FAILED = "replica_failed"
+
+# Replica replay position and lag; the lag counts as zero while nothing is waiting to be replayed
+_REPLICA_STATUS = text("""
+    SELECT pg_last_wal_replay_lsn()::text,
+           CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+                ELSE extract(epoch FROM now() - pg_last_xact_replay_timestamp())
+           END
+""")
+
+
+def parse_lsn(value: Optional[str]) -> Optional[int]:
+    """Convert an LSN such as "16/B374D848" to an integer; None if it is not one."""
+    match = _LSN_PATTERN.match(value or "")
+    if not match:
+        return None
+    return int(match.group(1), 16) << 32 | int(match.group(2), 16)
+
+
+class ReadConsistency:
+    """Mutable per-request state, so positions recorded in worker threads reach the middleware."""
+
+    def __init__(self, read_only: bool, read_after: Optional[str] = None):
+        self.read_only = read_only
+        self.min_lsn = parse_lsn(read_after)
+        self.write_lsn: Optional[str] = None
+
+
+_current_consistency: ContextVar[Optional[ReadConsistency]] = ContextVar("read_consistency", default=None)
+
+
+def start_read_consistency(read_only: bool, read_after: Optional[str] = None) -> ReadConsistency:
+    """Bind the consistency state of a request to the current context and return it."""
+    consistency = ReadConsistency(read_only, read_after)
+    _current_consistency.set(consistency)
+    return consistency
+
+
+class ReplicaMonitor:
+    """
+    Background check of how far the replica is behind.
+
+    The replica is used only while the last successful check is recent, so a
+    stopped monitor or an unreachable replica sends every read to the primary.
+    """
+
+    def __init__(self, max_lag_seconds: float, check_interval_seconds: float):
+        self.max_lag_seconds = max_lag_seconds
+        self.check_interval_seconds = check_interval_seconds
+        self.replayed_lsn: Optional[int] = None
+        self.lag_seconds: Optional[float] = None
+        self._checked_at: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def readable(self, min_lsn: Optional[int] = None) -> bool:
+        """Whether reads that must see everything up to min_lsn can go to the replica."""
+        checked_at, lag_seconds = self._checked_at, self.lag_seconds
+        if checked_at is None or time.monotonic() - checked_at > 3 * self.check_interval_seconds:
+            return False
+        if lag_seconds is None or lag_seconds > self.max_lag_seconds:
+            return False
+        # The recorded position only ever trails the real one, so passing this check is safe
+        return min_lsn is None or (self.replayed_lsn is not None and self.replayed_lsn >= min_lsn)
+
+    def check(self, engine: Engine) -> None:
+        """Query the replica's replay position and lag."""
+        try:
+            with engine.connect() as connection:
+                replayed, lag = connection.execute(_REPLICA_STATUS).one()
+        except Exception as e:
+            self.mark_failed()
+            logger.warning(f"Read replica check failed: {str(e)}")
+            return
+        if replayed is None:
+            # Not in recovery: a promoted or standalone server can't be compared with the primary's WAL
+            self.mark_failed()
+            logger.warning("Read replica is not a streaming standby; reading from the primary")
+            return
+        self.replayed_lsn = parse_lsn(replayed)
+        self.lag_seconds = float(lag)
+        self._checked_at = time.monotonic()
+        metrics.observe("replica_lag_seconds", self.lag_seconds)
+
+    def mark_failed(self) -> None:
+        """Stop using the replica until the next successful check."""
+        self._checked_at = None
+
+    async def _run(self, engine: Engine) -> None:
+        while True:
+            await run_in_threadpool(self.check, engine)
+            await asyncio.sleep(self.check_interval_seconds)
+
+    def start(self, engine: Engine) -> None:
+        """Start checking the replica on the running event loop."""
+        self._task = asyncio.create_task(self._run(engine))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.mark_failed()
+
+
+class RoutingSession(Session):
+    """
+    Session that sends the selects of @replica_read methods to ``replica_bind``
+    when the replica is fit to serve them, and everything else to its own bind.
+    """
+
+    def __init__(
+        self,
+        *args,
+        replica_bind: Optional[Engine] = None,
+        monitor: Optional[ReplicaMonitor] = None,
+        **kwargs
+    ):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.monitor = monitor
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        writes = (
+            clause is None
+            or not getattr(clause, "is_select", False)
+            or getattr(clause, "_for_update_arg", None) is not None
+        )
+        if writes:
+            # Flushes, DML, raw SQL and locking reads; later reads must see their effects
+            self.info[_WROTE] = True
+        elif self._reads_from_replica():
+            self.info[_USED_REPLICA] = True
+            return self.replica_bind
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def _reads_from_replica(self) -> bool:
+        if self.replica_bind is None or not self.info.get(_REPLICA_READS):
+            return False
+        if self.info.get(_WROTE) or self.info.get(_REPLICA_FAILED):
+            return False
+        consistency = _current_consistency.get()
+        return consistency is not None and consistency.read_only and self.monitor.readable(consistency.min_lsn)
+
+    def record_write_position(self) -> None:
+        """
+        After a commit, hand the primary's WAL position to the request so the
+        client can ask for reads that include this write.
+        """
+        consistency = _current_consistency.get()
+        if self.replica_bind is None or consistency is None or not self.info.get(_WROTE):
+            return
+        try:
+            consistency.write_lsn = self.scalar(text("SELECT pg_current_wal_lsn()::text"))
+        except Exception as e:
+            logger.warning(f"Could not read the WAL position after a write: {str(e)}")
+
+
+def _begin_replica_read(session: RoutingSession) -> None:
+    session.info[_REPLICA_READS] = session.info.get(_REPLICA_READS, 0) + 1
+    session.info.pop(_USED_REPLICA, None)
+
+
+def _end_replica_read(session: RoutingSession) -> None:
+    session.info[_REPLICA_READS] -= 1
+
+
+def _replica_failed(session: RoutingSession, error: OperationalError) -> bool:
+    """If the error came from the replica, stop using it so the call can be retried on the primary."""
+    if not session.info.pop(_USED_REPLICA, False):
+        return False
+    session.info[_REPLICA_FAILED] = True
+    session.monitor.mark_failed()
+    metrics.increment("replica_fallbacks_total")
+    logger.warning(f"Read replica query failed, retrying on the primary: {str(error)}")
+    return True
+
+
+def replica_read(method):
+    """
+    Mark a repository method as read-only, so its queries may be served by the
+    replica. If the replica fails mid-call, the call is repeated on the primary.
+    Works for sync and async repositories alike.
+    """
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            session = self.db.sync_session
+            _begin_replica_read(session)
+            try:
+                return await method(self, *args, **kwargs)
+            except OperationalError as e:
+                if not _replica_failed(session, e):
+                    raise
+            finally:
+                _end_replica_read(session)
+            return await method(self, *args, **kwargs)
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        session = self.db
+        _begin_replica_read(session)
+        try:
+            return method(self, *args, **kwargs)
+        except OperationalError as e:
+            if not _replica_failed(session, e):
+                raise
+        finally:
+            _end_replica_read(session)
+        return method(self, *args, **kwargs)
+
+    return wrapper
@@ -1,6 +1,12 @@
+from contextlib import contextmanager
+from typing import Iterator
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
 from app.core.config import settings
+from app.db.replica import ReplicaMonitor, RoutingSession
+from app.db.statements import count_statements
 import os
 
 # Require DATABASE_URL environment variable
@@ -11,15 +17,83 @@ if not settings.DATABASE_URL:
     )
 
 DATABASE_URL = settings.DATABASE_URL.replace("postgres://", "postgresql+psycopg://")
+DATABASE_REPLICA_URL = settings.DATABASE_REPLICA_URL.replace("postgres://", "postgresql+psycopg://")
 
 engine = create_engine(DATABASE_URL, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Async engine for async endpoints; psycopg 3 provides the async driver for the same URL
+async_engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+
+# Optional streaming replica for @replica_read repository methods (see app.db.replica)
+replica_engine = create_engine(DATABASE_REPLICA_URL, pool_pre_ping=True) if DATABASE_REPLICA_URL else None
+async_replica_engine = create_async_engine(DATABASE_REPLICA_URL, pool_pre_ping=True) if DATABASE_REPLICA_URL else None
+replica_monitor = ReplicaMonitor(
+    max_lag_seconds=settings.REPLICA_MAX_LAG_SECONDS,
+    check_interval_seconds=settings.REPLICA_CHECK_INTERVAL_SECONDS,
+)
+
+# Repositories only flush; the unit of work (request or session_scope) commits once at the end.
+# Objects stay loaded after commit so responses can be built without refresh SELECTs.
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    bind=engine,
+    class_=RoutingSession,
+    replica_bind=replica_engine,
+    monitor=replica_monitor,
+)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    replica_bind=async_replica_engine.sync_engine if async_replica_engine else None,
+    monitor=replica_monitor,
+)
+
+count_statements(engine)
+count_statements(async_engine.sync_engine)
+if replica_engine is not None:
+    count_statements(replica_engine)
+    count_statements(async_replica_engine.sync_engine)
 
 
 def get_db():
+    """Request-scoped session: commits once after the endpoint succeeds, rolls back otherwise."""
     db = SessionLocal()
     try:
         yield db
+        db.commit()
+        db.record_write_position()
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
 
+
+async def get_async_db():
+    """Async request-scoped session with the same single-commit unit of work as get_db."""
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+            await db.run_sync(RoutingSession.record_write_position)
+        except Exception:
+            await db.rollback()
+            raise
+
+
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """Unit of work for code outside a request, such as background jobs and the CLI."""
+    db = SessionLocal()
+    try:
+        yield db
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
@@ -0,0 +1,58 @@
+"""
+Hiding soft-deleted rows from ORM reads.
+
+Deleting a project stamps deleted_at on the project and its episodes;
+deleting an episode stamps just the episode. The rows stay in place until
+the background purger removes them in small batches. Every ORM select, sync
+or async, gets criteria that skip deleted projects and episodes and the
+stories, screenplays and scenes beneath deleted episodes, so repositories
+need no filters of their own.
+
+Pass the ``include_deleted`` execution option to see deleted rows. Raw SQL
+(``text()``) and Core table selects are not filtered.
+"""
+from sqlalchemy import event, select
+from sqlalchemy.orm import ORMExecuteState, Session, with_loader_criteria
+
+from app.models.episode import Episode
+from app.models.project import Project
+from app.models.screenplay import Scene, Screenplay
+from app.models.story import Story
+
+INCLUDE_DELETED = "include_deleted"
+
+
+# Subqueries use the tables rather than the mapped classes so the criteria aren't applied to them again
+_episodes = Episode.__table__
+_screenplays = Screenplay.__table__
+
+
+def _live_episode_ids():
+    return select(_episodes.c.id).where(_episodes.c.deleted_at.is_(None))
+
+
+def _live_screenplay_ids():
+    return (
+        select(_screenplays.c.id)
+        .join(_episodes, _episodes.c.id == _screenplays.c.episode_id)
+        .where(_episodes.c.deleted_at.is_(None))
+    )
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _exclude_deleted(execute_state: ORMExecuteState) -> None:
+    if (
+        not execute_state.is_select
+        or execute_state.is_column_load
+        or execute_state.is_relationship_load
+        or execute_state.execution_options.get(INCLUDE_DELETED, False)
+    ):
+        return
+    # Equality on the child's key lets Postgres turn each check into a primary key probe
+    execute_state.statement = execute_state.statement.options(
+        with_loader_criteria(Project, lambda cls: cls.deleted_at.is_(None), include_aliases=True),
+        with_loader_criteria(Episode, lambda cls: cls.deleted_at.is_(None), include_aliases=True),
+        with_loader_criteria(Story, lambda cls: cls.episode_id.in_(_live_episode_ids()), include_aliases=True),
+        with_loader_criteria(Screenplay, lambda cls: cls.episode_id.in_(_live_episode_ids()), include_aliases=True),
+        with_loader_criteria(Scene, lambda cls: cls.screenplay_id.in_(_live_screenplay_ids()), include_aliases=True),
+    )
@@ -0,0 +1,43 @@
+"""
+Per-request SQL statement counting.
+
+A counter is bound to the current request context by the HTTP middleware and
+every statement executed on an instrumented engine increments it, whichever
+session or thread issued it. The total is reported in the
+``X-DB-Statement-Count`` response header and the ``db_statements_per_request``
+metric so regressions such as N+1 queries show up per endpoint.
+"""
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+STATEMENT_COUNT_HEADER = "X-DB-Statement-Count"
+
+
+class StatementCounter:
+    """Mutable counter, so increments made in worker threads are seen by the request."""
+
+    def __init__(self):
+        self.count = 0
+
+
+_current_counter: ContextVar[Optional[StatementCounter]] = ContextVar("db_statement_counter", default=None)
+
+
+def start_counting() -> StatementCounter:
+    """Bind a fresh counter to the current context and return it."""
+    counter = StatementCounter()
+    _current_counter.set(counter)
+    return counter
+
+
+def count_statements(engine: Engine) -> None:
+    """Instrument an engine so its statements are added to the current counter."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.count += 1
@@ -1,18 +1,31 @@
 import logging
 import warnings
+from contextlib import asynccontextmanager
 
 # Suppress CUDA warnings when CUDA is not available (must be before any torch imports)
 warnings.filterwarnings("ignore", message=".*CUDA is not available.*")
 warnings.filterwarnings("ignore", message=".*User provided device_type of 'cuda'.*")
 warnings.filterwarnings("ignore", category=UserWarning, message=".*cuda.*")
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from app.core.config import settings
+from app.core.cache import CacheInvalidationListener
+from app.services.purger import purger
+from app.services.story_buffer import story_buffer
+from app.core.metrics import metrics
+from app.core.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
 from app.api.router import api_router
 from app.db import engine, Base
+from app.db.replica import READ_AFTER_COOKIE, READ_AFTER_HEADER, start_read_consistency
+from app.db.session import replica_engine, replica_monitor
+from app.db.statements import STATEMENT_COUNT_HEADER, start_counting
 from app.models.story import Story  # Import to register with Base
+from app.models.rate_limit import AIRateLimitBucket  # Import to register with Base
+from app.models.screenplay_batch import ScreenplayBatchJob  # Import to register with Base
 
 # Configure logging
 logging.basicConfig(
@@ -24,10 +37,40 @@ logging.basicConfig(
 # Create tables
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Drop cached reads when any worker writes; the listener needs its own libpq connection
+    listener = None
+    if settings.CACHE_ENABLED:
+        listener = CacheInvalidationListener(
+            engine.url.set(drivername="postgresql").render_as_string(hide_password=False)
+        )
+        listener.start()
+    if settings.STORY_WRITE_BEHIND:
+        story_buffer.start()
+    if settings.PURGE_ENABLED:
+        purger.start()
+    if replica_engine is not None:
+        replica_monitor.start(replica_engine)
+    yield
+    if replica_engine is not None:
+        await replica_monitor.stop()
+    if settings.PURGE_ENABLED:
+        await purger.stop()
+    if settings.STORY_WRITE_BEHIND:
+        # Persist buffered story edits before the worker exits
+        await story_buffer.stop()
+    if listener:
+        listener.stop()
+
+
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="Backend API for Yashvi Media Studio",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware
@@ -37,8 +80,42 @@ app.add_middleware(
     allow_credentials=False,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER, STATEMENT_COUNT_HEADER, READ_AFTER_HEADER],
 )
 
+# Compress large JSON bodies (screenplays with long dialogue) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+
+@app.middleware("http")
+async def count_db_statements(request: Request, call_next):
+    """Report how many SQL statements each request executed."""
+    counter = start_counting()
+    response = await call_next(request)
+    response.headers[STATEMENT_COUNT_HEADER] = str(counter.count)
+    metrics.observe("db_statements_per_request", counter.count)
+    return response
+
+
+# Seconds a client keeps its write position; far longer than the replica may lag before reads leave it
+READ_AFTER_MAX_AGE_SECONDS = 60
+
+
+@app.middleware("http")
+async def route_reads(request: Request, call_next):
+    """Let GET requests read from the replica once it has replayed the client's last write."""
+    consistency = start_read_consistency(
+        read_only=request.method in ("GET", "HEAD"),
+        read_after=request.headers.get(READ_AFTER_HEADER) or request.cookies.get(READ_AFTER_COOKIE),
+    )
+    response = await call_next(request)
+    if consistency.write_lsn:
+        response.headers[READ_AFTER_HEADER] = consistency.write_lsn
+        response.set_cookie(
+            READ_AFTER_COOKIE, consistency.write_lsn, max_age=READ_AFTER_MAX_AGE_SECONDS, httponly=True, samesite="lax"
+        )
+    return response
+
 # Include routers
 app.include_router(api_router)
 
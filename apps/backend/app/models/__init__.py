@@ -1,5 +1,5 @@
 from app.models.project import Project
-from app.models.screenplay import Screenplay, Scene
+from app.models.screenplay import Screenplay, Scene, SceneContent, SceneCharacter
 
-__all__ = ["Project", "Screenplay", "Scene"]
+__all__ = ["Project", "Screenplay", "Scene", "SceneContent", "SceneCharacter"]
 
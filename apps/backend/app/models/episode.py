@@ -1,27 +1,45 @@
-import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
-from app.models.project import Base
+from app.core.ids import uuid7
+from app.models.project import Base, UTC_NOW
 
 
 class Episode(Base):
     __tablename__ = "episodes"
+    __table_args__ = (
+        Index("ix_episodes_project_id_episode_number_id", "project_id", "episode_number", "id"),
+        # Deleted episodes waiting for the purger
+        Index("ix_episodes_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     project_id = Column(UUID(as_uuid=True), ForeignKey("projects.id", ondelete="CASCADE"), nullable=False)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     episode_number = Column(Integer, nullable=False)
     status = Column(String(50), default="draft")
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    # Pointer to the current screenplay so its scenes can be read in one indexed query
+    latest_screenplay_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("screenplays.id", ondelete="SET NULL", use_alter=True, name="fk_episodes_latest_screenplay_id"),
+        nullable=True
+    )
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
+    deleted_at = Column(DateTime, nullable=True)  # Set when the episode or its project is deleted
 
     project = relationship("Project", back_populates="episodes")
-    story = relationship("Story", back_populates="episode", uselist=False, cascade="all, delete-orphan")
-    screenplays = relationship("Screenplay", back_populates="episode", cascade="all, delete-orphan")
+    story = relationship("Story", back_populates="episode", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    screenplays = relationship(
+        "Screenplay",
+        back_populates="episode",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        foreign_keys="Screenplay.episode_id"
+    )
 
     def __repr__(self):
         return f"<Episode {self.episode_number}: {self.title}>"
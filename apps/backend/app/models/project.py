@@ -1,23 +1,35 @@
-import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, Text, DateTime
+from sqlalchemy import Column, String, Text, DateTime, Index, FetchedValue, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import declarative_base, relationship
 
+from app.core.ids import uuid7
+
 Base = declarative_base()
 
+# Server-side timestamp default. updated_at is maintained by the set_updated_at trigger,
+# and models set eager_defaults so both are read back with RETURNING instead of a refresh.
+UTC_NOW = text("timezone('utc', now())")
+
 
 class Project(Base):
     __tablename__ = "projects"
+    __table_args__ = (
+        Index("ix_projects_created_at_id", "created_at", "id"),
+        # Deleted projects waiting for the purger
+        Index("ix_projects_deleted_at", "deleted_at", postgresql_where=text("deleted_at IS NOT NULL")),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text, nullable=True)
     status = Column(String(50), default="draft", index=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
+    deleted_at = Column(DateTime, nullable=True)  # Set on delete; the purger removes the rows later
 
-    episodes = relationship("Episode", back_populates="project", cascade="all, delete-orphan")
+    # Children are removed by the ON DELETE CASCADE foreign keys, not loaded and deleted by the ORM
+    episodes = relationship("Episode", back_populates="project", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Project {self.name}>"
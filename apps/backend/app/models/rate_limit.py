@@ -0,0 +1,16 @@
+from sqlalchemy import Column, String, Float
+
+from app.models.project import Base
+
+
+class AIRateLimitBucket(Base):
+    """Token-bucket state for an AI model, shared by every worker process."""
+    __tablename__ = "ai_rate_limit_buckets"
+
+    model = Column(String(100), primary_key=True)
+    request_tokens = Column(Float, nullable=False)  # Requests currently available
+    token_tokens = Column(Float, nullable=False)  # Model tokens currently available
+    updated_at = Column(Float, nullable=False)  # Database clock (epoch seconds) of the last refill
+
+    def __repr__(self):
+        return f"<AIRateLimitBucket {self.model}>"
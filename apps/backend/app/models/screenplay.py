@@ -1,46 +1,139 @@
-import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSON
+import hashlib
+import json
+from typing import Any, Dict, Mapping
+
+from sqlalchemy import Column, Computed, String, Integer, Text, DateTime, ForeignKey, Index, FetchedValue
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import relationship
 
-from app.models.project import Base
+from app.core.ids import uuid7
+from app.models.project import Base, UTC_NOW
 
 
 class Screenplay(Base):
     __tablename__ = "screenplays"
+    __table_args__ = (
+        Index("ix_screenplays_episode_id_created_at_id", "episode_id", "created_at", "id"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     episode_id = Column(UUID(as_uuid=True), ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False)
     ai_model = Column(String(100), nullable=True)  # AI model used for generation
     generation_time_seconds = Column(Integer, nullable=True)  # Time taken to generate in seconds
     scene_count = Column(Integer, nullable=True)  # Number of scenes generated
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
-    episode = relationship("Episode", back_populates="screenplays")
-    scenes = relationship("Scene", back_populates="screenplay", cascade="all, delete-orphan")
+    episode = relationship("Episode", back_populates="screenplays", foreign_keys=[episode_id])
+    scenes = relationship("Scene", back_populates="screenplay", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Screenplay for episode {self.episode_id}>"
 
 
+# Fields that make up a scene's body; scenes with equal bodies share one scene_contents row
+SCENE_CONTENT_FIELDS = ("title", "duration_seconds", "characters", "dialogue", "prompt")
+
+
+def scene_content_hash(values: Mapping[str, Any]) -> str:
+    """SHA-256 of a scene body's canonical JSON encoding, as hex."""
+    body = [values[field] for field in SCENE_CONTENT_FIELDS]
+    encoded = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def scene_character_line_counts(values: Mapping[str, Any]) -> Dict[str, int]:
+    """Dialogue line count of every character listed in or speaking in a scene body."""
+    counts = {name: 0 for name in values["characters"] if name}
+    for line in values["dialogue"]:
+        name = line.get("character")
+        if name:
+            counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+class SceneContent(Base):
+    """Immutable scene body, stored once and referenced by every identical scene."""
+    __tablename__ = "scene_contents"
+    # Search columns are only read through the table, never loaded onto instances
+    __mapper_args__ = {"exclude_properties": ["search_text", "search_vector"]}
+    __table_args__ = (
+        # Containment queries such as characters @> '["Raju"]' or dialogue @> '[{"character": "Raju"}]'
+        Index("ix_scene_contents_characters", "characters", postgresql_using="gin", postgresql_ops={"characters": "jsonb_path_ops"}),
+        Index("ix_scene_contents_dialogue", "dialogue", postgresql_using="gin", postgresql_ops={"dialogue": "jsonb_path_ops"}),
+        Index("ix_scene_contents_search_vector", "search_vector", postgresql_using="gin"),
+        # ix_scene_contents_search_text_trgm needs pg_trgm, so it is created in app.db.ddl
+    )
+
+    content_hash = Column(String(64), primary_key=True)  # scene_content_hash of the fields below
+    title = Column(String(255), nullable=False)
+    duration_seconds = Column(Integer, nullable=False)  # Estimated scene duration in seconds
+    characters = Column(JSONB, nullable=False)  # Array of character names
+    dialogue = Column(JSONB, nullable=False)  # Array of {character, line} objects
+    prompt = Column(Text, nullable=False)  # Video generation prompt (combines action and visual elements)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    # Title, prompt and dialogue lines as one string, for substring search and result snippets
+    search_text = Column(
+        Text,
+        Computed("title || ' ' || prompt || ' ' || jsonb_path_query_array(dialogue, '$[*].line')::text", persisted=True)
+    )
+    # Weighted title (A), dialogue lines (B) and prompt (C), each as English stems and unstemmed words
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "setweight(to_tsvector('english'::regconfig, title) || to_tsvector('simple'::regconfig, title), 'A') || "
+            "setweight(to_tsvector('english'::regconfig, jsonb_path_query_array(dialogue, '$[*].line')) || "
+            "to_tsvector('simple'::regconfig, jsonb_path_query_array(dialogue, '$[*].line')), 'B') || "
+            "setweight(to_tsvector('english'::regconfig, prompt) || to_tsvector('simple'::regconfig, prompt), 'C')",
+            persisted=True
+        )
+    )
+
+    def __repr__(self):
+        return f"<SceneContent {self.content_hash[:12]}: {self.title}>"
+
+
+class SceneCharacter(Base):
+    """A character appearing in a scene body, written together with the body."""
+    __tablename__ = "scene_characters"
+    __table_args__ = (
+        Index("ix_scene_characters_name_content_hash", "name", "content_hash"),
+    )
+
+    content_hash = Column(String(64), ForeignKey("scene_contents.content_hash", ondelete="CASCADE"), primary_key=True)
+    name = Column(Text, primary_key=True)
+    line_count = Column(Integer, nullable=False)  # Dialogue lines spoken by the character in the scene
+
+    def __repr__(self):
+        return f"<SceneCharacter {self.name} in {self.content_hash[:12]}>"
+
+
 class Scene(Base):
     __tablename__ = "scenes"
+    __table_args__ = (
+        Index("ix_scenes_screenplay_id_scene_number", "screenplay_id", "scene_number"),
+        Index("ix_scenes_content_hash", "content_hash"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     screenplay_id = Column(UUID(as_uuid=True), ForeignKey("screenplays.id", ondelete="CASCADE"), nullable=False)
     scene_number = Column(Integer, nullable=False)
-    title = Column(String(255), nullable=False)
-    duration_seconds = Column(Integer, nullable=False)  # Estimated scene duration in seconds
-    characters = Column(JSON, nullable=False)  # Array of character names
-    dialogue = Column(JSON, nullable=False)  # Array of {character, line} objects
-    prompt = Column(Text, nullable=False)  # Video generation prompt (combines action and visual elements)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    content_hash = Column(String(64), ForeignKey("scene_contents.content_hash"), nullable=False)
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
 
     screenplay = relationship("Screenplay", back_populates="scenes")
+    # Loaded in the same query as the scene; contents are shared, so never modify them in place
+    content = relationship("SceneContent", lazy="joined", innerjoin=True)
+
+    title = association_proxy("content", "title")
+    duration_seconds = association_proxy("content", "duration_seconds")
+    characters = association_proxy("content", "characters")
+    dialogue = association_proxy("content", "dialogue")
+    prompt = association_proxy("content", "prompt")
 
     def __repr__(self):
         return f"<Scene {self.scene_number}: {self.title}>"
-
@@ -0,0 +1,53 @@
+from sqlalchemy import Column, String, Integer, Text, DateTime, ForeignKey, Index, text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from app.core.ids import uuid7
+from app.models.project import Base, UTC_NOW
+
+
+class ScreenplayBatchJob(Base):
+    """Screenplay generation scheduled for many episodes, visible to every worker."""
+    __tablename__ = "screenplay_batch_jobs"
+    __table_args__ = (
+        # Unfinished jobs a runner may pick up, and finished jobs past their retention period
+        Index("ix_screenplay_batch_jobs_unfinished", "lease_expires_at", postgresql_where=text("finished_at IS NULL")),
+        Index("ix_screenplay_batch_jobs_finished_at", "finished_at", postgresql_where=text("finished_at IS NOT NULL")),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    mode = Column(String(20), nullable=False)  # online or offline
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, submitted, completed, failed
+    provider_batch_id = Column(String(255), nullable=True)  # Where an offline job's results are collected from
+    lease_expires_at = Column(DateTime, nullable=True)  # Until when a runner owns the job; after that it may be resumed
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    finished_at = Column(DateTime, nullable=True)
+
+    episodes = relationship(
+        "ScreenplayBatchEpisode",
+        order_by="ScreenplayBatchEpisode.position",
+        lazy="selectin",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
+
+    def __repr__(self):
+        return f"<ScreenplayBatchJob {self.id}: {self.status}>"
+
+
+class ScreenplayBatchEpisode(Base):
+    """Progress of one episode in a batch job."""
+    __tablename__ = "screenplay_batch_episodes"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("screenplay_batch_jobs.id", ondelete="CASCADE"), primary_key=True)
+    # Plain references: job history is kept only for its retention period and must not slow down purges
+    episode_id = Column(UUID(as_uuid=True), primary_key=True)
+    position = Column(Integer, nullable=False)  # Order within the job
+    status = Column(String(20), nullable=False, default="pending")  # pending, running, completed, failed, skipped
+    screenplay_id = Column(UUID(as_uuid=True), nullable=True)  # The screenplay generated for the episode
+    scene_count = Column(Integer, nullable=True)
+    error = Column(Text, nullable=True)
+
+    def __repr__(self):
+        return f"<ScreenplayBatchEpisode {self.episode_id} in {self.job_id}: {self.status}>"
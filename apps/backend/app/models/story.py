@@ -1,23 +1,80 @@
-import uuid
-from datetime import datetime, timezone
-from sqlalchemy import Column, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import (
+    Column,
+    Computed,
+    String,
+    Integer,
+    Text,
+    DateTime,
+    LargeBinary,
+    ForeignKey,
+    Index,
+    UniqueConstraint,
+    FetchedValue,
+    text,
+)
+from sqlalchemy.dialects.postgresql import UUID, TSVECTOR
 from sqlalchemy.orm import relationship
 
-from app.models.project import Base
+from app.core.ids import uuid7
+from app.models.project import Base, UTC_NOW
 
 
 class Story(Base):
     __tablename__ = "stories"
+    __table_args__ = (
+        Index("ix_stories_search_vector", "search_vector", postgresql_using="gin"),
+        # ix_stories_content_trgm (substring search) needs pg_trgm, so it is created in app.db.ddl
+    )
+    # search_vector stays table-only so saves don't return it with the other server-generated values
+    __mapper_args__ = {"eager_defaults": True, "exclude_properties": ["search_vector"]}
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
     episode_id = Column(UUID(as_uuid=True), ForeignKey("episodes.id", ondelete="CASCADE"), nullable=False, unique=True)
-    content = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    content = Column(Text, nullable=True)  # Latest revision, materialized for reads
+    revision = Column(Integer, nullable=False, default=0, server_default=text("0"))  # Latest revision number
+    created_at = Column(DateTime, server_default=UTC_NOW)
+    updated_at = Column(DateTime, server_default=UTC_NOW, server_onupdate=FetchedValue())
+    # English stems plus unstemmed words, so Malayalam and exact English forms both match
+    search_vector = Column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english'::regconfig, coalesce(content, '')) || "
+            "to_tsvector('simple'::regconfig, coalesce(content, ''))",
+            persisted=True
+        )
+    )
 
     episode = relationship("Episode", back_populates="story")
+    revisions = relationship("StoryRevision", back_populates="story", cascade="all, delete-orphan", passive_deletes=True)
 
     def __repr__(self):
         return f"<Story for episode {self.episode_id}>"
 
+
+class StoryRevision(Base):
+    """
+    One saved revision of a story's content.
+    
+    Every STORY_SNAPSHOT_INTERVAL-th revision is a zlib-compressed full
+    snapshot; the others are compressed edit deltas against the previous
+    revision, so a revision is rebuilt from its nearest snapshot.
+    """
+    __tablename__ = "story_revisions"
+    __table_args__ = (
+        UniqueConstraint("story_id", "revision", name="uq_story_revisions_story_id_revision"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7)
+    story_id = Column(UUID(as_uuid=True), ForeignKey("stories.id", ondelete="CASCADE"), nullable=False)
+    revision = Column(Integer, nullable=False)
+    kind = Column(String(20), nullable=False)  # snapshot or delta
+    data = Column(LargeBinary, nullable=False)  # zlib-compressed text (snapshot) or edit operations (delta)
+    content_length = Column(Integer, nullable=False)  # Characters in the story at this revision
+    created_at = Column(DateTime, server_default=UTC_NOW)
+
+    story = relationship("Story", back_populates="revisions")
+
+    def __repr__(self):
+        return f"<StoryRevision {self.revision} ({self.kind}) for story {self.story_id}>"
+
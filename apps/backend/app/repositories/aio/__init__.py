@@ -0,0 +1,13 @@
+from app.repositories.aio.project import AsyncProjectRepository
+from app.repositories.aio.episode import AsyncEpisodeRepository
+from app.repositories.aio.story import AsyncStoryRepository
+from app.repositories.aio.screenplay import AsyncScreenplayRepository
+from app.repositories.aio.scene import AsyncSceneRepository
+
+__all__ = [
+    "AsyncProjectRepository",
+    "AsyncEpisodeRepository",
+    "AsyncStoryRepository",
+    "AsyncScreenplayRepository",
+    "AsyncSceneRepository",
+]
@@ -0,0 +1,76 @@
+from sqlalchemy import select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.project import UTC_NOW
+from app.schemas.episode import EpisodeCreate, EpisodeUpdate
+
+
+class AsyncEpisodeRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @replica_read
+    async def get_page_by_project(
+        self,
+        project_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[Episode]:
+        """Get a page of a project's episodes ordered by episode number, continuing after the given cursor."""
+        after = decode_cursor(cursor, int, UUID) if cursor else None
+        result = await self.db.execute(
+            keyset_query(
+                select(Episode).where(Episode.project_id == project_id),
+                (Episode.episode_number, Episode.id),
+                after,
+                limit
+            )
+        )
+        total = None
+        if include_total:
+            total = await self.db.scalar(
+                select(func.count()).select_from(Episode).where(Episode.project_id == project_id)
+            )
+        return build_page(list(result.scalars().all()), limit, lambda e: (e.episode_number, e.id), total)
+
+    @replica_read
+    async def get_by_id(self, episode_id: UUID) -> Optional[Episode]:
+        result = await self.db.execute(
+            select(Episode).where(Episode.id == episode_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, episode_data: EpisodeCreate) -> Episode:
+        episode = Episode(**episode_data.model_dump())
+        self.db.add(episode)
+        await self.db.flush()
+        return episode
+
+    async def update(self, episode_id: UUID, episode_data: EpisodeUpdate) -> Optional[Episode]:
+        episode = await self.get_by_id(episode_id)
+        if not episode:
+            return None
+        
+        update_data = episode_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(episode, field, value)
+        
+        await self.db.flush()
+        return episode
+
+    async def delete(self, episode_id: UUID) -> bool:
+        """Soft-delete an episode; the purger removes it with its story, screenplays and scenes later."""
+        result = await self.db.execute(
+            update(Episode)
+            .where(Episode.id == episode_id, Episode.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Episode.id)
+        )
+        deleted = result.first() is not None
+        return deleted
@@ -0,0 +1,73 @@
+from datetime import datetime
+from uuid import UUID
+from typing import List, Optional
+from sqlalchemy import select, func, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.project import Project, UTC_NOW
+from app.schemas.project import ProjectCreate, ProjectUpdate
+
+
+class AsyncProjectRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @replica_read
+    async def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[Project]:
+        """Get a page of projects, newest first, continuing after the given cursor."""
+        after = decode_cursor(cursor, datetime.fromisoformat, UUID) if cursor else None
+        result = await self.db.execute(
+            keyset_query(select(Project), (Project.created_at, Project.id), after, limit, descending=True)
+        )
+        total = await self.db.scalar(select(func.count()).select_from(Project)) if include_total else None
+        return build_page(list(result.scalars().all()), limit, lambda p: (p.created_at, p.id), total)
+
+    @replica_read
+    async def get_by_id(self, project_id: UUID) -> Optional[Project]:
+        result = await self.db.execute(
+            select(Project).where(Project.id == project_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, project_data: ProjectCreate) -> Project:
+        project = Project(**project_data.model_dump())
+        self.db.add(project)
+        await self.db.flush()
+        return project
+
+    async def update(self, project_id: UUID, project_data: ProjectUpdate) -> Optional[Project]:
+        project = await self.get_by_id(project_id)
+        if not project:
+            return None
+        
+        update_data = project_data.model_dump(exclude_unset=True)
+        for key, value in update_data.items():
+            setattr(project, key, value)
+        
+        await self.db.flush()
+        return project
+
+    async def delete(self, project_id: UUID) -> Optional[List[UUID]]:
+        """Soft-delete a project and its episodes; returns the episode ids, or None if the project does not exist."""
+        result = await self.db.execute(
+            update(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Project.id)
+        )
+        if result.first() is None:
+            return None
+        result = await self.db.execute(
+            update(Episode)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Episode.id)
+        )
+        return list(result.scalars().all())
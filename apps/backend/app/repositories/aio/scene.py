@@ -0,0 +1,176 @@
+from sqlalchemy import select, insert, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Dict, Mapping, Optional, List, Sequence
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.models.episode import Episode
+from app.models.screenplay import (
+    Screenplay,
+    Scene,
+    SceneContent,
+    SceneCharacter,
+    SCENE_CONTENT_FIELDS,
+    scene_content_hash,
+    scene_character_line_counts,
+)
+from app.schemas.screenplay import SceneCreate, SceneBase
+
+
+class AsyncSceneRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @replica_read
+    async def get_by_screenplay_id(self, screenplay_id: UUID) -> List[Scene]:
+        result = await self.db.execute(
+            select(Scene).where(Scene.screenplay_id == screenplay_id).order_by(Scene.scene_number)
+        )
+        return list(result.scalars().all())
+
+    @replica_read
+    async def get_outline_by_screenplay_id(self, screenplay_id: UUID) -> List[Row]:
+        """Get (scene_number, content_hash, title) of a screenplay's scenes, without their bodies."""
+        result = await self.db.execute(
+            select(Scene.scene_number, Scene.content_hash, SceneContent.title)
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .where(Scene.screenplay_id == screenplay_id)
+            .order_by(Scene.scene_number)
+        )
+        return list(result.all())
+
+    @staticmethod
+    def _latest_screenplay_id(episode_id: UUID):
+        """
+        Subquery for an episode's latest screenplay id.
+        
+        Follows episodes.latest_screenplay_id, falling back to the newest
+        screenplay by created_at when the pointer is not set.
+        """
+        latest_by_date = (
+            select(Screenplay.id)
+            .where(Screenplay.episode_id == Episode.id)
+            .order_by(Screenplay.created_at.desc())
+            .limit(1)
+            .correlate(Episode)
+            .scalar_subquery()
+        )
+        return (
+            select(func.coalesce(Episode.latest_screenplay_id, latest_by_date))
+            .where(Episode.id == episode_id)
+            .scalar_subquery()
+        )
+
+    async def get_latest_by_episode_id(self, episode_id: UUID) -> List[Scene]:
+        """Get the scenes of an episode's latest screenplay in a single query."""
+        result = await self.db.execute(
+            select(Scene)
+            .where(Scene.screenplay_id == self._latest_screenplay_id(episode_id))
+            .order_by(Scene.scene_number)
+        )
+        return list(result.scalars().all())
+
+    async def get_latest_versions_by_episode_id(self, episode_id: UUID) -> List[Row]:
+        """Get only (id, updated_at) of the latest screenplay's scenes, without their content."""
+        result = await self.db.execute(
+            select(Scene.id, Scene.updated_at)
+            .where(Scene.screenplay_id == self._latest_screenplay_id(episode_id))
+            .order_by(Scene.scene_number)
+        )
+        return list(result.all())
+
+    @replica_read
+    async def get_by_id(self, scene_id: UUID) -> Optional[Scene]:
+        result = await self.db.execute(
+            select(Scene).where(Scene.id == scene_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, scene_data: SceneCreate) -> Scene:
+        return (await self.insert_rows([scene_data.model_dump()]))[0]
+
+    async def create_batch(self, scenes_data: List[SceneCreate]) -> List[Scene]:
+        """Bulk insert scenes, possibly for several screenplays."""
+        return await self.insert_rows([scene_data.model_dump() for scene_data in scenes_data])
+
+    async def save_contents(self, scenes: Sequence[Mapping[str, Any]]) -> List[str]:
+        """Store the bodies of the given scenes if new and return their content hashes in input order."""
+        hashes = [scene_content_hash(scene) for scene in scenes]
+        contents = {
+            content_hash: {"content_hash": content_hash, **{field: scene[field] for field in SCENE_CONTENT_FIELDS}}
+            for content_hash, scene in zip(hashes, scenes)
+        }
+        if contents:
+            characters = []
+            pending = sorted(contents)
+            while pending:
+                result = await self.db.execute(
+                    pg_insert(SceneContent.__table__)
+                    .on_conflict_do_nothing(index_elements=["content_hash"])
+                    .returning(SceneContent.content_hash),
+                    [contents[content_hash] for content_hash in pending]
+                )
+                inserted = set(result.scalars().all())
+                characters += [
+                    {"content_hash": content_hash, "name": name, "line_count": line_count}
+                    for content_hash in sorted(inserted)
+                    for name, line_count in scene_character_line_counts(contents[content_hash]).items()
+                ]
+                existing = [content_hash for content_hash in pending if content_hash not in inserted]
+                if not existing:
+                    break
+                # Keep orphan cleanup off bodies that were already stored (see SceneRepository.save_contents)
+                locked = await self.db.execute(
+                    select(SceneContent.content_hash)
+                    .where(SceneContent.content_hash.in_(existing))
+                    .with_for_update(key_share=True)
+                )
+                locked = set(locked.scalars().all())
+                pending = [content_hash for content_hash in existing if content_hash not in locked]
+            if characters:
+                await self.db.execute(insert(SceneCharacter.__table__), characters)
+        return hashes
+
+    async def insert_rows(self, rows: Sequence[Dict[str, Any]]) -> List[Scene]:
+        """Bulk insert scenes given as dicts of screenplay_id, scene_number and the content fields."""
+        if not rows:
+            return []
+        hashes = await self.save_contents(rows)
+        result = await self.db.execute(
+            insert(Scene.__table__).returning(Scene.id, sort_by_parameter_order=True),
+            [
+                {"screenplay_id": row["screenplay_id"], "scene_number": row["scene_number"], "content_hash": content_hash}
+                for row, content_hash in zip(rows, hashes)
+            ]
+        )
+        scene_ids = list(result.scalars().all())
+        loaded = await self.db.execute(select(Scene).where(Scene.id.in_(scene_ids)))
+        scenes = {scene.id: scene for scene in loaded.scalars()}
+        return [scenes[scene_id] for scene_id in scene_ids]
+
+    async def update(self, scene_id: UUID, scene_data: SceneBase) -> Optional[Scene]:
+        scene = await self.get_by_id(scene_id)
+        if not scene:
+            return None
+        
+        update_data = scene_data.model_dump(exclude_unset=True)
+        if "scene_number" in update_data:
+            scene.scene_number = update_data.pop("scene_number")
+        if update_data:
+            # Contents are shared between versions, so point the scene at the edited body instead
+            body = {field: getattr(scene, field) for field in SCENE_CONTENT_FIELDS}
+            body.update(update_data)
+            content_hash, = await self.save_contents([body])
+            scene.content = await self.db.get(SceneContent, content_hash)
+        
+        await self.db.flush()
+        return scene
+
+    async def delete(self, scene_id: UUID) -> bool:
+        result = await self.db.execute(
+            delete(Scene).where(Scene.id == scene_id).returning(Scene.id)
+        )
+        deleted = result.first() is not None
+        return deleted
@@ -0,0 +1,131 @@
+from sqlalchemy import select, func, insert, update, delete
+from sqlalchemy.engine import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime
+from typing import Optional, List, Tuple
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.screenplay import Screenplay, Scene
+from app.repositories.aio.scene import AsyncSceneRepository
+from app.schemas.screenplay import ScreenplayCreate, ScreenplayBase, SceneBase
+
+
+class AsyncScreenplayRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    @replica_read
+    async def get_by_episode_id(self, episode_id: UUID) -> Optional[Screenplay]:
+        """Get the latest screenplay for an episode (most recently created)."""
+        result = await self.db.execute(
+            select(Screenplay)
+            .where(Screenplay.episode_id == episode_id)
+            .order_by(Screenplay.created_at.desc())
+            .limit(1)
+        )
+        return result.scalar_one_or_none()
+    
+    @replica_read
+    async def get_page_by_episode_id(
+        self,
+        episode_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[Screenplay]:
+        """Get a page of an episode's screenplays, newest first, continuing after the given cursor."""
+        after = decode_cursor(cursor, datetime.fromisoformat, UUID) if cursor else None
+        result = await self.db.execute(
+            keyset_query(
+                select(Screenplay).where(Screenplay.episode_id == episode_id),
+                (Screenplay.created_at, Screenplay.id),
+                after,
+                limit,
+                descending=True
+            )
+        )
+        total = None
+        if include_total:
+            total = await self.db.scalar(
+                select(func.count()).select_from(Screenplay).where(Screenplay.episode_id == episode_id)
+            )
+        return build_page(list(result.scalars().all()), limit, lambda s: (s.created_at, s.id), total)
+    
+    @replica_read
+    async def get_by_id(self, screenplay_id: UUID) -> Optional[Screenplay]:
+        """Get a screenplay by its ID."""
+        result = await self.db.execute(
+            select(Screenplay).where(Screenplay.id == screenplay_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, screenplay_data: ScreenplayCreate) -> Screenplay:
+        screenplay = Screenplay(**screenplay_data.model_dump())
+        self.db.add(screenplay)
+        await self.db.flush()
+        return screenplay
+
+    async def create_with_scenes(
+        self,
+        screenplay_data: ScreenplayCreate,
+        scenes_data: List[SceneBase]
+    ) -> Tuple[Row, List[Scene]]:
+        """
+        Insert a screenplay and all of its scenes in one transaction and make
+        it the episode's latest screenplay.
+        
+        Scene bodies already stored by an earlier version are shared rather than
+        copied. A generation costs a constant number of round trips regardless
+        of scene count.
+        """
+        screenplay_table = Screenplay.__table__
+        
+        screenplay = (await self.db.execute(
+            insert(screenplay_table)
+            .values(**screenplay_data.model_dump())
+            .returning(*screenplay_table.c)
+        )).one()
+        
+        scenes = await AsyncSceneRepository(self.db).insert_rows(
+            [{**scene_data.model_dump(), "screenplay_id": screenplay.id} for scene_data in scenes_data]
+        )
+        
+        # Point the episode at its new current screenplay
+        await self.db.execute(
+            update(Episode)
+            .where(Episode.id == screenplay.episode_id)
+            .values(latest_screenplay_id=screenplay.id)
+        )
+        return screenplay, scenes
+
+    async def update(self, screenplay_id: UUID, screenplay_data: ScreenplayBase) -> Optional[Screenplay]:
+        """Update a screenplay by its ID."""
+        screenplay = await self.get_by_id(screenplay_id)
+        if not screenplay:
+            return None
+        
+        update_data = screenplay_data.model_dump(exclude_unset=True)
+        for field, value in update_data.items():
+            setattr(screenplay, field, value)
+        
+        await self.db.flush()
+        return screenplay
+
+    async def delete(self, screenplay_id: UUID) -> bool:
+        """Delete a screenplay by its ID."""
+        result = await self.db.execute(
+            delete(Screenplay).where(Screenplay.id == screenplay_id).returning(Screenplay.id)
+        )
+        deleted = result.first() is not None
+        return deleted
+
+    async def delete_all_by_episode_id(self, episode_id: UUID) -> int:
+        """Delete all screenplays for an episode. Returns the number of deleted screenplays."""
+        result = await self.db.execute(
+            delete(Screenplay).where(Screenplay.episode_id == episode_id).returning(Screenplay.id)
+        )
+        count = len(result.all())
+        return count
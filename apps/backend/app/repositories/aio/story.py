@@ -0,0 +1,53 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+from uuid import UUID
+
+from app.models.story import Story, StoryRevision
+from app.schemas.story import StoryCreate
+
+
+class AsyncStoryRepository:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_episode_id(self, episode_id: UUID) -> Optional[Story]:
+        result = await self.db.execute(
+            select(Story).where(Story.episode_id == episode_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def create(self, story_data: StoryCreate) -> Story:
+        story = Story(**story_data.model_dump())
+        self.db.add(story)
+        await self.db.flush()
+        return story
+
+    async def get_by_episode_id_for_update(self, episode_id: UUID) -> Optional[Story]:
+        """Get a story and lock its row so concurrent saves get consecutive revision numbers."""
+        result = await self.db.execute(
+            select(Story).where(Story.episode_id == episode_id).with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def save_revision(
+        self,
+        story: Story,
+        content: Optional[str],
+        kind: str,
+        data: bytes,
+        revision: Optional[int] = None
+    ) -> Story:
+        """Record a revision (by default the next one) of a story and materialize its content."""
+        revision = revision if revision is not None else story.revision + 1
+        self.db.add(StoryRevision(
+            story_id=story.id,
+            revision=revision,
+            kind=kind,
+            data=data,
+            content_length=len(content or "")
+        ))
+        story.content = content
+        story.revision = revision
+        await self.db.flush()
+        return story
@@ -0,0 +1,92 @@
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, column, true
+from typing import List
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.models.episode import Episode
+from app.models.screenplay import Scene, SceneContent, SceneCharacter
+
+
+class CharacterRepository:
+    """
+    Character lookups over the scenes of each episode's latest screenplay.
+    
+    Characters are indexed per scene body in scene_characters, so lookups join
+    index ranges instead of reading and scanning every scene's JSON.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @replica_read
+    def get_appearances(self, project_id: UUID, name: str) -> List[Row]:
+        """Get every scene of a project's current screenplays that features a character."""
+        result = self.db.execute(
+            select(
+                Episode.id.label("episode_id"),
+                Episode.episode_number,
+                Episode.title.label("episode_title"),
+                Scene.id.label("scene_id"),
+                Scene.scene_number,
+                SceneContent.title,
+                SceneCharacter.line_count
+            )
+            .join(Scene, Scene.screenplay_id == Episode.latest_screenplay_id)
+            .join(SceneCharacter, SceneCharacter.content_hash == Scene.content_hash)
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .where(Episode.project_id == project_id, SceneCharacter.name == name)
+            .order_by(Episode.episode_number, Episode.id, Scene.scene_number)
+        )
+        return list(result.all())
+
+    @replica_read
+    def get_lines(self, project_id: UUID, name: str) -> List[Row]:
+        """Get every line a character speaks in a project's current screenplays, in script order."""
+        line = (
+            func.jsonb_array_elements(SceneContent.dialogue)
+            .table_valued(column("value", JSONB), with_ordinality="position")
+            .render_derived()
+            .lateral("line")
+        )
+        result = self.db.execute(
+            select(
+                Episode.id.label("episode_id"),
+                Episode.episode_number,
+                Scene.id.label("scene_id"),
+                Scene.scene_number,
+                line.c.value["line"].astext.label("line")
+            )
+            .join(Scene, Scene.screenplay_id == Episode.latest_screenplay_id)
+            .join(SceneCharacter, SceneCharacter.content_hash == Scene.content_hash)
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .join(line, true())
+            .where(
+                Episode.project_id == project_id,
+                SceneCharacter.name == name,
+                SceneCharacter.line_count > 0,
+                line.c.value["character"].astext == name
+            )
+            .order_by(Episode.episode_number, Episode.id, Scene.scene_number, line.c.position)
+        )
+        return list(result.all())
+
+    @replica_read
+    def get_episode_characters(self, episode_id: UUID) -> List[Row]:
+        """Get each character of an episode's latest screenplay with its scene and line counts, most lines first."""
+        line_count = func.sum(SceneCharacter.line_count)
+        result = self.db.execute(
+            select(
+                SceneCharacter.name,
+                func.count().label("scene_count"),
+                line_count.label("line_count")
+            )
+            .join(Scene, Scene.content_hash == SceneCharacter.content_hash)
+            .join(Episode, Episode.latest_screenplay_id == Scene.screenplay_id)
+            .where(Episode.id == episode_id)
+            .group_by(SceneCharacter.name)
+            .order_by(line_count.desc(), SceneCharacter.name)
+        )
+        return list(result.all())
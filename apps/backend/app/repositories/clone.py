@@ -0,0 +1,159 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func, text
+from typing import Optional
+from uuid import UUID
+
+from app.core.ids import uuid7
+from app.models.project import Project
+from app.models.episode import Episode
+
+# Old to new id of every row copied by the current clone; ids are unique across tables
+_CREATE_CLONE_IDS = """
+    CREATE TEMP TABLE IF NOT EXISTS clone_ids (old_id uuid PRIMARY KEY, new_id uuid NOT NULL) ON COMMIT DROP;
+    TRUNCATE clone_ids
+"""
+
+_CLONE_PROJECT = """
+    INSERT INTO projects (id, name, description, status)
+    SELECT :project_id, coalesce(:name, name || ' (copy)'), description, status
+    FROM projects
+    WHERE id = :source_id AND deleted_at IS NULL
+    RETURNING id
+"""
+
+# {scope} is "project_id" to copy every episode of a project, or "id" for a single episode
+_CLONE_EPISODES = """
+    WITH ids AS (
+        INSERT INTO clone_ids (old_id, new_id)
+        SELECT id, uuid_generate_v7() FROM episodes WHERE {scope} = :source_id AND deleted_at IS NULL
+        RETURNING old_id, new_id
+    )
+    INSERT INTO episodes (id, project_id, title, description, episode_number, status)
+    SELECT ids.new_id, :project_id, coalesce(:title, e.title), e.description,
+           coalesce(:episode_number, e.episode_number), e.status
+    FROM episodes e
+    JOIN ids ON ids.old_id = e.id
+"""
+
+_CLONE_STORIES = """
+    WITH ids AS (
+        INSERT INTO clone_ids (old_id, new_id)
+        SELECT s.id, uuid_generate_v7() FROM stories s JOIN clone_ids e ON e.old_id = s.episode_id
+        RETURNING old_id, new_id
+    )
+    INSERT INTO stories (id, episode_id, content, revision, created_at, updated_at)
+    SELECT ids.new_id, e.new_id, s.content, s.revision, s.created_at, s.updated_at
+    FROM stories s
+    JOIN ids ON ids.old_id = s.id
+    JOIN clone_ids e ON e.old_id = s.episode_id
+"""
+
+_CLONE_STORY_REVISIONS = """
+    INSERT INTO story_revisions (id, story_id, revision, kind, data, content_length, created_at)
+    SELECT uuid_generate_v7(), s.new_id, r.revision, r.kind, r.data, r.content_length, r.created_at
+    FROM story_revisions r
+    JOIN clone_ids s ON s.old_id = r.story_id
+"""
+
+_CLONE_SCREENPLAYS = """
+    WITH ids AS (
+        INSERT INTO clone_ids (old_id, new_id)
+        SELECT sp.id, uuid_generate_v7() FROM screenplays sp JOIN clone_ids e ON e.old_id = sp.episode_id
+        RETURNING old_id, new_id
+    )
+    INSERT INTO screenplays (id, episode_id, ai_model, generation_time_seconds, scene_count, created_at, updated_at)
+    SELECT ids.new_id, e.new_id, sp.ai_model, sp.generation_time_seconds, sp.scene_count, sp.created_at, sp.updated_at
+    FROM screenplays sp
+    JOIN ids ON ids.old_id = sp.id
+    JOIN clone_ids e ON e.old_id = sp.episode_id
+"""
+
+# Scene bodies are shared by content hash, so only the scene rows are copied
+_CLONE_SCENES = """
+    INSERT INTO scenes (id, screenplay_id, scene_number, content_hash, created_at, updated_at)
+    SELECT uuid_generate_v7(), sp.new_id, sc.scene_number, sc.content_hash, sc.created_at, sc.updated_at
+    FROM scenes sc
+    JOIN clone_ids sp ON sp.old_id = sc.screenplay_id
+"""
+
+_CLONE_LATEST_SCREENPLAYS = """
+    UPDATE episodes e
+    SET latest_screenplay_id = sp.new_id
+    FROM clone_ids ep
+    JOIN episodes source ON source.id = ep.old_id
+    JOIN clone_ids sp ON sp.old_id = source.latest_screenplay_id
+    WHERE e.id = ep.new_id
+"""
+
+
+class CloneRepository:
+    """
+    Deep copies of projects and episodes, made entirely inside PostgreSQL.
+
+    Each table of the subtree is copied with one INSERT ... SELECT, remapping
+    ids through a temporary old-to-new id table, so the number of round trips
+    does not grow with the size of what is copied. Copied stories, revisions,
+    screenplays and scenes keep their timestamps; the new project or episodes
+    get fresh ones.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def clone_project(self, project_id: UUID, name: Optional[str] = None) -> Optional[Project]:
+        new_id = self.db.execute(
+            text(_CLONE_PROJECT), {"project_id": uuid7(), "name": name, "source_id": project_id}
+        ).scalar_one_or_none()
+        if new_id is None:
+            return None
+        self._clone_episodes("project_id", project_id, new_id)
+        return self.db.get(Project, new_id)
+
+    def clone_episode(
+        self,
+        episode_id: UUID,
+        project_id: UUID,
+        title: Optional[str] = None
+    ) -> Optional[Episode]:
+        """Copy an episode to the end of a project's episode list (its own or another)."""
+        episode_number = self.db.scalar(
+            select(func.coalesce(func.max(Episode.episode_number), 0) + 1).where(Episode.project_id == project_id)
+        )
+        if not self._clone_episodes("id", episode_id, project_id, title=title, episode_number=episode_number):
+            return None
+        new_id = self.db.scalar(text("SELECT new_id FROM clone_ids WHERE old_id = :episode_id"), {"episode_id": episode_id})
+        return self.db.get(Episode, new_id)
+
+    def _clone_episodes(
+        self,
+        scope: str,
+        source_id: UUID,
+        project_id: UUID,
+        title: Optional[str] = None,
+        episode_number: Optional[int] = None
+    ) -> int:
+        """
+        Copy the episodes matching scope into a project, with their stories,
+        revisions, screenplays and scenes.
+
+        Returns:
+            The number of episodes copied
+        """
+        self.db.execute(text(_CREATE_CLONE_IDS))
+        copied = self.db.execute(text(_CLONE_EPISODES.format(scope=scope)), {
+            "source_id": source_id,
+            "project_id": project_id,
+            "title": title,
+            "episode_number": episode_number,
+        }).rowcount
+        if not copied:
+            return 0
+        for statement in (
+            _CLONE_STORIES,
+            _CLONE_STORY_REVISIONS,
+            _CLONE_SCREENPLAYS,
+            _CLONE_SCENES,
+            _CLONE_LATEST_SCREENPLAYS
+        ):
+            self.db.execute(text(statement))
+        return copied
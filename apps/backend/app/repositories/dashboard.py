@@ -0,0 +1,95 @@
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy import select, func
+from datetime import datetime
+from typing import List, Optional
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.project import Project
+from app.models.episode import Episode
+from app.models.story import Story
+from app.models.screenplay import Scene, SceneContent
+
+
+class DashboardRepository:
+    """Read-only aggregate queries that summarise projects and episodes in one round trip."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @replica_read
+    def get_project_summaries(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[Row]:
+        """
+        Get a page of projects, newest first, with their episode counts.
+        
+        The counts are correlated subqueries so they are only evaluated for
+        the projects on the page, each as an index scan on episodes.project_id.
+        """
+        episode_count = (
+            select(func.count())
+            .where(Episode.project_id == Project.id, Episode.deleted_at.is_(None))
+            .correlate(Project)
+            .scalar_subquery()
+        )
+        screenplay_episode_count = (
+            select(func.count())
+            .where(
+                Episode.project_id == Project.id,
+                Episode.latest_screenplay_id.is_not(None),
+                Episode.deleted_at.is_(None)
+            )
+            .correlate(Project)
+            .scalar_subquery()
+        )
+        # Table column selects bypass the soft-delete filter, so deleted rows are excluded here
+        query = select(
+            *Project.__table__.c,
+            episode_count.label("episode_count"),
+            screenplay_episode_count.label("screenplay_episode_count")
+        ).where(Project.deleted_at.is_(None))
+        
+        after = decode_cursor(cursor, datetime.fromisoformat, UUID) if cursor else None
+        result = self.db.execute(
+            keyset_query(query, (Project.created_at, Project.id), after, limit, descending=True)
+        )
+        total = self.db.scalar(select(func.count()).select_from(Project)) if include_total else None
+        return build_page(list(result.all()), limit, lambda p: (p.created_at, p.id), total)
+
+    @replica_read
+    def get_episode_summaries(self, project_id: UUID) -> List[Row]:
+        """
+        Get every episode of a project with its story length and the scene
+        count and total runtime of its latest screenplay, in a single query.
+        """
+        scene_totals = (
+            select(
+                Scene.screenplay_id,
+                func.count().label("scene_count"),
+                func.sum(SceneContent.duration_seconds).label("total_duration_seconds")
+            )
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .join(Episode, Episode.latest_screenplay_id == Scene.screenplay_id)
+            .where(Episode.project_id == project_id)
+            .group_by(Scene.screenplay_id)
+            .subquery()
+        )
+        result = self.db.execute(
+            select(
+                *Episode.__table__.c,
+                func.coalesce(func.length(Story.content), 0).label("story_length"),
+                func.coalesce(scene_totals.c.scene_count, 0).label("scene_count"),
+                func.coalesce(scene_totals.c.total_duration_seconds, 0).label("total_duration_seconds")
+            )
+            .outerjoin(Story, Story.episode_id == Episode.id)
+            .outerjoin(scene_totals, scene_totals.c.screenplay_id == Episode.latest_screenplay_id)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .order_by(Episode.episode_number, Episode.id)
+        )
+        return list(result.all())
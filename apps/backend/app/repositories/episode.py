@@ -1,9 +1,12 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import select
+from sqlalchemy import select, func, update
 from typing import List, Optional
 from uuid import UUID
 
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
 from app.models.episode import Episode
+from app.models.project import UTC_NOW
 from app.schemas.episode import EpisodeCreate, EpisodeUpdate
 
 
@@ -11,14 +14,43 @@ class EpisodeRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all_by_project(self, project_id: UUID) -> List[Episode]:
+    @replica_read
+    def get_page_by_project(
+        self,
+        project_id: UUID,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        versions_only: bool = False
+    ) -> Page[Episode]:
+        """
+        Get a page of a project's episodes ordered by episode number, continuing after the given cursor.
+        
+        A limit of None returns every remaining episode as a single page.
+        With versions_only, the page holds narrow (id, episode_number, updated_at)
+        rows, enough to compute the page's ETag without loading the episodes.
+        """
+        after = decode_cursor(cursor, int, UUID) if cursor else None
+        query = (
+            select(Episode.id, Episode.episode_number, Episode.updated_at) if versions_only else select(Episode)
+        )
         result = self.db.execute(
-            select(Episode)
-            .where(Episode.project_id == project_id)
-            .order_by(Episode.episode_number)
+            keyset_query(
+                query.where(Episode.project_id == project_id),
+                (Episode.episode_number, Episode.id),
+                after,
+                limit
+            )
         )
-        return list(result.scalars().all())
+        total = None
+        if include_total:
+            total = self.db.scalar(
+                select(func.count()).select_from(Episode).where(Episode.project_id == project_id)
+            )
+        rows = list(result.all()) if versions_only else list(result.scalars().all())
+        return build_page(rows, limit, lambda e: (e.episode_number, e.id), total)
 
+    @replica_read
     def get_by_id(self, episode_id: UUID) -> Optional[Episode]:
         result = self.db.execute(
             select(Episode).where(Episode.id == episode_id)
@@ -28,8 +60,7 @@ class EpisodeRepository:
     def create(self, episode_data: EpisodeCreate) -> Episode:
         episode = Episode(**episode_data.model_dump())
         self.db.add(episode)
-        self.db.commit()
-        self.db.refresh(episode)
+        self.db.flush()
         return episode
 
     def update(self, episode_id: UUID, episode_data: EpisodeUpdate) -> Optional[Episode]:
@@ -41,16 +72,16 @@ class EpisodeRepository:
         for field, value in update_data.items():
             setattr(episode, field, value)
         
-        self.db.commit()
-        self.db.refresh(episode)
+        self.db.flush()
         return episode
 
     def delete(self, episode_id: UUID) -> bool:
-        episode = self.get_by_id(episode_id)
-        if not episode:
-            return False
-        
-        self.db.delete(episode)
-        self.db.commit()
-        return True
-
+        """Soft-delete an episode; the purger removes it with its story, screenplays and scenes later."""
+        result = self.db.execute(
+            update(Episode)
+            .where(Episode.id == episode_id, Episode.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Episode.id)
+        )
+        deleted = result.first() is not None
+        return deleted
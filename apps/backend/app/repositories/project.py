@@ -1,7 +1,12 @@
+from datetime import datetime
 from uuid import UUID
-from typing import Optional
+from typing import List, Optional
+from sqlalchemy import select, func, update
 from sqlalchemy.orm import Session
-from app.models.project import Project
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.project import Project, UTC_NOW
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
 
@@ -9,23 +14,45 @@ class ProjectRepository:
     def __init__(self, db: Session):
         self.db = db
 
-    def get_all(self, skip: int = 0, limit: int = 100) -> list[Project]:
-        return (
-            self.db.query(Project)
-            .order_by(Project.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+    @replica_read
+    def get_page(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        versions_only: bool = False,
+        skip: int = 0
+    ) -> Page[Project]:
+        """
+        Get a page of projects, newest first, continuing after the given cursor.
+        
+        With versions_only, the page holds narrow (id, created_at, updated_at)
+        rows, enough to compute the page's ETag without loading the projects.
+        skip offsets the first page for clients of the old offset paging; it
+        cannot be combined with a cursor.
+        
+        Raises:
+            ValueError: If the cursor is invalid or given together with skip
+        """
+        if skip and cursor:
+            raise ValueError("skip cannot be combined with cursor")
+        after = decode_cursor(cursor, datetime.fromisoformat, UUID) if cursor else None
+        query = select(Project.id, Project.created_at, Project.updated_at) if versions_only else select(Project)
+        result = self.db.execute(
+            keyset_query(query, (Project.created_at, Project.id), after, limit, descending=True, offset=skip)
         )
+        rows = list(result.all()) if versions_only else list(result.scalars().all())
+        total = self.db.scalar(select(func.count()).select_from(Project)) if include_total else None
+        return build_page(rows, limit, lambda p: (p.created_at, p.id), total)
 
+    @replica_read
     def get_by_id(self, project_id: UUID) -> Optional[Project]:
         return self.db.query(Project).filter(Project.id == project_id).first()
 
     def create(self, project_data: ProjectCreate) -> Project:
         project = Project(**project_data.model_dump())
         self.db.add(project)
-        self.db.commit()
-        self.db.refresh(project)
+        self.db.flush()
         return project
 
     def update(self, project_id: UUID, project_data: ProjectUpdate) -> Optional[Project]:
@@ -37,16 +64,28 @@ class ProjectRepository:
         for key, value in update_data.items():
             setattr(project, key, value)
         
-        self.db.commit()
-        self.db.refresh(project)
+        self.db.flush()
         return project
 
-    def delete(self, project_id: UUID) -> bool:
-        project = self.get_by_id(project_id)
-        if not project:
-            return False
+    def delete(self, project_id: UUID) -> Optional[List[UUID]]:
+        """
+        Soft-delete a project and its episodes; the purger removes the rows later.
         
-        self.db.delete(project)
-        self.db.commit()
-        return True
-
+        Returns:
+            The ids of the episodes deleted with it, or None if the project does not exist
+        """
+        result = self.db.execute(
+            update(Project)
+            .where(Project.id == project_id, Project.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Project.id)
+        )
+        if result.first() is None:
+            return None
+        result = self.db.execute(
+            update(Episode)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .values(deleted_at=UTC_NOW)
+            .returning(Episode.id)
+        )
+        return list(result.scalars().all())
@@ -0,0 +1,179 @@
+from sqlalchemy.engine import RowMapping
+from sqlalchemy.orm import Session
+from sqlalchemy import Select, select, update, bindparam, text
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+from uuid import UUID
+
+from app.models.project import Project
+from app.models.episode import Episode
+from app.models.story import Story
+from app.models.screenplay import Screenplay, Scene, SceneContent
+
+# Rows fetched per round trip from the server-side cursor while exporting
+EXPORT_BATCH_SIZE = 1000
+
+# Staging tables for rows that fan out into more than one table on import
+_CREATE_STAGING_TABLES = """
+    CREATE TEMP TABLE import_stories (
+        id uuid, episode_id uuid, content text, revision integer, snapshot bytea,
+        created_at timestamp, updated_at timestamp
+    ) ON COMMIT DROP;
+    CREATE TEMP TABLE import_scenes (
+        id uuid, screenplay_id uuid, scene_number integer, content_hash varchar(64),
+        title varchar(255), duration_seconds integer, characters jsonb, dialogue jsonb, prompt text,
+        character_line_counts jsonb, created_at timestamp, updated_at timestamp
+    ) ON COMMIT DROP
+"""
+
+
+class ProjectTransferRepository:
+    """
+    Bulk reads and writes of whole project trees.
+    
+    Exports stream each table through a server-side cursor, so memory use does
+    not depend on project size. Imports load rows with COPY FROM STDIN.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def begin_snapshot(self) -> None:
+        """Read every following query from one snapshot, so an export is consistent across tables."""
+        self.db.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+
+    def _stream(self, query: Select) -> Iterator[RowMapping]:
+        result = self.db.execute(query.execution_options(yield_per=EXPORT_BATCH_SIZE))
+        return iter(result.mappings())
+
+    def get_project(self, project_id: UUID) -> Optional[RowMapping]:
+        result = self.db.execute(
+            select(*Project.__table__.c).where(Project.id == project_id, Project.deleted_at.is_(None))
+        )
+        return result.mappings().one_or_none()
+
+    def stream_episodes(self, project_id: UUID) -> Iterator[RowMapping]:
+        return self._stream(
+            select(*Episode.__table__.c)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .order_by(Episode.episode_number, Episode.id)
+        )
+
+    def stream_stories(self, project_id: UUID) -> Iterator[RowMapping]:
+        return self._stream(
+            select(Story.episode_id, Story.content, Story.revision, Story.created_at, Story.updated_at)
+            .join(Episode, Episode.id == Story.episode_id)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .order_by(Episode.episode_number, Episode.id)
+        )
+
+    def stream_screenplays(self, project_id: UUID) -> Iterator[RowMapping]:
+        return self._stream(
+            select(*Screenplay.__table__.c)
+            .join(Episode, Episode.id == Screenplay.episode_id)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .order_by(Episode.episode_number, Episode.id, Screenplay.created_at, Screenplay.id)
+        )
+
+    def stream_scenes(self, project_id: UUID) -> Iterator[RowMapping]:
+        return self._stream(
+            select(
+                Scene.screenplay_id,
+                Scene.scene_number,
+                SceneContent.title,
+                SceneContent.duration_seconds,
+                SceneContent.characters,
+                SceneContent.dialogue,
+                SceneContent.prompt,
+                Scene.created_at,
+                Scene.updated_at
+            )
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .join(Screenplay, Screenplay.id == Scene.screenplay_id)
+            .join(Episode, Episode.id == Screenplay.episode_id)
+            .where(Episode.project_id == project_id, Episode.deleted_at.is_(None))
+            .order_by(Scene.screenplay_id, Scene.scene_number)
+        )
+
+    def copy_rows(self, table: str, columns: Sequence[str], rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Load rows into a table with COPY FROM STDIN.
+        
+        Values are sent in PostgreSQL's text format, so JSON columns must be
+        passed as already-encoded strings.
+        
+        Returns:
+            The number of rows copied
+        """
+        count = 0
+        connection = self.db.connection().connection.driver_connection
+        with connection.cursor() as cursor:
+            with cursor.copy(f"COPY {table} ({', '.join(columns)}) FROM STDIN") as copy:
+                for row in rows:
+                    copy.write_row(row)
+                    count += 1
+        return count
+
+    def create_staging_tables(self) -> None:
+        self.db.execute(text(_CREATE_STAGING_TABLES))
+
+    def publish_staged_stories(self) -> None:
+        """Move staged stories into stories, each with its content as a snapshot revision."""
+        self.db.execute(text("""
+            INSERT INTO stories (id, episode_id, content, revision, created_at, updated_at)
+            SELECT id, episode_id, content, revision, created_at, updated_at FROM import_stories
+        """))
+        self.db.execute(text("""
+            INSERT INTO story_revisions (id, story_id, revision, kind, data, content_length, created_at)
+            SELECT uuid_generate_v7(), id, revision, 'snapshot', snapshot, length(content), updated_at
+            FROM import_stories
+            WHERE revision > 0
+        """))
+
+    def publish_staged_scenes(self) -> None:
+        """Store the bodies of staged scenes that are new, with their character rows, then the scenes."""
+        needed = self.db.scalar(text("SELECT count(DISTINCT content_hash) FROM import_scenes"))
+        while True:
+            self.db.execute(text("""
+                WITH new_contents AS (
+                    INSERT INTO scene_contents (content_hash, title, duration_seconds, characters, dialogue, prompt)
+                    SELECT DISTINCT ON (content_hash) content_hash, title, duration_seconds, characters, dialogue, prompt
+                    FROM import_scenes s
+                    -- Filtered up front: conflicting rows would still pay for their generated search columns
+                    WHERE NOT EXISTS (SELECT 1 FROM scene_contents c WHERE c.content_hash = s.content_hash)
+                    ORDER BY content_hash
+                    ON CONFLICT (content_hash) DO NOTHING
+                    RETURNING content_hash
+                )
+                INSERT INTO scene_characters (content_hash, name, line_count)
+                SELECT DISTINCT ON (s.content_hash, c.key) s.content_hash, c.key, c.value::integer
+                FROM import_scenes s
+                JOIN new_contents n ON n.content_hash = s.content_hash
+                CROSS JOIN LATERAL jsonb_each_text(s.character_line_counts) c
+            """))
+            # Key-share lock every body the scenes will reference, so orphan cleanup can't delete
+            # one before the scenes are in; a body deleted since the insert is stored again
+            locked = self.db.scalar(text("""
+                SELECT count(*) FROM (
+                    SELECT 1 FROM scene_contents c
+                    WHERE c.content_hash IN (SELECT content_hash FROM import_scenes)
+                    FOR KEY SHARE
+                ) locked
+            """))
+            if locked == needed:
+                break
+        self.db.execute(text("""
+            INSERT INTO scenes (id, screenplay_id, scene_number, content_hash, created_at, updated_at)
+            SELECT id, screenplay_id, scene_number, content_hash, created_at, updated_at FROM import_scenes
+        """))
+
+    def set_latest_screenplays(self, pointers: List[Dict[str, UUID]]) -> None:
+        """Point episodes at their current screenplays, given as episode_id/screenplay_id pairs."""
+        if not pointers:
+            return
+        table = Episode.__table__
+        self.db.execute(
+            update(table)
+            .where(table.c.id == bindparam("episode_id"))
+            .values(latest_screenplay_id=bindparam("screenplay_id")),
+            pointers
+        )
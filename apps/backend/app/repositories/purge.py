@@ -0,0 +1,89 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import text
+from typing import Optional, Tuple
+from uuid import UUID
+
+# Child rows of a deleted episode, removed leaves first so no statement cascades
+# into an unbounded number of rows. Locked rows are skipped and retried by a later batch.
+_PURGE_STEPS = (
+    ("scenes", """
+        DELETE FROM scenes WHERE id IN (
+            SELECT sc.id FROM scenes sc
+            JOIN screenplays sp ON sp.id = sc.screenplay_id
+            WHERE sp.episode_id = :episode_id
+            LIMIT :limit
+            FOR UPDATE OF sc SKIP LOCKED
+        )
+    """),
+    ("screenplays", """
+        DELETE FROM screenplays WHERE id IN (
+            SELECT id FROM screenplays
+            WHERE episode_id = :episode_id
+            LIMIT :limit
+            FOR UPDATE SKIP LOCKED
+        )
+    """),
+    ("story_revisions", """
+        DELETE FROM story_revisions WHERE id IN (
+            SELECT r.id FROM story_revisions r
+            JOIN stories s ON s.id = r.story_id
+            WHERE s.episode_id = :episode_id
+            LIMIT :limit
+            FOR UPDATE OF r SKIP LOCKED
+        )
+    """),
+)
+
+
+class PurgeRepository:
+    """Removes soft-deleted projects and episodes in bounded batches."""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get_next_deleted_episode_id(self) -> Optional[UUID]:
+        """
+        The longest-deleted episode still waiting to be purged that no other
+        purger is working on; its row stays locked until the batch commits.
+        """
+        return self.db.scalar(text("""
+            SELECT id FROM episodes
+            WHERE deleted_at IS NOT NULL
+            ORDER BY deleted_at
+            LIMIT 1
+            FOR UPDATE SKIP LOCKED
+        """))
+
+    def delete_episode_batch(self, episode_id: UUID, limit: int) -> Tuple[str, int]:
+        """
+        Delete up to limit child rows of a deleted episode, or the episode
+        itself (with its story) once it has none left.
+
+        Returns:
+            The table deleted from and the number of rows; 0 rows once the episode is gone
+        """
+        for table, statement in _PURGE_STEPS:
+            deleted = self.db.execute(text(statement), {"episode_id": episode_id, "limit": limit}).rowcount
+            if deleted:
+                return table, deleted
+        return "episodes", self.db.execute(
+            text("DELETE FROM episodes WHERE id = :episode_id AND deleted_at IS NOT NULL"),
+            {"episode_id": episode_id}
+        ).rowcount
+
+    def delete_project_batch(self, limit: int) -> int:
+        """
+        Delete deleted projects none of whose deleted episodes are left.
+
+        Returns:
+            The number of projects deleted
+        """
+        return self.db.execute(text("""
+            DELETE FROM projects WHERE id IN (
+                SELECT p.id FROM projects p
+                WHERE p.deleted_at IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM episodes e WHERE e.project_id = p.id AND e.deleted_at IS NOT NULL)
+                LIMIT :limit
+                FOR UPDATE SKIP LOCKED
+            )
+        """), {"limit": limit}).rowcount
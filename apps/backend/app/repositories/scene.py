@@ -1,9 +1,21 @@
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import Optional, List
+from sqlalchemy import select, insert, delete, func
+from typing import Any, Dict, Mapping, Optional, List, Sequence
 from uuid import UUID
 
-from app.models.screenplay import Scene
+from app.db.replica import replica_read
+from app.models.episode import Episode
+from app.models.screenplay import (
+    Screenplay,
+    Scene,
+    SceneContent,
+    SceneCharacter,
+    SCENE_CONTENT_FIELDS,
+    scene_content_hash,
+    scene_character_line_counts,
+)
 from app.schemas.screenplay import SceneCreate, SceneBase
 
 
@@ -11,12 +23,50 @@ class SceneRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    @replica_read
     def get_by_screenplay_id(self, screenplay_id: UUID) -> List[Scene]:
         result = self.db.execute(
             select(Scene).where(Scene.screenplay_id == screenplay_id).order_by(Scene.scene_number)
         )
         return list(result.scalars().all())
 
+    @replica_read
+    def get_outline_by_screenplay_id(self, screenplay_id: UUID) -> List[Row]:
+        """Get (scene_number, content_hash, title) of a screenplay's scenes, without their bodies."""
+        result = self.db.execute(
+            select(Scene.scene_number, Scene.content_hash, SceneContent.title)
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .where(Scene.screenplay_id == screenplay_id)
+            .order_by(Scene.scene_number)
+        )
+        return list(result.all())
+
+    def get_latest_by_episode_id(self, episode_id: UUID) -> List[Scene]:
+        """
+        Get the scenes of an episode's latest screenplay in a single query.
+        
+        Follows episodes.latest_screenplay_id, falling back to the newest
+        screenplay by created_at when the pointer is not set.
+        """
+        latest_by_date = (
+            select(Screenplay.id)
+            .where(Screenplay.episode_id == Episode.id)
+            .order_by(Screenplay.created_at.desc())
+            .limit(1)
+            .correlate(Episode)
+            .scalar_subquery()
+        )
+        latest_screenplay_id = (
+            select(func.coalesce(Episode.latest_screenplay_id, latest_by_date))
+            .where(Episode.id == episode_id)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            select(Scene).where(Scene.screenplay_id == latest_screenplay_id).order_by(Scene.scene_number)
+        )
+        return list(result.scalars().all())
+
+    @replica_read
     def get_by_id(self, scene_id: UUID) -> Optional[Scene]:
         result = self.db.execute(
             select(Scene).where(Scene.id == scene_id)
@@ -24,20 +74,80 @@ class SceneRepository:
         return result.scalar_one_or_none()
 
     def create(self, scene_data: SceneCreate) -> Scene:
-        scene = Scene(**scene_data.model_dump())
-        self.db.add(scene)
-        self.db.commit()
-        self.db.refresh(scene)
-        return scene
+        return self.insert_rows([scene_data.model_dump()])[0]
 
     def create_batch(self, scenes_data: List[SceneCreate]) -> List[Scene]:
-        """Bulk insert scenes for a screenplay."""
-        scenes = [Scene(**scene_data.model_dump()) for scene_data in scenes_data]
-        self.db.add_all(scenes)
-        self.db.commit()
-        for scene in scenes:
-            self.db.refresh(scene)
-        return scenes
+        """Bulk insert scenes, possibly for several screenplays."""
+        return self.insert_rows([scene_data.model_dump() for scene_data in scenes_data])
+
+    def save_contents(self, scenes: Sequence[Mapping[str, Any]]) -> List[str]:
+        """
+        Store the bodies of the given scenes, skipping bodies that are already stored.
+        
+        Returns:
+            The content hash of each scene, in input order
+        """
+        hashes = [scene_content_hash(scene) for scene in scenes]
+        contents = {
+            content_hash: {"content_hash": content_hash, **{field: scene[field] for field in SCENE_CONTENT_FIELDS}}
+            for content_hash, scene in zip(hashes, scenes)
+        }
+        if contents:
+            characters = []
+            # Sorted so concurrent generations touch shared keys in the same order
+            pending = sorted(contents)
+            while pending:
+                result = self.db.execute(
+                    pg_insert(SceneContent.__table__)
+                    .on_conflict_do_nothing(index_elements=["content_hash"])
+                    .returning(SceneContent.content_hash),
+                    [contents[content_hash] for content_hash in pending]
+                )
+                inserted = set(result.scalars().all())
+                # Only bodies stored by this call need their character rows
+                characters += [
+                    {"content_hash": content_hash, "name": name, "line_count": line_count}
+                    for content_hash in sorted(inserted)
+                    for name, line_count in scene_character_line_counts(contents[content_hash]).items()
+                ]
+                existing = [content_hash for content_hash in pending if content_hash not in inserted]
+                if not existing:
+                    break
+                # Key-share lock the bodies that were already stored, so orphan cleanup can't delete
+                # them before the new scenes reference them; any deleted in between are stored again
+                locked = self.db.execute(
+                    select(SceneContent.content_hash)
+                    .where(SceneContent.content_hash.in_(existing))
+                    .with_for_update(key_share=True)
+                )
+                locked = set(locked.scalars().all())
+                pending = [content_hash for content_hash in existing if content_hash not in locked]
+            if characters:
+                self.db.execute(insert(SceneCharacter.__table__), characters)
+        return hashes
+
+    def insert_rows(self, rows: Sequence[Dict[str, Any]]) -> List[Scene]:
+        """
+        Bulk insert scenes given as dicts of screenplay_id, scene_number and the
+        content fields.
+        
+        New bodies go in with one multi-row INSERT, the scenes with another, and
+        the inserted scenes are read back together with their contents, so the
+        cost does not grow in round trips with the number of scenes.
+        """
+        if not rows:
+            return []
+        hashes = self.save_contents(rows)
+        result = self.db.execute(
+            insert(Scene.__table__).returning(Scene.id, sort_by_parameter_order=True),
+            [
+                {"screenplay_id": row["screenplay_id"], "scene_number": row["scene_number"], "content_hash": content_hash}
+                for row, content_hash in zip(rows, hashes)
+            ]
+        )
+        scene_ids = list(result.scalars().all())
+        scenes = {scene.id: scene for scene in self.db.execute(select(Scene).where(Scene.id.in_(scene_ids))).scalars()}
+        return [scenes[scene_id] for scene_id in scene_ids]
 
     def update(self, scene_id: UUID, scene_data: SceneBase) -> Optional[Scene]:
         scene = self.get_by_id(scene_id)
@@ -45,19 +155,21 @@ class SceneRepository:
             return None
         
         update_data = scene_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(scene, field, value)
+        if "scene_number" in update_data:
+            scene.scene_number = update_data.pop("scene_number")
+        if update_data:
+            # Contents are shared between versions, so point the scene at the edited body instead
+            body = {field: getattr(scene, field) for field in SCENE_CONTENT_FIELDS}
+            body.update(update_data)
+            content_hash, = self.save_contents([body])
+            scene.content = self.db.get(SceneContent, content_hash)
         
-        self.db.commit()
-        self.db.refresh(scene)
+        self.db.flush()
         return scene
 
     def delete(self, scene_id: UUID) -> bool:
-        scene = self.get_by_id(scene_id)
-        if not scene:
-            return False
-        
-        self.db.delete(scene)
-        self.db.commit()
-        return True
-
+        result = self.db.execute(
+            delete(Scene).where(Scene.id == scene_id).returning(Scene.id)
+        )
+        deleted = result.first() is not None
+        return deleted
@@ -1,16 +1,23 @@
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import Optional, List
+from sqlalchemy import select, func, insert, update, delete
+from datetime import datetime
+from typing import Optional, List, Tuple
 from uuid import UUID
 
-from app.models.screenplay import Screenplay
-from app.schemas.screenplay import ScreenplayCreate, ScreenplayBase
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.screenplay import Screenplay, Scene
+from app.repositories.scene import SceneRepository
+from app.schemas.screenplay import ScreenplayCreate, ScreenplayBase, SceneBase
 
 
 class ScreenplayRepository:
     def __init__(self, db: Session):
         self.db = db
 
+    @replica_read
     def get_by_episode_id(self, episode_id: UUID) -> Optional[Screenplay]:
         """Get the latest screenplay for an episode (most recently created)."""
         result = self.db.execute(
@@ -21,15 +28,33 @@ class ScreenplayRepository:
         )
         return result.scalar_one_or_none()
     
-    def get_all_by_episode_id(self, episode_id: UUID) -> List[Screenplay]:
-        """Get all screenplays for an episode, ordered by creation date (newest first)."""
+    @replica_read
+    def get_page_by_episode_id(
+        self,
+        episode_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[Screenplay]:
+        """Get a page of an episode's screenplays, newest first, continuing after the given cursor."""
+        after = decode_cursor(cursor, datetime.fromisoformat, UUID) if cursor else None
         result = self.db.execute(
-            select(Screenplay)
-            .where(Screenplay.episode_id == episode_id)
-            .order_by(Screenplay.created_at.desc())
+            keyset_query(
+                select(Screenplay).where(Screenplay.episode_id == episode_id),
+                (Screenplay.created_at, Screenplay.id),
+                after,
+                limit,
+                descending=True
+            )
         )
-        return list(result.scalars().all())
+        total = None
+        if include_total:
+            total = self.db.scalar(
+                select(func.count()).select_from(Screenplay).where(Screenplay.episode_id == episode_id)
+            )
+        return build_page(list(result.scalars().all()), limit, lambda s: (s.created_at, s.id), total)
     
+    @replica_read
     def get_by_id(self, screenplay_id: UUID) -> Optional[Screenplay]:
         """Get a screenplay by its ID."""
         result = self.db.execute(
@@ -40,10 +65,42 @@ class ScreenplayRepository:
     def create(self, screenplay_data: ScreenplayCreate) -> Screenplay:
         screenplay = Screenplay(**screenplay_data.model_dump())
         self.db.add(screenplay)
-        self.db.commit()
-        self.db.refresh(screenplay)
+        self.db.flush()
         return screenplay
 
+    def create_with_scenes(
+        self,
+        screenplay_data: ScreenplayCreate,
+        scenes_data: List[SceneBase]
+    ) -> Tuple[Row, List[Scene]]:
+        """
+        Insert a screenplay and all of its scenes in one transaction and make
+        it the episode's latest screenplay.
+        
+        Scene bodies already stored by an earlier version are shared rather than
+        copied. A generation costs a constant number of round trips regardless
+        of scene count.
+        """
+        screenplay_table = Screenplay.__table__
+        
+        screenplay = self.db.execute(
+            insert(screenplay_table)
+            .values(**screenplay_data.model_dump())
+            .returning(*screenplay_table.c)
+        ).one()
+        
+        scenes = SceneRepository(self.db).insert_rows(
+            [{**scene_data.model_dump(), "screenplay_id": screenplay.id} for scene_data in scenes_data]
+        )
+        
+        # Point the episode at its new current screenplay
+        self.db.execute(
+            update(Episode)
+            .where(Episode.id == screenplay.episode_id)
+            .values(latest_screenplay_id=screenplay.id)
+        )
+        return screenplay, scenes
+
     def update(self, screenplay_id: UUID, screenplay_data: ScreenplayBase) -> Optional[Screenplay]:
         """Update a screenplay by its ID."""
         screenplay = self.get_by_id(screenplay_id)
@@ -54,26 +111,21 @@ class ScreenplayRepository:
         for field, value in update_data.items():
             setattr(screenplay, field, value)
         
-        self.db.commit()
-        self.db.refresh(screenplay)
+        self.db.flush()
         return screenplay
 
     def delete(self, screenplay_id: UUID) -> bool:
         """Delete a screenplay by its ID."""
-        screenplay = self.get_by_id(screenplay_id)
-        if not screenplay:
-            return False
-        
-        self.db.delete(screenplay)
-        self.db.commit()
-        return True
-    
+        result = self.db.execute(
+            delete(Screenplay).where(Screenplay.id == screenplay_id).returning(Screenplay.id)
+        )
+        deleted = result.first() is not None
+        return deleted
+
     def delete_all_by_episode_id(self, episode_id: UUID) -> int:
         """Delete all screenplays for an episode. Returns the number of deleted screenplays."""
-        screenplays = self.get_all_by_episode_id(episode_id)
-        count = len(screenplays)
-        for screenplay in screenplays:
-            self.db.delete(screenplay)
-        self.db.commit()
+        result = self.db.execute(
+            delete(Screenplay).where(Screenplay.episode_id == episode_id).returning(Screenplay.id)
+        )
+        count = len(result.all())
         return count
-
@@ -0,0 +1,113 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import select, update, delete, func, or_
+from typing import List, Optional
+from uuid import UUID
+
+from app.models.screenplay_batch import ScreenplayBatchJob, ScreenplayBatchEpisode
+
+
+def _utc_now():
+    # Database clock, so leases mean the same to every runner
+    return func.timezone("utc", func.now())
+
+
+def _seconds(seconds: float):
+    return func.make_interval(0, 0, 0, 0, 0, 0, seconds)
+
+
+def _lease_until(lease_seconds: float):
+    return _utc_now() + _seconds(lease_seconds)
+
+
+class ScreenplayBatchRepository:
+    """
+    Batch jobs and their per-episode progress.
+
+    A runner owns a job while its lease is current and renews it as it goes;
+    once the lease has lapsed (the runner's process stopped), any other
+    runner may claim the job and carry on where it left off.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create(self, mode: str, episodes: List[ScreenplayBatchEpisode], lease_seconds: float) -> ScreenplayBatchJob:
+        """Create a job leased to the caller."""
+        job = ScreenplayBatchJob(mode=mode, episodes=episodes, lease_expires_at=_lease_until(lease_seconds))
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+    def get_by_id(self, job_id: UUID) -> Optional[ScreenplayBatchJob]:
+        result = self.db.execute(
+            select(ScreenplayBatchJob).where(ScreenplayBatchJob.id == job_id)
+        )
+        return result.scalar_one_or_none()
+
+    def claim_abandoned(self, lease_seconds: float, limit: int) -> List[UUID]:
+        """
+        Lease unfinished jobs whose runner has gone away to the caller.
+
+        Returns:
+            The IDs of the claimed jobs, oldest first
+        """
+        abandoned = (
+            select(ScreenplayBatchJob.id)
+            .where(
+                ScreenplayBatchJob.finished_at.is_(None),
+                or_(ScreenplayBatchJob.lease_expires_at.is_(None), ScreenplayBatchJob.lease_expires_at < _utc_now())
+            )
+            .order_by(ScreenplayBatchJob.created_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = self.db.execute(
+            update(ScreenplayBatchJob)
+            .where(ScreenplayBatchJob.id.in_(abandoned.scalar_subquery()))
+            .values(lease_expires_at=_lease_until(lease_seconds))
+            .returning(ScreenplayBatchJob.id, ScreenplayBatchJob.created_at)
+        )
+        return [row.id for row in sorted(result, key=lambda row: row.created_at)]
+
+    def renew_lease(self, job_id: UUID, lease_seconds: float) -> None:
+        self.db.execute(
+            update(ScreenplayBatchJob)
+            .where(ScreenplayBatchJob.id == job_id)
+            .values(lease_expires_at=_lease_until(lease_seconds))
+        )
+
+    def update_job(self, job_id: UUID, **values) -> None:
+        self.db.execute(
+            update(ScreenplayBatchJob).where(ScreenplayBatchJob.id == job_id).values(**values)
+        )
+
+    def finish_job(self, job_id: UUID, status: str) -> None:
+        self.update_job(job_id, status=status, finished_at=_utc_now(), lease_expires_at=None)
+
+    def update_episode(self, job_id: UUID, episode_id: UUID, **values) -> None:
+        self.db.execute(
+            update(ScreenplayBatchEpisode)
+            .where(ScreenplayBatchEpisode.job_id == job_id, ScreenplayBatchEpisode.episode_id == episode_id)
+            .values(**values)
+        )
+
+    def reset_interrupted_episodes(self, job_id: UUID) -> None:
+        """Return episodes a stopped runner was generating online to pending, so they are generated again."""
+        self.db.execute(
+            update(ScreenplayBatchEpisode)
+            .where(ScreenplayBatchEpisode.job_id == job_id, ScreenplayBatchEpisode.status == "running")
+            .values(status="pending")
+        )
+
+    def delete_finished_before(self, retention_seconds: float) -> int:
+        """
+        Delete jobs (with their episode progress) that finished more than retention_seconds ago.
+
+        Returns:
+            The number of jobs deleted
+        """
+        return self.db.execute(
+            delete(ScreenplayBatchJob).where(
+                ScreenplayBatchJob.finished_at < _utc_now() - _seconds(retention_seconds)
+            )
+        ).rowcount
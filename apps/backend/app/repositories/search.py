@@ -0,0 +1,118 @@
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy import ColumnElement, select, literal, literal_column, null, or_, case, union_all, func, cast, Float
+from typing import Optional
+from uuid import UUID
+
+from app.db.replica import replica_read
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.episode import Episode
+from app.models.story import Story
+from app.models.screenplay import Scene, SceneContent
+
+ENGLISH = literal_column("'english'::regconfig")
+SIMPLE = literal_column("'simple'::regconfig")
+
+HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=20, MinWords=8, FragmentDelimiter=\" … \""
+
+# Trigram indexes only help patterns of at least three characters
+MIN_SUBSTRING_LENGTH = 3
+
+
+def _escape_like(query: str) -> str:
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+class SearchRepository:
+    """
+    Ranked search over story content and the scenes of each episode's latest screenplay.
+    
+    Matches come from the generated search_vector columns (English stems plus
+    unstemmed words, so Malayalam text is matched word by word) and, for
+    longer queries, from a substring match that catches inflected Malayalam
+    forms full-text matching misses.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @replica_read
+    def search(
+        self,
+        project_id: UUID,
+        query: str,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[Row]:
+        """Get a page of a project's matches, best first, continuing after the given cursor."""
+        after = decode_cursor(cursor, float, UUID) if cursor else None
+        tsquery = func.websearch_to_tsquery(ENGLISH, query).op("||")(func.websearch_to_tsquery(SIMPLE, query))
+        
+        story_rank = func.ts_rank_cd(Story.search_vector, tsquery)
+        story_hits = (
+            select(
+                literal("story").label("kind"),
+                Story.id.label("id"),
+                Episode.id.label("episode_id"),
+                Episode.episode_number,
+                Episode.title.label("episode_title"),
+                null().label("scene_id"),
+                null().label("scene_number"),
+                Episode.title.label("title"),
+                cast(story_rank, Float).label("rank")
+            )
+            .join(Episode, Episode.id == Story.episode_id)
+            .where(Episode.project_id == project_id, self._matches(Story.search_vector, Story.content, tsquery, query))
+        )
+        
+        scene_rank = func.ts_rank_cd(SceneContent.search_vector, tsquery)
+        scene_hits = (
+            select(
+                literal("scene").label("kind"),
+                Scene.id.label("id"),
+                Episode.id.label("episode_id"),
+                Episode.episode_number,
+                Episode.title.label("episode_title"),
+                Scene.id.label("scene_id"),
+                Scene.scene_number,
+                SceneContent.title,
+                cast(scene_rank, Float).label("rank")
+            )
+            .join(Scene, Scene.screenplay_id == Episode.latest_screenplay_id)
+            .join(SceneContent, SceneContent.content_hash == Scene.content_hash)
+            .where(
+                Episode.project_id == project_id,
+                self._matches(SceneContent.search_vector, SceneContent.search_text, tsquery, query)
+            )
+        )
+        
+        hits = union_all(story_hits, scene_hits).subquery("hits")
+        page = keyset_query(select(hits), (hits.c.rank, hits.c.id), after, limit, descending=True).subquery("page")
+        
+        # Snippets are only built for the rows on the page
+        story_snippet = (
+            select(func.ts_headline(ENGLISH, Story.content, tsquery, HEADLINE_OPTIONS))
+            .where(Story.id == page.c.id)
+            .scalar_subquery()
+        )
+        scene_snippet = (
+            select(func.ts_headline(ENGLISH, SceneContent.search_text, tsquery, HEADLINE_OPTIONS))
+            .join(Scene, Scene.content_hash == SceneContent.content_hash)
+            .where(Scene.id == page.c.id)
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            select(
+                *page.c,
+                case((page.c.kind == "story", story_snippet), else_=scene_snippet).label("snippet")
+            )
+            .order_by(page.c.rank.desc(), page.c.id.desc())
+        )
+        return build_page(list(result.all()), limit, lambda r: (r.rank, r.id))
+
+    @staticmethod
+    def _matches(search_vector, text, tsquery, query: str) -> ColumnElement:
+        condition = search_vector.op("@@")(tsquery)
+        if len(query) >= MIN_SUBSTRING_LENGTH:
+            condition = or_(condition, text.ilike(f"%{_escape_like(query)}%", escape="\\"))
+        return condition
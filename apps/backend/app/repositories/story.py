@@ -1,10 +1,14 @@
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
-from sqlalchemy import select
-from typing import Optional
+from sqlalchemy import select, func
+from typing import List, Optional
 from uuid import UUID
 
-from app.models.story import Story
-from app.schemas.story import StoryCreate, StoryUpdate
+from app.db.replica import replica_read
+from app.models.episode import Episode
+from app.core.pagination import Page, keyset_query, build_page, decode_cursor
+from app.models.story import Story, StoryRevision
+from app.schemas.story import StoryCreate
 
 
 class StoryRepository:
@@ -17,23 +21,114 @@ class StoryRepository:
         )
         return result.scalar_one_or_none()
 
+    def get_version_by_episode_id(self, episode_id: UUID) -> Optional[Row]:
+        """Get only the story's (id, updated_at), without its content."""
+        result = self.db.execute(
+            select(Story.id, Story.updated_at).where(Story.episode_id == episode_id)
+        )
+        return result.one_or_none()
+
+    def get_episode_ids_with_content(
+        self,
+        project_id: Optional[UUID] = None,
+        episode_ids: Optional[List[UUID]] = None
+    ) -> List[UUID]:
+        """Get IDs of episodes (in a project and/or from a list) whose story is not empty."""
+        query = (
+            select(Episode.id)
+            .join(Story, Story.episode_id == Episode.id)
+            .where(func.length(func.trim(Story.content)) > 0)
+            .order_by(Episode.episode_number)
+        )
+        if project_id is not None:
+            query = query.where(Episode.project_id == project_id)
+        if episode_ids is not None:
+            query = query.where(Episode.id.in_(episode_ids))
+        result = self.db.execute(query)
+        return list(result.scalars().all())
+
     def create(self, story_data: StoryCreate) -> Story:
         story = Story(**story_data.model_dump())
         self.db.add(story)
-        self.db.commit()
-        self.db.refresh(story)
+        self.db.flush()
         return story
 
-    def update(self, episode_id: UUID, story_data: StoryUpdate) -> Optional[Story]:
-        story = self.get_by_episode_id(episode_id)
-        if not story:
-            return None
-        
-        update_data = story_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(story, field, value)
-        
-        self.db.commit()
-        self.db.refresh(story)
+    def get_by_episode_id_for_update(self, episode_id: UUID) -> Optional[Story]:
+        """Get a story and lock its row so concurrent saves get consecutive revision numbers."""
+        result = self.db.execute(
+            select(Story).where(Story.episode_id == episode_id).with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    def save_revision(
+        self,
+        story: Story,
+        content: Optional[str],
+        kind: str,
+        data: bytes,
+        revision: Optional[int] = None
+    ) -> Story:
+        """Record a revision (by default the next one) of a story and materialize its content."""
+        revision = revision if revision is not None else story.revision + 1
+        self.db.add(StoryRevision(
+            story_id=story.id,
+            revision=revision,
+            kind=kind,
+            data=data,
+            content_length=len(content or "")
+        ))
+        story.content = content
+        story.revision = revision
+        self.db.flush()
         return story
 
+    @replica_read
+    def get_revision_chain(self, story_id: UUID, revision: int) -> List[StoryRevision]:
+        """
+        Get the revisions needed to rebuild a revision: its nearest snapshot at
+        or before it, followed by the deltas up to and including it.
+        """
+        snapshot = (
+            select(func.max(StoryRevision.revision))
+            .where(
+                StoryRevision.story_id == story_id,
+                StoryRevision.kind == "snapshot",
+                StoryRevision.revision <= revision
+            )
+            .scalar_subquery()
+        )
+        result = self.db.execute(
+            select(StoryRevision)
+            .where(
+                StoryRevision.story_id == story_id,
+                StoryRevision.revision >= snapshot,
+                StoryRevision.revision <= revision
+            )
+            .order_by(StoryRevision.revision)
+        )
+        return list(result.scalars().all())
+
+    @replica_read
+    def get_revision_page(
+        self,
+        story_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Page[Row]:
+        """Get a page of a story's revisions, newest first, without their data."""
+        after = decode_cursor(cursor, int) if cursor else None
+        result = self.db.execute(
+            keyset_query(
+                select(
+                    StoryRevision.revision,
+                    StoryRevision.kind,
+                    StoryRevision.content_length,
+                    StoryRevision.created_at
+                ).where(StoryRevision.story_id == story_id),
+                (StoryRevision.revision,),
+                after,
+                limit,
+                descending=True
+            )
+        )
+        return build_page(list(result.all()), limit, lambda r: (r.revision,))
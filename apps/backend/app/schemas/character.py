@@ -0,0 +1,35 @@
+from pydantic import BaseModel, ConfigDict
+from uuid import UUID
+
+
+class CharacterAppearanceResponse(BaseModel):
+    """A scene of an episode's latest screenplay that features the character."""
+    episode_id: UUID
+    episode_number: int
+    episode_title: str
+    scene_id: UUID
+    scene_number: int
+    title: str
+    line_count: int  # Lines the character speaks in the scene
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class CharacterLineResponse(BaseModel):
+    """A dialogue line spoken by the character."""
+    episode_id: UUID
+    episode_number: int
+    scene_id: UUID
+    scene_number: int
+    line: str
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EpisodeCharacterResponse(BaseModel):
+    """A character of an episode's latest screenplay with scene and line counts."""
+    name: str
+    scene_count: int
+    line_count: int
+
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional
+from uuid import UUID
+
+from app.schemas.project import ProjectResponse
+from app.schemas.episode import EpisodeResponse
+
+
+class ProjectSummaryResponse(ProjectResponse):
+    """Project with the episode counts shown on the dashboard."""
+    episode_count: int
+    screenplay_episode_count: int  # Episodes that have a generated screenplay
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class EpisodeSummaryResponse(EpisodeResponse):
+    """Episode with story and latest screenplay totals."""
+    latest_screenplay_id: Optional[UUID] = None
+    story_length: int  # Characters in the story
+    scene_count: int  # Scenes in the latest screenplay
+    total_duration_seconds: int  # Sum of scene durations in the latest screenplay
+
+
+class ProjectDashboardResponse(ProjectResponse):
+    """Project with a summary of every episode, for the project detail page."""
+    episodes: List[EpisodeSummaryResponse]
+
+    model_config = ConfigDict(from_attributes=True)
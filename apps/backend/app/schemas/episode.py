@@ -22,6 +22,11 @@ class EpisodeUpdate(BaseModel):
     status: Optional[str] = None
 
 
+class EpisodeClone(BaseModel):
+    project_id: Optional[UUID] = None  # Project to copy into; defaults to the episode's own project
+    title: Optional[str] = None
+
+
 class EpisodeResponse(EpisodeBase):
     id: UUID
     project_id: UUID
@@ -20,6 +20,10 @@ class ProjectUpdate(BaseModel):
     status: Optional[str] = None
 
 
+class ProjectClone(BaseModel):
+    name: Optional[str] = None  # Defaults to the source project's name with " (copy)" appended
+
+
 class ProjectResponse(ProjectBase):
     id: UUID
     created_at: datetime
@@ -27,3 +31,10 @@ class ProjectResponse(ProjectBase):
 
     model_config = ConfigDict(from_attributes=True)
 
+
+
+class ProjectImportResponse(ProjectResponse):
+    episode_count: int
+    story_count: int
+    screenplay_count: int
+    scene_count: int
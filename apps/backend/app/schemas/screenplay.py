@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, model_validator
 from datetime import datetime
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 from uuid import UUID
 
 
@@ -23,12 +23,27 @@ class SceneResponse(SceneBase):
     """Schema for scene response (includes id and timestamps)."""
     id: UUID
     screenplay_id: UUID
+    content_hash: str  # Equal across versions for identical scenes
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
 
+    @classmethod
+    def from_row(cls, row) -> "SceneResponse":
+        """
+        Build a response from a trusted database row or model without validation.
+        
+        Scene columns are already typed by the database, so re-validating the
+        dialogue JSON of every scene only costs time.
+        """
+        return cls.model_construct(**{field: getattr(row, field) for field in cls.model_fields})
+
+
+# Serializes a whole scene list to JSON bytes in one pydantic-core call
+SCENE_LIST_ADAPTER = TypeAdapter(List[SceneResponse])
+
 
 class ScreenplayBase(BaseModel):
     """Base screenplay schema."""
@@ -53,3 +68,69 @@ class ScreenplayResponse(ScreenplayBase):
     class Config:
         from_attributes = True
 
+
+class ScreenplaySummaryResponse(ScreenplayBase):
+    """Schema for a screenplay in an episode's history (without scenes)."""
+    id: UUID
+    episode_id: UUID
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class SceneDiffEntry(BaseModel):
+    """A scene's change between two screenplay versions."""
+    status: Literal["unchanged", "moved", "modified", "added", "removed"]
+    title: str
+    old_scene_number: Optional[int] = None
+    new_scene_number: Optional[int] = None
+    old_content_hash: Optional[str] = None
+    new_content_hash: Optional[str] = None
+
+
+class ScreenplayDiffResponse(BaseModel):
+    """Schema for the scene-level diff between two screenplays of an episode."""
+    from_screenplay_id: UUID
+    to_screenplay_id: UUID
+    scenes: List[SceneDiffEntry]
+
+
+class ScreenplayBatchRequest(BaseModel):
+    """Schema for scheduling screenplay generation for many episodes."""
+    project_id: Optional[UUID] = None
+    episode_ids: Optional[List[UUID]] = None
+    mode: Literal["online", "offline"] = "online"  # offline uses the provider's discounted batch API
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if self.project_id is None and not self.episode_ids:
+            raise ValueError("Either project_id or episode_ids must be provided")
+        return self
+
+
+class ScreenplayBatchEpisodeProgress(BaseModel):
+    """Generation progress for a single episode in a batch."""
+    episode_id: UUID
+    status: str  # pending, running, completed, failed, skipped
+    screenplay_id: Optional[UUID] = None  # The generated screenplay, once completed
+    scene_count: Optional[int] = None
+    error: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class ScreenplayBatchResponse(BaseModel):
+    """Schema for batch job status and per-episode progress."""
+    id: UUID
+    mode: str
+    status: str  # pending, running, submitted, completed, failed
+    provider_batch_id: Optional[str] = None
+    episodes: List[ScreenplayBatchEpisodeProgress]
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,18 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Literal, Optional
+from uuid import UUID
+
+
+class SearchResultResponse(BaseModel):
+    """A story or latest-screenplay scene matching a search query."""
+    kind: Literal["story", "scene"]
+    episode_id: UUID
+    episode_number: int
+    episode_title: str
+    scene_id: Optional[UUID] = None
+    scene_number: Optional[int] = None
+    title: str  # Scene title, or the episode title for story matches
+    snippet: str  # Matching fragments with terms wrapped in <b></b>
+    rank: float
+
+    model_config = ConfigDict(from_attributes=True)
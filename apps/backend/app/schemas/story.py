@@ -1,6 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 from datetime import datetime
-from typing import Optional
+from typing import Optional, List
 from uuid import UUID
 
 
@@ -12,16 +12,53 @@ class StoryCreate(StoryBase):
     episode_id: UUID
 
 
+class StoryTextOp(BaseModel):
+    """Replace `delete` characters at `position` of the base revision with `insert`."""
+    position: int = Field(ge=0)  # Unicode code points into the base revision's text
+    delete: int = Field(default=0, ge=0)
+    insert: str = ""
+
+
 class StoryUpdate(BaseModel):
-    content: Optional[str] = None
+    content: Optional[str] = None  # Full replacement content
+    ops: Optional[List[StoryTextOp]] = None  # Or only the edits made since base_revision
+    base_revision: Optional[int] = None  # Revision the edit is based on; rejected if the story has moved on
+
+    @model_validator(mode="after")
+    def check_edit(self):
+        if self.ops is not None:
+            if "content" in self.model_fields_set:
+                raise ValueError("Provide either content or ops, not both")
+            if self.base_revision is None:
+                raise ValueError("base_revision is required with ops")
+        return self
 
 
 class StoryResponse(StoryBase):
     id: UUID
     episode_id: UUID
+    revision: int
     created_at: datetime
     updated_at: datetime
 
     class Config:
         from_attributes = True
 
+
+class StoryRevisionSummaryResponse(BaseModel):
+    """Schema for a revision in a story's history (without content)."""
+    revision: int
+    kind: str  # snapshot or delta
+    content_length: int
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class StoryRevisionResponse(BaseModel):
+    """Schema for a story's content as of a revision."""
+    story_id: UUID
+    revision: int
+    content: str
+    created_at: datetime
@@ -1,6 +1,8 @@
 from app.services.ai.base_ai_service import BaseAIService
 from app.services.ai.openai_service import OpenAIService
 from app.services.ai.openai_instruction_generator import OpenAIInstructionGenerator
+from app.services.ai.stub_ai_service import StubAIService
+from app.services.ai.ai_service_factory import AIServiceFactory
 from app.services.ai.video import (
     BaseVideoGenerationService,
     StableVideoDiffusionService,
@@ -13,6 +15,8 @@ __all__ = [
     "BaseAIService",
     "OpenAIService",
     "OpenAIInstructionGenerator",
+    "StubAIService",
+    "AIServiceFactory",
     "BaseVideoGenerationService",
     "StableVideoDiffusionService",
     "AnimateDiffService",
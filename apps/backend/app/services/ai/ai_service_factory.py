@@ -0,0 +1,58 @@
+import logging
+from typing import Optional
+
+from app.core.config import get_settings
+from app.services.ai.base_ai_service import BaseAIService
+from app.services.ai.openai_service import OpenAIService
+from app.services.ai.stub_ai_service import StubAIService
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class AIServiceFactory:
+    """Factory for creating screenplay AI service instances."""
+    
+    SERVICE_TYPES = {
+        "openai": OpenAIService,  # OpenAI, or any OpenAI-compatible server via OPENAI_BASE_URL
+        "stub": StubAIService,  # Deterministic in-process stub, no network
+    }
+    
+    @classmethod
+    def create_service(cls, provider: Optional[str] = None) -> BaseAIService:
+        """
+        Create a screenplay AI service instance.
+        
+        Args:
+            provider: Provider to create. If None, uses AI_PROVIDER from settings.
+        
+        Returns:
+            BaseAIService: Instance of the requested provider
+            
+        Raises:
+            ValueError: If provider is invalid or misconfigured
+        """
+        if provider is None:
+            provider = getattr(settings, 'AI_PROVIDER', 'openai')
+        
+        provider = provider.lower()
+        
+        if provider not in cls.SERVICE_TYPES:
+            available = ", ".join(cls.SERVICE_TYPES.keys())
+            raise ValueError(
+                f"Invalid AI provider: {provider}. "
+                f"Available providers: {available}"
+            )
+        
+        logger.info(f"Creating {provider} AI service")
+        return cls.SERVICE_TYPES[provider]()
+    
+    @classmethod
+    def get_available_providers(cls) -> list[str]:
+        """
+        Get list of available providers.
+        
+        Returns:
+            list[str]: List of available provider names
+        """
+        return list(cls.SERVICE_TYPES.keys())
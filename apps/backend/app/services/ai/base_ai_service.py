@@ -1,11 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Dict, List, Optional
 from app.schemas.screenplay import SceneBase
 
 
 class BaseAIService(ABC):
     """Abstract base class for AI services that generate screenplays from stories."""
     
+    # Whether submit_screenplay_batch/get_screenplay_batch_results are implemented (offline batch jobs)
+    supports_batch: bool = False
+    
     @abstractmethod
     async def generate_screenplay(self, story_content: str) -> List[SceneBase]:
         """
@@ -22,3 +25,27 @@ class BaseAIService(ABC):
         """
         pass
 
+    
+    async def submit_screenplay_batch(self, stories: Dict[str, str]) -> str:
+        """
+        Submit screenplay requests for offline (provider-side) batch processing.
+        
+        Args:
+            stories: Story content keyed by a caller-chosen custom ID
+            
+        Returns:
+            The provider batch ID
+            
+        Raises:
+            NotImplementedError: If the provider has no batch API
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch submission")
+    
+    async def get_screenplay_batch_results(self, batch_id: str) -> Optional[Dict[str, List[SceneBase]]]:
+        """
+        Fetch the results of a submitted batch.
+        
+        Returns:
+            None while the batch is still running, otherwise scenes keyed by custom ID
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support batch submission")
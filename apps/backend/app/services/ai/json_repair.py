@@ -0,0 +1,163 @@
+"""Tolerant parser for slightly malformed JSON returned by language models.
+
+Handles the failure modes we see in practice:
+
+- responses wrapped in Markdown code fences or surrounded by prose
+- trailing commas before ``}`` or ``]``
+- unescaped double quotes and raw newlines inside string values
+- truncated output (cut off mid-string or mid-object), which is closed at
+  the last complete value so everything before the cut is kept
+"""
+import json
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+@dataclass
+class RepairResult:
+    """Outcome of :func:`repair_json`."""
+    data: Any
+    repaired: bool  # True if the raw text was not valid JSON
+    truncated: bool  # True if unterminated strings/containers had to be closed
+
+
+def repair_json(text: str) -> RepairResult:
+    """
+    Parse ``text`` as JSON, repairing common defects if necessary.
+    
+    Args:
+        text: Raw model output
+        
+    Returns:
+        RepairResult with the parsed data
+        
+    Raises:
+        ValueError: If the text cannot be repaired into valid JSON
+    """
+    candidate = _strip_wrapping(text)
+    try:
+        # raw_decode stops at the end of the first value, ignoring any prose after it
+        data, _ = json.JSONDecoder().raw_decode(candidate)
+        return RepairResult(data=data, repaired=False, truncated=False)
+    except json.JSONDecodeError:
+        pass
+    
+    repaired_text, truncated = _repair(candidate)
+    try:
+        data = json.loads(repaired_text)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Unable to repair JSON: {str(e)}") from e
+    return RepairResult(data=data, repaired=True, truncated=truncated)
+
+
+def _strip_wrapping(text: str) -> str:
+    """Drop code fences and any prose before the first ``{`` or ``[``."""
+    stripped = text.strip()
+    if stripped.startswith("```"):
+        stripped = stripped.split("\n", 1)[1] if "\n" in stripped else ""
+        if stripped.rstrip().endswith("```"):
+            stripped = stripped.rstrip()[:-3]
+    starts = [i for i in (stripped.find("{"), stripped.find("[")) if i != -1]
+    if starts:
+        stripped = stripped[min(starts):]
+    return stripped.strip()
+
+
+def _next_significant(text: str, index: int) -> Tuple[Optional[str], int]:
+    """Return the next non-whitespace character at or after ``index`` and its position."""
+    while index < len(text) and text[index] in " \t\r\n":
+        index += 1
+    if index >= len(text):
+        return None, index
+    return text[index], index
+
+
+def _closes_string(text: str, index: int) -> bool:
+    """Decide whether the quote at ``index`` terminates the current string."""
+    nxt, pos = _next_significant(text, index + 1)
+    if nxt is None or nxt in ":}]":
+        return True
+    if nxt == ",":
+        after, _ = _next_significant(text, pos + 1)
+        return after is None or after in '"{[]}-0123456789tfn'
+    return False
+
+
+def _repair(text: str) -> Tuple[str, bool]:
+    out: List[str] = []
+    stack: List[str] = []
+    # (output length, stack depth) after the last complete value
+    safe_point: Optional[Tuple[int, int]] = None
+    in_string = False
+    escaped = False
+    i = 0
+    
+    while i < len(text):
+        char = text[i]
+        if in_string:
+            if escaped:
+                out.append(char)
+                escaped = False
+            elif char == "\\":
+                out.append(char)
+                escaped = True
+            elif char == '"':
+                if _closes_string(text, i):
+                    out.append(char)
+                    in_string = False
+                else:
+                    out.append('\\"')
+            elif char == "\n":
+                out.append("\\n")
+            elif char == "\r":
+                out.append("\\r")
+            elif char == "\t":
+                out.append("\\t")
+            else:
+                out.append(char)
+            i += 1
+            continue
+        
+        if char == '"':
+            in_string = True
+            out.append(char)
+        elif char in _CLOSERS:
+            stack.append(char)
+            out.append(char)
+        elif char in "}]":
+            # Drop a trailing comma before the closer
+            while out and out[-1] in " \t\r\n":
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack:
+                stack.pop()
+            out.append(char)
+            safe_point = (len(out), len(stack))
+            if not stack:
+                # The top-level value is complete; whatever follows is prose
+                break
+        elif char == ",":
+            nxt, _ = _next_significant(text, i + 1)
+            if nxt in ("}", "]"):
+                i += 1
+                continue
+            safe_point = (len(out), len(stack))
+            out.append(char)
+        else:
+            out.append(char)
+        i += 1
+    
+    truncated = in_string or bool(stack)
+    if not truncated:
+        return "".join(out), False
+    
+    # Cut back to the last complete value and close the open containers.
+    if safe_point is None:
+        raise ValueError("Unable to repair JSON: no complete value before truncation")
+    length, depth = safe_point
+    repaired = "".join(out[:length]).rstrip().rstrip(",")
+    closers = "".join(_CLOSERS[opener] for opener in reversed(stack[:depth]))
+    return repaired + closers, True
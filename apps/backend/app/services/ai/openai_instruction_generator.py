@@ -1,4 +1,7 @@
 """Utility class for generating OpenAI instructions/prompts."""
+import copy
+
+from app.schemas.screenplay import SceneBase
 
 
 class OpenAIInstructionGenerator:
@@ -68,3 +71,65 @@ IMPORTANT:
 - Include all important story elements
 - Always return valid JSON format"""
 
+
+    
+    @staticmethod
+    def generate_screenplay_schema() -> dict:
+        """
+        Generate the JSON schema for structured screenplay output.
+        
+        The scene schema is derived from SceneBase and tightened for strict
+        structured output: every object lists all of its properties as required
+        and forbids additional properties. Dialogue entries, which SceneBase types
+        as free-form string maps, are pinned to {character, line} objects.
+        
+        Returns:
+            A JSON schema dict describing {"scenes": [SceneBase, ...]}
+        """
+        scene_schema = copy.deepcopy(SceneBase.model_json_schema())
+        scene_schema.pop("title", None)
+        for prop in scene_schema["properties"].values():
+            prop.pop("title", None)
+        scene_schema["properties"]["dialogue"]["items"] = {
+            "type": "object",
+            "properties": {
+                "character": {"type": "string"},
+                "line": {"type": "string"},
+            },
+            "required": ["character", "line"],
+            "additionalProperties": False,
+        }
+        scene_schema["required"] = list(scene_schema["properties"].keys())
+        scene_schema["additionalProperties"] = False
+        
+        return {
+            "type": "object",
+            "properties": {
+                "scenes": {"type": "array", "items": scene_schema},
+            },
+            "required": ["scenes"],
+            "additionalProperties": False,
+        }
+    
+    @staticmethod
+    def generate_continuation_input(story_content: str, completed_titles: list[str]) -> str:
+        """
+        Generate the user input for re-requesting the missing tail of a screenplay.
+        
+        Args:
+            story_content: The original story text
+            completed_titles: Titles of the scenes already generated, in order
+            
+        Returns:
+            An input string asking the model for the remaining scenes only
+        """
+        completed = "\n".join(
+            f"{number}. {title}" for number, title in enumerate(completed_titles, start=1)
+        )
+        next_number = len(completed_titles) + 1
+        return (
+            f"Convert the following story into a professional screenplay:\n\n{story_content}\n\n"
+            f"The first {len(completed_titles)} scenes have already been written:\n{completed}\n\n"
+            f"Continue the screenplay from scene {next_number} to the end of the story. "
+            f"Return ONLY the remaining scenes, numbered from {next_number}, in the same JSON format."
+        )
@@ -1,34 +1,62 @@
+import asyncio
 import json
 import logging
-from typing import List
+from typing import Dict, List, Optional, Tuple
 from openai import AsyncOpenAI
-from openai import APIError
+from openai import APIError, BadRequestError, RateLimitError
 
 from app.core.config import get_settings
+from app.core.metrics import metrics
 from app.services.ai.base_ai_service import BaseAIService
+from app.services.ai.json_repair import repair_json
 from app.services.ai.openai_instruction_generator import OpenAIInstructionGenerator
+from app.services.ai.rate_limiter import AIRateLimitError, estimate_tokens, get_rate_limiter, retry_delay_from_headers
 from app.schemas.screenplay import SceneBase
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
+# A 400 naming one of these and saying it is not supported means the model cannot do structured output
+_STRUCTURED_OUTPUT_MARKERS = ("response_format", "json_schema", "text.format")
+
+
+def _rejects_structured_output(error: BadRequestError) -> bool:
+    """Whether a 400 says the model does not accept the json_schema output format."""
+    detail = " ".join(str(part) for part in (error.param, error.message) if part).lower()
+    return "support" in detail and any(marker in detail for marker in _STRUCTURED_OUTPUT_MARKERS)
+
 
 class OpenAIService(BaseAIService):
     """OpenAI implementation of the AI service for screenplay generation."""
     
-    def __init__(self):
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY is not set in configuration")
+    supports_batch = True
+    
+    def __init__(self, base_url: Optional[str] = None):
+        base_url = base_url or settings.OPENAI_BASE_URL or None
+        api_key = settings.OPENAI_API_KEY
+        if not api_key:
+            if not base_url:
+                raise ValueError("OPENAI_API_KEY is not set in configuration")
+            # Local OpenAI-compatible servers usually ignore the key, but the client requires one
+            api_key = "not-needed"
         
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        # Retries are handled here so they go through the shared rate limiter
+        self.client = AsyncOpenAI(api_key=api_key, base_url=base_url, max_retries=0)
+        self.base_url = base_url
         self.model = settings.OPENAI_MODEL
         self.temperature = settings.OPENAI_TEMPERATURE
         self.max_tokens = getattr(settings, 'OPENAI_MAX_TOKENS', 4000)
+        self.structured_output = settings.OPENAI_STRUCTURED_OUTPUT
+        self.max_continuations = settings.OPENAI_MAX_CONTINUATIONS
+        self.max_retries = settings.OPENAI_MAX_RETRIES
     
     async def generate_screenplay(self, story_content: str) -> List[SceneBase]:
         """
         Generate a screenplay from story content using OpenAI.
         
+        Malformed or truncated responses are repaired rather than discarded:
+        valid scenes are kept and only the missing tail is re-requested.
+        
         Args:
             story_content: The story text to convert to screenplay
             
@@ -46,45 +74,32 @@ class OpenAIService(BaseAIService):
         user_input = f"Convert the following story into a professional screenplay:\n\n{story_content}"
         
         try:
-            # Using AsyncOpenAI for native async support
-            # Following OpenAI text generation best practices from https://platform.openai.com/docs/guides/text
-            # Using responses.create API for text generation
-            # Instructions contain format requirements, input contains the story
-            # Note: Some models (like gpt-5-nano) may not support temperature or max_tokens parameters
-            response = await self.client.responses.create(
-                model=self.model,
-                instructions=instructions,
-                input=user_input
-            )
-            
-            logger.info("OpenAI API response received. Response type: %s", type(response).__name__)
-            logger.debug("OpenAI response object attributes: %s", dir(response))
-            
-            content = response.output_text
-            logger.info("OpenAI response output_text (length: %d chars): %s", len(content) if content else 0, content)
-            
-            if not content:
-                raise ValueError("Empty response from OpenAI")
+            scenes, truncated = await self._request_scenes(instructions, user_input)
+            if not scenes:
+                raise ValueError("No scenes found in AI response")
             
-            # Parse JSON response
-            try:
-                response_data = json.loads(content)
-            except json.JSONDecodeError as e:
-                logger.error(
-                    "Failed to parse JSON response. Error at position %d (line %d, column %d). "
-                    "Content preview (first 500 chars): %s",
-                    e.pos, e.lineno, e.colno, content[:500] if content else "None"
+            continuations = 0
+            while truncated and continuations < self.max_continuations:
+                continuations += 1
+                metrics.increment("openai_continuations_total")
+                logger.info(
+                    "Screenplay response was truncated after %d scenes, requesting the remaining scenes "
+                    "(continuation %d of %d)",
+                    len(scenes), continuations, self.max_continuations
                 )
-                logger.error("Full content for debugging: %s", content)
-                raise Exception(f"Failed to parse AI response as JSON: {str(e)}")
-            
-            # Extract scenes from response
-            scenes_data = response_data.get("scenes", [])
-            if not scenes_data:
-                raise ValueError("No scenes found in AI response")
+                continuation_input = OpenAIInstructionGenerator.generate_continuation_input(
+                    story_content, [scene.title for scene in scenes]
+                )
+                tail, truncated = await self._request_scenes(instructions, continuation_input)
+                if not tail:
+                    break
+                for offset, scene in enumerate(tail, start=len(scenes) + 1):
+                    scene.scene_number = offset
+                scenes.extend(tail)
             
-            # Convert to SceneBase objects
-            scenes = [SceneBase(**scene_data) for scene_data in scenes_data]
+            if truncated:
+                logger.warning("Screenplay is still truncated after %d continuations; keeping %d scenes",
+                               continuations, len(scenes))
             
             return scenes
             
@@ -94,4 +109,236 @@ class OpenAIService(BaseAIService):
         except Exception as e:
             logger.error("Failed to generate screenplay: %s", str(e), exc_info=True)
             raise
-
+    
+    async def _request_scenes(self, instructions: str, user_input: str) -> Tuple[List[SceneBase], bool]:
+        """
+        Run a single screenplay request and parse its scenes.
+        
+        Returns:
+            Tuple of (valid scenes, whether the response was truncated)
+        """
+        response = await self._create_response(instructions, user_input)
+        metrics.increment("openai_responses_total")
+        
+        return self._parse_response(response.output_text, getattr(response, "status", None), response)
+    
+    def _parse_response(self, content: Optional[str], status: Optional[str], response=None) -> Tuple[List[SceneBase], bool]:
+        """
+        Parse (and if necessary repair) a response body into scenes.
+        
+        Returns:
+            Tuple of (valid scenes, whether the response was truncated)
+        """
+        logger.info("OpenAI response received (length: %d chars)", len(content) if content else 0)
+        logger.debug("OpenAI response output_text: %s", content)
+        
+        if not content:
+            raise ValueError("Empty response from OpenAI")
+        
+        try:
+            result = repair_json(content)
+        except ValueError as e:
+            logger.error(
+                "Failed to parse JSON response. Content preview (first 500 chars): %s", content[:500]
+            )
+            raise Exception(f"Failed to parse AI response as JSON: {str(e)}")
+        
+        scenes_data = result.data.get("scenes", []) if isinstance(result.data, dict) else []
+        scenes, dropped = self._parse_scenes(scenes_data)
+        truncated = result.truncated or status == "incomplete"
+        
+        if result.repaired or dropped:
+            metrics.increment("openai_responses_repaired_total")
+            logger.warning(
+                "Repaired AI response: kept %d scenes, dropped %d invalid scenes (truncated: %s)",
+                len(scenes), dropped, truncated
+            )
+            if scenes:
+                # Output tokens that would have been paid again by a full regeneration
+                metrics.increment("openai_tokens_saved_total", self._output_tokens(response, content))
+        
+        return scenes, truncated
+    
+    def _text_format(self) -> dict:
+        return {
+            "format": {
+                "type": "json_schema",
+                "name": "screenplay",
+                "schema": OpenAIInstructionGenerator.generate_screenplay_schema(),
+                "strict": True,
+            }
+        }
+    
+    async def _create_response(self, instructions: str, user_input: str):
+        """Call the Responses API, requesting structured output when supported."""
+        # Using AsyncOpenAI for native async support
+        # Following OpenAI text generation best practices from https://platform.openai.com/docs/guides/text
+        # Instructions contain format requirements, input contains the story
+        # Note: Some models (like gpt-5-nano) may not support temperature or max_tokens parameters
+        tokens = estimate_tokens(instructions + user_input, self.max_tokens)
+        if self.structured_output:
+            try:
+                return await self._call_with_rate_limit(
+                    tokens,
+                    model=self.model,
+                    instructions=instructions,
+                    input=user_input,
+                    text=self._text_format(),
+                )
+            except BadRequestError as e:
+                if not _rejects_structured_output(e):
+                    raise
+                # Model does not support structured output; fall back to plain JSON for this service
+                logger.warning("Structured output not supported by %s, falling back: %s", self.model, str(e))
+                self.structured_output = False
+        
+        return await self._call_with_rate_limit(
+            tokens,
+            model=self.model,
+            instructions=instructions,
+            input=user_input
+        )
+    
+    async def _call_with_rate_limit(self, tokens: int, **request):
+        """
+        Create a response once the shared rate limiter admits the call.
+        
+        429 responses are retried after the delay the provider asks for
+        (falling back to exponential backoff), up to OPENAI_MAX_RETRIES times.
+        
+        Raises:
+            AIRateLimitError: If the call is still rate limited after all retries
+        """
+        limiter = get_rate_limiter(self.model)
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(tokens)
+            try:
+                return await self.client.responses.create(**request)
+            except RateLimitError as e:
+                metrics.increment("openai_rate_limited_total")
+                delay = retry_delay_from_headers(e.response.headers) or float(2 ** attempt)
+                if attempt == self.max_retries:
+                    raise AIRateLimitError(f"OpenAI rate limit exceeded: {str(e)}", retry_after=delay)
+                logger.warning(
+                    "OpenAI rate limited %s (attempt %d of %d), retrying in %.2f seconds",
+                    self.model, attempt + 1, self.max_retries + 1, delay
+                )
+                await asyncio.sleep(delay)
+    
+    async def submit_screenplay_batch(self, stories: Dict[str, str]) -> str:
+        """
+        Submit screenplay requests through the OpenAI Batch API.
+        
+        Batch requests are billed at a discount and complete within 24 hours,
+        which suits non-urgent bulk generation.
+        
+        Args:
+            stories: Story content keyed by a caller-chosen custom ID
+            
+        Returns:
+            The provider batch ID
+        """
+        instructions = OpenAIInstructionGenerator.generate_screenplay_instructions()
+        lines = []
+        for custom_id, story_content in stories.items():
+            body = {
+                "model": self.model,
+                "instructions": instructions,
+                "input": f"Convert the following story into a professional screenplay:\n\n{story_content}",
+            }
+            if self.structured_output:
+                body["text"] = self._text_format()
+            lines.append(json.dumps(
+                {"custom_id": custom_id, "method": "POST", "url": "/v1/responses", "body": body},
+                ensure_ascii=False
+            ))
+        
+        try:
+            input_file = await self.client.files.create(
+                file=("screenplays.jsonl", "\n".join(lines).encode("utf-8")),
+                purpose="batch",
+            )
+            batch = await self.client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/responses",
+                completion_window="24h",
+            )
+        except APIError as e:
+            logger.error("OpenAI API error while submitting batch: %s", str(e))
+            raise Exception(f"OpenAI API error: {str(e)}")
+        
+        logger.info("Submitted OpenAI batch %s with %d screenplay requests", batch.id, len(lines))
+        return batch.id
+    
+    async def get_screenplay_batch_results(self, batch_id: str) -> Optional[Dict[str, List[SceneBase]]]:
+        """
+        Fetch the results of a submitted screenplay batch.
+        
+        Returns:
+            None while the batch is still running, otherwise scenes keyed by
+            custom ID. Requests that failed are omitted.
+            
+        Raises:
+            Exception: If the batch failed, expired or was cancelled
+        """
+        batch = await self.client.batches.retrieve(batch_id)
+        if batch.status in ("validating", "in_progress", "finalizing", "cancelling"):
+            return None
+        if batch.status != "completed":
+            raise Exception(f"OpenAI batch {batch_id} ended with status {batch.status}")
+        if not batch.output_file_id:
+            return {}
+        
+        output = await self.client.files.content(batch.output_file_id)
+        results: Dict[str, List[SceneBase]] = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            response = record.get("response") or {}
+            if record.get("error") or response.get("status_code") != 200:
+                logger.warning("Batch request %s failed: %s", record.get("custom_id"), record.get("error"))
+                continue
+            body = response.get("body", {})
+            try:
+                scenes, _ = self._parse_response(self._extract_output_text(body), body.get("status"))
+            except Exception as e:
+                logger.warning("Could not parse batch result %s: %s", record.get("custom_id"), str(e))
+                continue
+            if scenes:
+                results[record["custom_id"]] = scenes
+        return results
+    
+    @staticmethod
+    def _extract_output_text(body: dict) -> str:
+        """Collect output_text parts from a raw Responses API body."""
+        parts = []
+        for item in body.get("output", []):
+            if item.get("type") != "message":
+                continue
+            for content in item.get("content", []):
+                if content.get("type") == "output_text":
+                    parts.append(content.get("text", ""))
+        return "".join(parts)
+    
+    @staticmethod
+    def _parse_scenes(scenes_data: list) -> Tuple[List[SceneBase], int]:
+        """Convert raw scene dicts to SceneBase objects, skipping invalid ones."""
+        scenes = []
+        dropped = 0
+        for scene_data in scenes_data:
+            try:
+                scenes.append(SceneBase(**scene_data))
+            except (TypeError, ValueError) as e:
+                dropped += 1
+                logger.debug("Dropping invalid scene from AI response: %s", str(e))
+        return scenes, dropped
+    
+    @staticmethod
+    def _output_tokens(response, content: str) -> int:
+        usage = getattr(response, "usage", None)
+        output_tokens: Optional[int] = getattr(usage, "output_tokens", None) if usage else None
+        if output_tokens:
+            return output_tokens
+        # Rough fallback when the provider does not report usage
+        return len(content) // 4
@@ -0,0 +1,238 @@
+"""Token-bucket rate limiting for AI provider calls.
+
+Each model gets a limiter with two buckets: one for requests per minute and
+one for tokens per minute. Callers acquire one request plus an estimate of
+the tokens the call will consume, queueing until both buckets can cover it.
+
+Two backends are available (AI_RATE_LIMIT_BACKEND):
+
+- ``local``: buckets live in process memory; limits apply per worker.
+- ``postgres``: bucket state lives in ``ai_rate_limit_buckets`` and is
+  updated under a transaction-scoped advisory lock, so every worker process
+  draws from the same budget. Refills use the database clock.
+"""
+import asyncio
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Mapping, Optional
+
+from sqlalchemy import text
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+
+settings = get_settings()
+
+
+class AIRateLimitError(Exception):
+    """Raised when an AI call cannot be admitted within the allowed queue time."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def estimate_tokens(text: str, max_output_tokens: int = 0) -> int:
+    """
+    Estimate the tokens a request will consume.
+    
+    Uses UTF-8 bytes / 4, which is conservative for Malayalam text (multi-byte
+    characters that tokenize poorly), plus the output budget.
+    """
+    return math.ceil(len(text.encode("utf-8")) / 4) + max_output_tokens
+
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|s|m|h)")
+_DURATION_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse provider durations such as "20ms", "1.5s" or "6m0s" into seconds."""
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def retry_delay_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+    """
+    Read how long to wait before retrying from a 429 response's headers.
+    
+    Checks ``retry-after-ms``, ``retry-after`` and the ``x-ratelimit-reset-*``
+    hints, returning the longest applicable delay in seconds.
+    """
+    delays = []
+    if headers.get("retry-after-ms"):
+        try:
+            delays.append(float(headers["retry-after-ms"]) / 1000)
+        except ValueError:
+            pass
+    if headers.get("retry-after"):
+        try:
+            delays.append(float(headers["retry-after"]))
+        except ValueError:
+            pass  # HTTP-date form is not used by the providers we call
+    for name in ("x-ratelimit-reset-requests", "x-ratelimit-reset-tokens"):
+        if headers.get(name):
+            delay = _parse_duration(headers[name])
+            if delay is not None:
+                delays.append(delay)
+    return max(delays) if delays else None
+
+
+class TokenBucket:
+    """Continuously refilling token bucket with a per-minute rate."""
+    
+    def __init__(self, per_minute: int, tokens: Optional[float] = None, updated_at: Optional[float] = None):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity if tokens is None else tokens
+        self.updated_at = updated_at
+    
+    def refill(self, now: float) -> None:
+        if self.updated_at is not None:
+            self.tokens = min(self.capacity, self.tokens + max(0.0, now - self.updated_at) * self.rate)
+        self.updated_at = now
+    
+    def wait_time(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 if available now). Call refill first."""
+        # Requests larger than the bucket wait for a full bucket instead of forever
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+    
+    def take(self, amount: float) -> None:
+        self.tokens -= min(amount, self.capacity)
+
+
+class ModelRateLimiter(ABC):
+    """Requests-per-minute and tokens-per-minute limiter for a single model."""
+    
+    def __init__(self, model: str, requests_per_minute: int, tokens_per_minute: int, max_wait_seconds: float):
+        self.model = model
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self.max_wait_seconds = max_wait_seconds
+    
+    async def acquire(self, tokens: int) -> float:
+        """
+        Queue until one request and ``tokens`` tokens are available, then take them.
+        
+        Returns:
+            Seconds spent waiting
+            
+        Raises:
+            AIRateLimitError: If admission would take longer than max_wait_seconds
+        """
+        start = time.monotonic()
+        while True:
+            wait = await self._try_take(tokens)
+            waited = time.monotonic() - start
+            if wait <= 0:
+                metrics.observe("ai_rate_limit_queue_wait_seconds", waited)
+                return waited
+            if waited + wait > self.max_wait_seconds:
+                metrics.increment("ai_rate_limit_rejected_total")
+                raise AIRateLimitError(
+                    f"Rate limit for {self.model} exceeded; retry in {wait:.1f} seconds",
+                    retry_after=wait
+                )
+            await asyncio.sleep(wait)
+    
+    @abstractmethod
+    async def _try_take(self, tokens: int) -> float:
+        """Take capacity if available; otherwise return the seconds to wait."""
+        pass
+    
+    def _take_from(self, requests: TokenBucket, token_bucket: TokenBucket, tokens: int, now: float) -> float:
+        requests.refill(now)
+        token_bucket.refill(now)
+        wait = max(requests.wait_time(1), token_bucket.wait_time(tokens))
+        if wait <= 0:
+            requests.take(1)
+            token_bucket.take(tokens)
+        return wait
+
+
+class LocalModelRateLimiter(ModelRateLimiter):
+    """Limiter whose buckets live in this process."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.requests = TokenBucket(self.requests_per_minute)
+        self.tokens = TokenBucket(self.tokens_per_minute)
+    
+    async def _try_take(self, tokens: int) -> float:
+        return self._take_from(self.requests, self.tokens, tokens, time.monotonic())
+
+
+class PostgresModelRateLimiter(ModelRateLimiter):
+    """Limiter whose buckets are shared by all workers through Postgres."""
+    
+    async def _try_take(self, tokens: int) -> float:
+        return await run_in_threadpool(self._try_take_sync, tokens)
+    
+    def _try_take_sync(self, tokens: int) -> float:
+        # Imported lazily so the local backend works without a database
+        from app.db.session import SessionLocal
+        from app.models.rate_limit import AIRateLimitBucket
+        
+        with SessionLocal() as db:
+            # Serialize access to this model's bucket across workers until commit
+            now = db.execute(
+                text("SELECT pg_advisory_xact_lock(hashtext(:key)), extract(epoch from clock_timestamp())"),
+                {"key": f"ai_rate_limit:{self.model}"}
+            ).one()[1]
+            now = float(now)
+            
+            row = db.get(AIRateLimitBucket, self.model)
+            if row is None:
+                row = AIRateLimitBucket(
+                    model=self.model,
+                    request_tokens=float(self.requests_per_minute),
+                    token_tokens=float(self.tokens_per_minute),
+                    updated_at=now
+                )
+                db.add(row)
+            
+            requests = TokenBucket(self.requests_per_minute, row.request_tokens, row.updated_at)
+            token_bucket = TokenBucket(self.tokens_per_minute, row.token_tokens, row.updated_at)
+            wait = self._take_from(requests, token_bucket, tokens, now)
+            
+            row.request_tokens = requests.tokens
+            row.token_tokens = token_bucket.tokens
+            row.updated_at = now
+            db.commit()
+            return wait
+
+
+_BACKENDS = {
+    "local": LocalModelRateLimiter,
+    "postgres": PostgresModelRateLimiter,
+}
+_limiters: Dict[str, ModelRateLimiter] = {}
+
+
+def get_rate_limiter(model: str) -> ModelRateLimiter:
+    """Get the limiter for a model, creating it on first use."""
+    limiter = _limiters.get(model)
+    if limiter is None:
+        backend = settings.AI_RATE_LIMIT_BACKEND.lower()
+        if backend not in _BACKENDS:
+            available = ", ".join(_BACKENDS.keys())
+            raise ValueError(f"Invalid AI_RATE_LIMIT_BACKEND: {backend}. Available: {available}")
+        limiter = _BACKENDS[backend](
+            model,
+            settings.OPENAI_RPM_LIMIT,
+            settings.OPENAI_TPM_LIMIT,
+            settings.AI_RATE_LIMIT_MAX_WAIT_SECONDS
+        )
+        _limiters[model] = limiter
+    return limiter
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import random
+import re
+import time
+from itertools import count
+from typing import Dict, List, Optional, Tuple
+
+from app.core.config import get_settings
+from app.services.ai.base_ai_service import BaseAIService
+from app.schemas.screenplay import SceneBase
+
+settings = get_settings()
+
+MAX_STUB_SCENES = 40
+
+# Submitted stub batches: batch ID -> (time the results are ready, stories by custom ID).
+# Kept per process, so a batch can only be collected by the process that submitted it.
+_batches: Dict[str, Tuple[float, Dict[str, str]]] = {}
+_batch_numbers = count(1)
+
+
+def generate_stub_scenes(story_content: str) -> List[SceneBase]:
+    """
+    Deterministically derive scenes from a story without calling a model.
+    
+    Each paragraph becomes one scene (long single-paragraph stories are split
+    into groups of sentences), so the same story always yields the same
+    screenplay. Works for Malayalam and English text.
+    
+    Args:
+        story_content: The story text
+        
+    Returns:
+        List of SceneBase objects
+    """
+    chunks = [chunk.strip() for chunk in re.split(r"\n\s*\n", story_content) if chunk.strip()]
+    if len(chunks) == 1:
+        sentences = [s.strip() for s in re.split(r"(?<=[.!?।])\s+", chunks[0]) if s.strip()]
+        chunks = [" ".join(sentences[i:i + 3]) for i in range(0, len(sentences), 3)] or chunks
+    chunks = chunks[:MAX_STUB_SCENES]
+    
+    scenes = []
+    for number, chunk in enumerate(chunks, start=1):
+        first_sentence = re.split(r"(?<=[.!?।])\s+", chunk)[0]
+        scenes.append(SceneBase(
+            scene_number=number,
+            title=f"Scene {number}",
+            duration_seconds=5 + len(chunk) % 26,
+            characters=["Narrator"],
+            dialogue=[{"character": "Narrator", "line": first_sentence}],
+            prompt=f"A photorealistic 3D cinematic scene with natural lighting depicting: {chunk[:400]}"
+        ))
+    return scenes
+
+
+def render_stub_screenplay(story_content: str, start_scene: int = 1) -> str:
+    """Render the stub screenplay (from ``start_scene`` onwards) as the JSON document the real model returns."""
+    scenes = [scene for scene in generate_stub_scenes(story_content) if scene.scene_number >= start_scene]
+    return json.dumps({"scenes": [scene.model_dump() for scene in scenes]}, ensure_ascii=False)
+
+
+class StubAIService(BaseAIService):
+    """
+    Offline AI service that returns deterministic screenplays.
+    
+    Latency, output speed and failures are configurable (STUB_AI_* settings)
+    so the screenplay pipeline can be load-tested without a key or network.
+    Offline batches complete STUB_AI_LATENCY_SECONDS after submission.
+    """
+    
+    supports_batch = True
+    
+    def __init__(self):
+        self.model = "stub"
+        self.temperature = 0.0
+        self.max_tokens = settings.OPENAI_MAX_TOKENS
+        self.latency_seconds = settings.STUB_AI_LATENCY_SECONDS
+        self.tokens_per_second = settings.STUB_AI_TOKENS_PER_SECOND
+        self.failure_rate = settings.STUB_AI_FAILURE_RATE
+        self._random = random.Random(settings.STUB_AI_SEED)
+    
+    async def generate_screenplay(self, story_content: str) -> List[SceneBase]:
+        """
+        Generate a deterministic screenplay from story content.
+        
+        Raises:
+            Exception: When a failure is injected
+        """
+        if not story_content or not story_content.strip():
+            raise ValueError("Story content cannot be empty")
+        
+        scenes = generate_stub_scenes(story_content)
+        delay = self.latency_seconds
+        if self.tokens_per_second > 0:
+            output_chars = sum(len(scene.model_dump_json()) for scene in scenes)
+            delay += (output_chars / 4) / self.tokens_per_second
+        if delay > 0:
+            await asyncio.sleep(delay)
+        
+        if self._random.random() < self.failure_rate:
+            raise Exception("Stub AI service injected failure")
+        return scenes
+    
+    async def submit_screenplay_batch(self, stories: Dict[str, str]) -> str:
+        """Record a batch of stories; returns the stub batch ID."""
+        batch_id = f"batch_stub_{next(_batch_numbers)}"
+        _batches[batch_id] = (time.monotonic() + self.latency_seconds, dict(stories))
+        return batch_id
+    
+    async def get_screenplay_batch_results(self, batch_id: str) -> Optional[Dict[str, List[SceneBase]]]:
+        """
+        Return the scenes for a submitted batch once its latency has passed.
+        
+        Requests hit by an injected failure are omitted, as failed requests
+        are in a provider batch.
+        
+        Raises:
+            Exception: If the batch was not submitted by this process
+        """
+        if batch_id not in _batches:
+            raise Exception(f"Stub batch {batch_id} is unknown to this process")
+        ready_at, stories = _batches[batch_id]
+        if time.monotonic() < ready_at:
+            return None
+        del _batches[batch_id]
+        return {
+            custom_id: generate_stub_scenes(story_content)
+            for custom_id, story_content in stories.items()
+            if self._random.random() >= self.failure_rate
+        }
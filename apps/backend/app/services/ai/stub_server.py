@@ -0,0 +1,110 @@
+"""
+Deterministic OpenAI-compatible stub server for offline testing and load tests.
+
+Implements the subset of the Responses API used by OpenAIService. Latency,
+output speed, failures, 429s and truncation are configured through the
+STUB_AI_* settings.
+
+Usage:
+    uvicorn app.services.ai.stub_server:app --port 6010
+    AI_PROVIDER=openai OPENAI_BASE_URL=http://localhost:6010/v1 uvicorn app.main:app
+"""
+import asyncio
+import itertools
+import random
+import re
+import time
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+from app.core.config import get_settings
+from app.services.ai.stub_ai_service import render_stub_screenplay
+
+settings = get_settings()
+
+app = FastAPI(title="Yashvi Media Studio AI Stub", description="OpenAI-compatible stub for offline testing")
+
+_random = random.Random(settings.STUB_AI_SEED)
+_ids = itertools.count(1)
+
+
+def _error(status_code: int, message: str, error_type: str, headers: dict = None) -> JSONResponse:
+    return JSONResponse(
+        status_code=status_code,
+        content={"error": {"message": message, "type": error_type, "param": None, "code": None}},
+        headers=headers
+    )
+
+
+@app.post("/v1/responses")
+async def create_response(request: Request):
+    body = await request.json()
+    response_number = next(_ids)
+    story_input = body.get("input") or ""
+    if not isinstance(story_input, str):
+        story_input = str(story_input)
+    # Strip the request preamble so the stub sees only the story, and honor
+    # continuation requests for the missing tail of a screenplay
+    story = story_input.split("\n\n", 1)[-1]
+    start_scene = 1
+    continuation = re.search(r"Continue the screenplay from scene (\d+)", story)
+    if continuation:
+        start_scene = int(continuation.group(1))
+        story = story.split("\n\nThe first ", 1)[0]
+    
+    if _random.random() < settings.STUB_AI_RATE_LIMIT_RATE:
+        return _error(
+            429, "Stub rate limit reached", "requests",
+            headers={"retry-after-ms": "500", "x-ratelimit-reset-requests": "500ms"}
+        )
+    
+    text = render_stub_screenplay(story, start_scene) if story.strip() else '{"scenes": []}'
+    status = "completed"
+    if _random.random() < settings.STUB_AI_TRUNCATE_RATE:
+        text = text[: len(text) * 2 // 3]
+        status = "incomplete"
+    
+    input_tokens = len((body.get("instructions") or "") + story_input) // 4
+    output_tokens = len(text) // 4
+    delay = settings.STUB_AI_LATENCY_SECONDS
+    if settings.STUB_AI_TOKENS_PER_SECOND > 0:
+        delay += output_tokens / settings.STUB_AI_TOKENS_PER_SECOND
+    if delay > 0:
+        await asyncio.sleep(delay)
+    
+    if _random.random() < settings.STUB_AI_FAILURE_RATE:
+        return _error(500, "Stub injected failure", "server_error")
+    
+    return {
+        "id": f"resp_stub_{response_number}",
+        "object": "response",
+        "created_at": int(time.time()),
+        "model": body.get("model", "stub"),
+        "status": status,
+        "error": None,
+        "incomplete_details": {"reason": "max_output_tokens"} if status == "incomplete" else None,
+        "instructions": body.get("instructions"),
+        "metadata": {},
+        "output": [
+            {
+                "type": "message",
+                "id": f"msg_stub_{response_number}",
+                "status": status,
+                "role": "assistant",
+                "content": [{"type": "output_text", "text": text, "annotations": []}],
+            }
+        ],
+        "parallel_tool_calls": False,
+        "temperature": None,
+        "tool_choice": "auto",
+        "tools": [],
+        "top_p": None,
+        "usage": {
+            "input_tokens": input_tokens,
+            "input_tokens_details": {"cached_tokens": 0},
+            "output_tokens": output_tokens,
+            "output_tokens_details": {"reasoning_tokens": 0},
+            "total_tokens": input_tokens + output_tokens,
+        },
+    }
@@ -0,0 +1,33 @@
+from sqlalchemy.orm import Session
+from typing import List, Optional
+from uuid import UUID
+
+from app.repositories.character import CharacterRepository
+from app.repositories.episode import EpisodeRepository
+from app.repositories.project import ProjectRepository
+from app.schemas.character import CharacterAppearanceResponse, CharacterLineResponse, EpisodeCharacterResponse
+
+
+class CharacterService:
+    def __init__(self, db: Session):
+        self.repository = CharacterRepository(db)
+        self.project_repository = ProjectRepository(db)
+        self.episode_repository = EpisodeRepository(db)
+
+    def get_appearances(self, project_id: UUID, name: str) -> Optional[List[CharacterAppearanceResponse]]:
+        if not self.project_repository.get_by_id(project_id):
+            return None
+        rows = self.repository.get_appearances(project_id, name)
+        return [CharacterAppearanceResponse.model_validate(row) for row in rows]
+
+    def get_lines(self, project_id: UUID, name: str) -> Optional[List[CharacterLineResponse]]:
+        if not self.project_repository.get_by_id(project_id):
+            return None
+        rows = self.repository.get_lines(project_id, name)
+        return [CharacterLineResponse.model_validate(row) for row in rows]
+
+    def get_episode_characters(self, episode_id: UUID) -> Optional[List[EpisodeCharacterResponse]]:
+        if not self.episode_repository.get_by_id(episode_id):
+            return None
+        rows = self.repository.get_episode_characters(episode_id)
+        return [EpisodeCharacterResponse.model_validate(row) for row in rows]
@@ -0,0 +1,39 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+
+from app.core.pagination import Page
+from app.repositories.dashboard import DashboardRepository
+from app.repositories.project import ProjectRepository
+from app.schemas.dashboard import ProjectSummaryResponse, EpisodeSummaryResponse, ProjectDashboardResponse
+from app.schemas.project import ProjectResponse
+
+
+class DashboardService:
+    def __init__(self, db: Session):
+        self.repository = DashboardRepository(db)
+        self.project_repository = ProjectRepository(db)
+
+    def get_project_summaries(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[ProjectSummaryResponse]:
+        page = self.repository.get_project_summaries(limit=limit, cursor=cursor, include_total=include_total)
+        return Page(
+            items=[ProjectSummaryResponse.model_validate(row) for row in page.items],
+            next_cursor=page.next_cursor,
+            total=page.total
+        )
+
+    def get_project_dashboard(self, project_id: UUID) -> Optional[ProjectDashboardResponse]:
+        project = self.project_repository.get_by_id(project_id)
+        if not project:
+            return None
+        
+        episodes = self.repository.get_episode_summaries(project_id)
+        return ProjectDashboardResponse(
+            **ProjectResponse.model_validate(project).model_dump(),
+            episodes=[EpisodeSummaryResponse.model_validate(row) for row in episodes]
+        )
@@ -2,9 +2,15 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 
+from app.core.cache import story_cache, scenes_cache
+from app.core.http_cache import page_etag
+from app.core.pagination import Page
+from app.repositories.clone import CloneRepository
 from app.repositories.episode import EpisodeRepository
-from app.schemas.episode import EpisodeCreate, EpisodeUpdate, EpisodeResponse
+from app.repositories.project import ProjectRepository
+from app.schemas.episode import EpisodeClone, EpisodeCreate, EpisodeUpdate, EpisodeResponse
 from app.services.story import StoryService
+from app.services.story_buffer import story_buffer
 from app.schemas.story import StoryCreate
 
 
@@ -12,9 +18,33 @@ class EpisodeService:
     def __init__(self, db: Session):
         self.repository = EpisodeRepository(db)
 
-    def get_episodes_by_project(self, project_id: UUID) -> List[EpisodeResponse]:
-        episodes = self.repository.get_all_by_project(project_id)
-        return [EpisodeResponse.model_validate(ep) for ep in episodes]
+    def get_episodes_by_project(
+        self,
+        project_id: UUID,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> Page[EpisodeResponse]:
+        page = self.repository.get_page_by_project(
+            project_id, limit=limit, cursor=cursor, include_total=include_total
+        )
+        return Page(
+            items=[EpisodeResponse.model_validate(ep) for ep in page.items],
+            next_cursor=page.next_cursor,
+            total=page.total
+        )
+
+    def get_episodes_etag(
+        self,
+        project_id: UUID,
+        limit: Optional[int] = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False
+    ) -> str:
+        """ETag of an episodes page, computed from row versions only."""
+        return page_etag(self.repository.get_page_by_project(
+            project_id, limit=limit, cursor=cursor, include_total=include_total, versions_only=True
+        ))
 
     def get_episode(self, episode_id: UUID) -> Optional[EpisodeResponse]:
         episode = self.repository.get_by_id(episode_id)
@@ -38,6 +68,29 @@ class EpisodeService:
             return EpisodeResponse.model_validate(episode)
         return None
 
+    def clone_episode(self, episode_id: UUID, clone_data: EpisodeClone) -> Optional[EpisodeResponse]:
+        """
+        Copy an episode with its story, screenplays and scenes to the end of a project.
+        
+        Returns:
+            The new episode, or None if the episode or target project does not exist
+        """
+        source = self.repository.get_by_id(episode_id)
+        if not source:
+            return None
+        project_id = clone_data.project_id or source.project_id
+        if project_id != source.project_id and not ProjectRepository(self.repository.db).get_by_id(project_id):
+            return None
+        
+        # Buffered story edits are written first so the copy includes them
+        story_buffer.flush(episode_id)
+        episode = CloneRepository(self.repository.db).clone_episode(episode_id, project_id, title=clone_data.title)
+        return EpisodeResponse.model_validate(episode) if episode else None
+
     def delete_episode(self, episode_id: UUID) -> bool:
-        return self.repository.delete(episode_id)
+        deleted = self.repository.delete(episode_id)
+        if deleted:
+            self.repository.db.execute(story_cache.invalidation(episode_id))
+            self.repository.db.execute(scenes_cache.invalidation(episode_id))
+        return deleted
 
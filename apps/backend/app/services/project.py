@@ -1,17 +1,40 @@
 from uuid import UUID
 from typing import Optional
 from sqlalchemy.orm import Session
+from app.core.cache import story_cache, scenes_cache
+from app.core.http_cache import page_etag
+from app.core.pagination import Page
+from app.repositories.clone import CloneRepository
 from app.repositories.project import ProjectRepository
 from app.models.project import Project
-from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.project import ProjectClone, ProjectCreate, ProjectUpdate
+from app.services.story_buffer import story_buffer
 
 
 class ProjectService:
     def __init__(self, db: Session):
         self.repository = ProjectRepository(db)
 
-    def get_projects(self, skip: int = 0, limit: int = 100) -> list[Project]:
-        return self.repository.get_all(skip=skip, limit=limit)
+    def get_projects(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        skip: int = 0
+    ) -> Page[Project]:
+        return self.repository.get_page(limit=limit, cursor=cursor, include_total=include_total, skip=skip)
+
+    def get_projects_etag(
+        self,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+        skip: int = 0
+    ) -> str:
+        """ETag of a projects page, computed from row versions only."""
+        return page_etag(self.repository.get_page(
+            limit=limit, cursor=cursor, include_total=include_total, versions_only=True, skip=skip
+        ))
 
     def get_project(self, project_id: UUID) -> Optional[Project]:
         return self.repository.get_by_id(project_id)
@@ -22,6 +45,19 @@ class ProjectService:
     def update_project(self, project_id: UUID, project_data: ProjectUpdate) -> Optional[Project]:
         return self.repository.update(project_id, project_data)
 
+    def clone_project(self, project_id: UUID, clone_data: ProjectClone) -> Optional[Project]:
+        """Copy a project with all its episodes, stories, screenplays and scenes; None if it does not exist."""
+        # Buffered story edits are written first so the copy includes them
+        story_buffer.flush_all()
+        return CloneRepository(self.repository.db).clone_project(project_id, name=clone_data.name)
+
     def delete_project(self, project_id: UUID) -> bool:
-        return self.repository.delete(project_id)
+        """Soft-delete a project; its rows are purged in the background."""
+        episode_ids = self.repository.delete(project_id)
+        if episode_ids is None:
+            return False
+        if episode_ids:
+            self.repository.db.execute(story_cache.invalidations(episode_ids))
+            self.repository.db.execute(scenes_cache.invalidations(episode_ids))
+        return True
 
@@ -0,0 +1,274 @@
+"""
+Export and import of whole projects as NDJSON.
+
+An export is one JSON object per line: a header, then the project, its
+episodes, stories, screenplays and scenes, each section complete before the
+next starts. Every line carries a "type" field naming its section. Both
+directions stream, so memory use stays flat however many scenes a project has.
+
+Imports always create a new project: every id is replaced with a fresh one
+and timestamps are kept. Stories keep their latest revision number, stored as
+a single snapshot; earlier revisions are not exported.
+"""
+import itertools
+import logging
+import orjson
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Mapping, Optional
+from uuid import UUID
+from sqlalchemy.orm import Session
+
+from app.core.ids import uuid7
+from app.db.session import session_scope
+from app.models.screenplay import scene_character_line_counts, scene_content_hash
+from app.repositories.project_transfer import ProjectTransferRepository
+from app.schemas.project import ProjectImportResponse
+from app.services.story_buffer import story_buffer
+from app.services.story_delta import compress_text
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMAT = "yashvi-project"
+EXPORT_VERSION = 1
+
+# Sections in the order they appear in an export
+SECTIONS = ("project", "episode", "story", "screenplay", "scene")
+
+# Bytes of NDJSON collected before a chunk is handed to the response
+EXPORT_CHUNK_SIZE = 64 * 1024
+
+_EPISODE_COLUMNS = ("id", "project_id", "title", "description", "episode_number", "status", "created_at", "updated_at")
+_STORY_COLUMNS = ("id", "episode_id", "content", "revision", "snapshot", "created_at", "updated_at")
+_SCREENPLAY_COLUMNS = (
+    "id", "episode_id", "ai_model", "generation_time_seconds", "scene_count", "created_at", "updated_at"
+)
+_SCENE_COLUMNS = (
+    "id", "screenplay_id", "scene_number", "content_hash", "title", "duration_seconds", "characters",
+    "dialogue", "prompt", "character_line_counts", "created_at", "updated_at"
+)
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value is not None else None
+
+
+def _remap(ids: Dict[str, UUID], old_id: Any, kind: str) -> UUID:
+    new_id = ids.get(old_id)
+    if new_id is None:
+        raise ValueError(f"Export references unknown {kind} {old_id}")
+    return new_id
+
+
+def _parse_lines(lines: Iterable[bytes]) -> Iterator[Dict[str, Any]]:
+    for number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Line {number} is not valid JSON: {str(e)}") from e
+        if not isinstance(record, dict) or "type" not in record:
+            raise ValueError(f"Line {number} is not an export record")
+        yield record
+
+
+class ProjectTransferService:
+    def __init__(self, db: Session):
+        self.repository = ProjectTransferRepository(db)
+
+    def export_project(self, project_id: UUID) -> Optional[Iterator[bytes]]:
+        """
+        Stream a project tree as NDJSON chunks, read from one snapshot.
+
+        Returns:
+            An iterator of chunks, or None if the project does not exist
+        """
+        self.repository.begin_snapshot()
+        project = self.repository.get_project(project_id)
+        if project is None:
+            return None
+        return self._export_chunks(project)
+
+    def _export_chunks(self, project: Mapping[str, Any]) -> Iterator[bytes]:
+        header = {
+            "type": "export",
+            "format": EXPORT_FORMAT,
+            "version": EXPORT_VERSION,
+            "project_id": project["id"],
+            "exported_at": datetime.utcnow(),
+        }
+        sections = itertools.chain(
+            [header, {"type": "project", **project}],
+            ({"type": "episode", **row} for row in self.repository.stream_episodes(project["id"])),
+            ({"type": "story", **row} for row in self.repository.stream_stories(project["id"])),
+            ({"type": "screenplay", **row} for row in self.repository.stream_screenplays(project["id"])),
+            ({"type": "scene", **row} for row in self.repository.stream_scenes(project["id"])),
+        )
+
+        chunk = bytearray()
+        for record in sections:
+            chunk += orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+            if len(chunk) >= EXPORT_CHUNK_SIZE:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+    def import_project(self, lines: Iterable[bytes]) -> ProjectImportResponse:
+        """
+        Load an NDJSON export as a new project.
+
+        Rows are streamed into the database with COPY as they are parsed; only
+        the episode and screenplay id mappings are kept in memory.
+
+        Raises:
+            ValueError: If the input is not a valid project export
+        """
+        try:
+            return self._import_records(_parse_lines(lines))
+        except (KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid project export: missing or malformed field {str(e)}") from e
+
+    def _import_records(self, records: Iterator[Dict[str, Any]]) -> ProjectImportResponse:
+        header = next(records, None)
+        if header is None or header["type"] != "export" or header.get("format") != EXPORT_FORMAT:
+            raise ValueError("Input is not a project export")
+        if header.get("version") != EXPORT_VERSION:
+            raise ValueError(f"Unsupported export version: {header.get('version')}")
+
+        self.repository.create_staging_tables()
+        project: Optional[Dict[str, Any]] = None
+        episode_ids: Dict[str, UUID] = {}
+        screenplay_ids: Dict[str, UUID] = {}
+        latest_screenplays: Dict[UUID, str] = {}
+        counts = {section: 0 for section in SECTIONS}
+        position = 0
+
+        for section, group in itertools.groupby(records, key=lambda record: record["type"]):
+            if section not in SECTIONS[position:]:
+                raise ValueError(f"Unexpected or out-of-order {section!r} records")
+            position = SECTIONS.index(section) + 1
+
+            if section == "project":
+                project = self._import_project_row(group)
+                counts[section] = 1
+            elif project is None:
+                raise ValueError("Export has no project record")
+            elif section == "episode":
+                counts[section] = self.repository.copy_rows(
+                    "episodes", _EPISODE_COLUMNS,
+                    self._episode_rows(group, project["id"], episode_ids, latest_screenplays)
+                )
+            elif section == "story":
+                counts[section] = self.repository.copy_rows(
+                    "import_stories", _STORY_COLUMNS, self._story_rows(group, episode_ids)
+                )
+                self.repository.publish_staged_stories()
+            elif section == "screenplay":
+                counts[section] = self.repository.copy_rows(
+                    "screenplays", _SCREENPLAY_COLUMNS, self._screenplay_rows(group, episode_ids, screenplay_ids)
+                )
+            else:
+                counts[section] = self.repository.copy_rows(
+                    "import_scenes", _SCENE_COLUMNS, self._scene_rows(group, screenplay_ids)
+                )
+                self.repository.publish_staged_scenes()
+
+        if project is None:
+            raise ValueError("Export has no project record")
+        self.repository.set_latest_screenplays([
+            {"episode_id": episode_id, "screenplay_id": _remap(screenplay_ids, old_id, "screenplay")}
+            for episode_id, old_id in latest_screenplays.items()
+        ])
+
+        logger.info(
+            f"Imported project {project['id']}: {counts['episode']} episodes, {counts['story']} stories, "
+            f"{counts['screenplay']} screenplays, {counts['scene']} scenes"
+        )
+        return ProjectImportResponse(
+            **project,
+            episode_count=counts["episode"],
+            story_count=counts["story"],
+            screenplay_count=counts["screenplay"],
+            scene_count=counts["scene"],
+        )
+
+    def _import_project_row(self, records: Iterator[Dict[str, Any]]) -> Dict[str, Any]:
+        record = next(records)
+        if next(records, None) is not None:
+            raise ValueError("Export has more than one project record")
+        project = {
+            "id": uuid7(),
+            "name": record["name"],
+            "description": record["description"],
+            "status": record["status"],
+            "created_at": _timestamp(record["created_at"]),
+            "updated_at": _timestamp(record["updated_at"]),
+        }
+        self.repository.copy_rows("projects", tuple(project), [tuple(project.values())])
+        return project
+
+    def _episode_rows(
+        self,
+        records: Iterator[Dict[str, Any]],
+        project_id: UUID,
+        episode_ids: Dict[str, UUID],
+        latest_screenplays: Dict[UUID, str]
+    ) -> Iterator[tuple]:
+        for record in records:
+            episode_id = uuid7()
+            episode_ids[record["id"]] = episode_id
+            if record["latest_screenplay_id"] is not None:
+                latest_screenplays[episode_id] = record["latest_screenplay_id"]
+            yield (
+                episode_id, project_id, record["title"], record["description"], record["episode_number"],
+                record["status"], _timestamp(record["created_at"]), _timestamp(record["updated_at"])
+            )
+
+    def _story_rows(self, records: Iterator[Dict[str, Any]], episode_ids: Dict[str, UUID]) -> Iterator[tuple]:
+        for record in records:
+            content, revision = record["content"], record["revision"]
+            yield (
+                uuid7(), _remap(episode_ids, record["episode_id"], "episode"), content, revision,
+                compress_text(content or "") if revision > 0 else None,
+                _timestamp(record["created_at"]), _timestamp(record["updated_at"])
+            )
+
+    def _screenplay_rows(
+        self,
+        records: Iterator[Dict[str, Any]],
+        episode_ids: Dict[str, UUID],
+        screenplay_ids: Dict[str, UUID]
+    ) -> Iterator[tuple]:
+        for record in records:
+            screenplay_id = uuid7()
+            screenplay_ids[record["id"]] = screenplay_id
+            yield (
+                screenplay_id, _remap(episode_ids, record["episode_id"], "episode"), record["ai_model"],
+                record["generation_time_seconds"], record["scene_count"],
+                _timestamp(record["created_at"]), _timestamp(record["updated_at"])
+            )
+
+    def _scene_rows(self, records: Iterator[Dict[str, Any]], screenplay_ids: Dict[str, UUID]) -> Iterator[tuple]:
+        for record in records:
+            yield (
+                uuid7(), _remap(screenplay_ids, record["screenplay_id"], "screenplay"), record["scene_number"],
+                scene_content_hash(record), record["title"], record["duration_seconds"],
+                orjson.dumps(record["characters"]).decode(), orjson.dumps(record["dialogue"]).decode(),
+                record["prompt"], orjson.dumps(scene_character_line_counts(record)).decode(),
+                _timestamp(record["created_at"]), _timestamp(record["updated_at"])
+            )
+
+
+def stream_project_export(project_id: UUID) -> Iterator[bytes]:
+    """
+    Export a project in a session of its own that stays open while the
+    chunks are consumed, for responses streamed after the request's session
+    has closed.
+    """
+    # Buffered story edits would otherwise be missing from the export
+    story_buffer.flush_all()
+    with session_scope() as db:
+        chunks = ProjectTransferService(db).export_project(project_id)
+        if chunks is not None:
+            yield from chunks
@@ -0,0 +1,102 @@
+"""
+Background purge of soft-deleted projects and episodes.
+
+Deletes only stamp deleted_at, so they return at once and readers stop
+seeing the rows through the soft-delete filter. The purger then removes the
+rows a batch at a time: scenes, screenplays and story revisions of each
+deleted episode, then the episode and its story, then projects with no
+deleted episodes left. Every batch is its own short transaction of at most
+PURGE_BATCH_SIZE rows, followed by a pause, so a huge project never holds
+locks for long or floods replication with one giant transaction.
+
+The purger runs in processes started with PURGE_ENABLED, which is off by
+default so that web workers don't all run one; enable it in a single
+process, or run ``python -m app.cli purge-deleted`` on a schedule. Several
+purgers may still run at once: each batch locks its episode and rows with
+SKIP LOCKED, so they share the work instead of queueing behind each other.
+"""
+import asyncio
+import logging
+import time
+from typing import Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.db.session import session_scope
+from app.repositories.purge import PurgeRepository
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class DeletedRowPurger:
+    def __init__(self, batch_size: int, batch_pause_seconds: float, idle_seconds: float):
+        self.batch_size = batch_size
+        self.batch_pause_seconds = batch_pause_seconds
+        self.idle_seconds = idle_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    def purge_batch(self) -> int:
+        """
+        Delete one batch of rows in its own transaction.
+
+        Returns:
+            The number of rows deleted; 0 when nothing is left to purge
+        """
+        started = time.monotonic()
+        with session_scope() as db:
+            repository = PurgeRepository(db)
+            table, deleted = "projects", 0
+            episode_id = repository.get_next_deleted_episode_id()
+            if episode_id is not None:
+                table, deleted = repository.delete_episode_batch(episode_id, self.batch_size)
+            if not deleted:
+                table, deleted = "projects", repository.delete_project_batch(self.batch_size)
+
+        if deleted:
+            metrics.increment(f"purge_{table}_rows_total", deleted)
+            metrics.observe("purge_batch_seconds", time.monotonic() - started)
+        return deleted
+
+    def purge_all(self) -> int:
+        """Purge everything waiting, pausing between batches; returns the number of rows deleted."""
+        total = 0
+        while True:
+            deleted = self.purge_batch()
+            if not deleted:
+                return total
+            total += deleted
+            time.sleep(self.batch_pause_seconds)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                deleted = await run_in_threadpool(self.purge_batch)
+            except Exception as e:
+                metrics.increment("purge_errors_total")
+                logger.error(f"Failed to purge deleted rows: {str(e)}", exc_info=True)
+                deleted = 0
+            await asyncio.sleep(self.batch_pause_seconds if deleted else self.idle_seconds)
+
+    def start(self) -> None:
+        """Start the background purger on the running event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the purger; a batch in progress finishes in its thread and commits."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+purger = DeletedRowPurger(
+    batch_size=settings.PURGE_BATCH_SIZE,
+    batch_pause_seconds=settings.PURGE_BATCH_PAUSE_SECONDS,
+    idle_seconds=settings.PURGE_IDLE_SECONDS,
+)
@@ -1,14 +1,15 @@
 import time
 import logging
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import List
 from uuid import UUID
 
+from app.core.cache import scenes_cache
 from app.repositories.screenplay import ScreenplayRepository
-from app.repositories.scene import SceneRepository
 from app.services.story import StoryService
 from app.services.ai.base_ai_service import BaseAIService
-from app.schemas.screenplay import ScreenplayCreate, ScreenplayResponse, SceneCreate, SceneResponse
+from app.schemas.screenplay import ScreenplayCreate, ScreenplayResponse, SceneBase, SceneResponse
 
 logger = logging.getLogger(__name__)
 
@@ -18,13 +19,19 @@ class ScreenplayService:
         self.db = db
         self.ai_service = ai_service
         self.screenplay_repository = ScreenplayRepository(db)
-        self.scene_repository = SceneRepository(db)
         self.story_service = StoryService(db)
     
     async def generate_screenplay(self, episode_id: UUID) -> ScreenplayResponse:
         """
         Generate a screenplay for an episode from its story.
         
+        Generation runs in three phases so that no pooled database connection is
+        held while the AI call is in flight:
+        
+        1. Read phase: load the story content and release the connection.
+        2. AI phase: await the AI service without touching the session.
+        3. Write phase: persist the screenplay and its scenes.
+        
         Args:
             episode_id: The episode ID to generate screenplay for
             
@@ -35,19 +42,7 @@ class ScreenplayService:
             ValueError: If story not found or story content is empty
             Exception: If generation fails
         """
-        # Get story content
-        logger.debug(f"Fetching story for episode {episode_id}")
-        story = self.story_service.get_story_by_episode(episode_id)
-        if not story:
-            logger.warning(f"Story not found for episode {episode_id}")
-            raise ValueError(f"Story not found for episode {episode_id}")
-        
-        if not story.content or not story.content.strip():
-            logger.warning(f"Story content is empty for episode {episode_id}")
-            raise ValueError(f"Story content is empty for episode {episode_id}")
-        
-        story_length = len(story.content)
-        logger.info(f"Story found for episode {episode_id}: {story_length} characters")
+        story_content = await run_in_threadpool(self._load_story_content, episode_id)
         
         generation_start_time = time.time()
         ai_model = getattr(self.ai_service, 'model', 'unknown')
@@ -61,53 +56,21 @@ class ScreenplayService:
         try:
             # Call AI service to generate scenes
             logger.debug(f"Calling AI service to generate scenes from story")
-            scenes = await self.ai_service.generate_screenplay(story.content)
+            scenes = await self.ai_service.generate_screenplay(story_content)
             logger.info(f"AI service generated {len(scenes)} scenes")
             
             # Only create screenplay record after successful generation
             generation_time = time.time() - generation_start_time
             generation_time_seconds = int(round(generation_time))
-            scene_count = len(scenes)
             
             logger.info(
                 f"Screenplay generation completed for episode {episode_id} "
-                f"in {generation_time:.2f} seconds ({scene_count} scenes)"
+                f"in {generation_time:.2f} seconds ({len(scenes)} scenes)"
             )
             
-            # Create screenplay record with unfolded metadata
-            logger.debug(f"Creating screenplay record for episode {episode_id}")
-            screenplay_data = ScreenplayCreate(
-                episode_id=episode_id,
-                ai_model=ai_model,
-                generation_time_seconds=generation_time_seconds,
-                scene_count=scene_count
+            return await run_in_threadpool(
+                self.save_screenplay, episode_id, ai_model, generation_time_seconds, scenes
             )
-            screenplay = self.screenplay_repository.create(screenplay_data)
-            logger.info(f"Created screenplay record {screenplay.id} for episode {episode_id}")
-            
-            # Bulk insert scenes
-            logger.debug(f"Preparing to insert {len(scenes)} scenes into database")
-            scene_create_data = [
-                SceneCreate(
-                    screenplay_id=screenplay.id,
-                    scene_number=scene.scene_number,
-                    title=scene.title,
-                    duration_seconds=scene.duration_seconds,
-                    characters=scene.characters,
-                    dialogue=scene.dialogue,
-                    prompt=scene.prompt
-                )
-                for scene in scenes
-            ]
-            
-            self.scene_repository.create_batch(scene_create_data)
-            logger.info(f"Successfully inserted {len(scenes)} scenes into database")
-            
-            # Refresh to get updated screenplay with scenes
-            screenplay = self.screenplay_repository.get_by_id(screenplay.id)
-            scenes_db = self.scene_repository.get_by_screenplay_id(screenplay.id)
-            
-            return self._to_response(screenplay, scenes_db)
             
         except Exception as e:
             # Log error but don't create any database record
@@ -119,10 +82,68 @@ class ScreenplayService:
             )
             raise
     
+    def _load_story_content(self, episode_id: UUID) -> str:
+        """
+        Read phase: fetch the story content for an episode.
+        
+        The session is closed before returning so its connection goes back to the
+        pool for the duration of the AI call. The session stays usable and checks
+        out a fresh connection on the next query.
+        """
+        try:
+            logger.debug(f"Fetching story for episode {episode_id}")
+            story = self.story_service.get_story_by_episode(episode_id)
+        finally:
+            self.db.close()
+        
+        if not story:
+            logger.warning(f"Story not found for episode {episode_id}")
+            raise ValueError(f"Story not found for episode {episode_id}")
+        
+        if not story.content or not story.content.strip():
+            logger.warning(f"Story content is empty for episode {episode_id}")
+            raise ValueError(f"Story content is empty for episode {episode_id}")
+        
+        logger.info(f"Story found for episode {episode_id}: {len(story.content)} characters")
+        return story.content
+    
+    def save_screenplay(
+        self,
+        episode_id: UUID,
+        ai_model: str,
+        generation_time_seconds: int,
+        scenes: List[SceneBase]
+    ) -> ScreenplayResponse:
+        """
+        Write phase: persist the screenplay record and its scenes.
+        
+        Also used directly by batch jobs whose scenes were generated elsewhere.
+        """
+        try:
+            # Create screenplay record with unfolded metadata and all scenes in one transaction
+            logger.debug(f"Inserting screenplay record and {len(scenes)} scenes for episode {episode_id}")
+            screenplay_data = ScreenplayCreate(
+                episode_id=episode_id,
+                ai_model=ai_model,
+                generation_time_seconds=generation_time_seconds,
+                scene_count=len(scenes)
+            )
+            screenplay, scenes_db = self.screenplay_repository.create_with_scenes(screenplay_data, scenes)
+            self.db.execute(scenes_cache.invalidation(episode_id))
+            # The write phase is its own unit of work so the connection can be released straight away
+            self.db.commit()
+            logger.info(
+                f"Created screenplay record {screenplay.id} with {len(scenes_db)} scenes for episode {episode_id}"
+            )
+            
+            return self._to_response(screenplay, scenes_db)
+        finally:
+            self.db.close()
+    
     def _to_response(self, screenplay, scenes) -> ScreenplayResponse:
-        """Convert database models to response schema."""
-        scene_responses = [SceneResponse.model_validate(scene) for scene in scenes]
-        return ScreenplayResponse(
+        """Convert database models or returned rows to response schema without re-validating them."""
+        scene_responses = [SceneResponse.from_row(scene) for scene in scenes]
+        return ScreenplayResponse.model_construct(
             id=screenplay.id,
             episode_id=screenplay.episode_id,
             ai_model=screenplay.ai_model,
@@ -132,4 +153,3 @@ class ScreenplayService:
             created_at=screenplay.created_at,
             updated_at=screenplay.updated_at
         )
-
@@ -0,0 +1,256 @@
+import asyncio
+import logging
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+from uuid import UUID
+
+from openai import APIError
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.db.session import SessionLocal, session_scope
+from app.models.screenplay_batch import ScreenplayBatchEpisode, ScreenplayBatchJob
+from app.repositories.screenplay_batch import ScreenplayBatchRepository
+from app.repositories.story import StoryRepository
+from app.services.ai.base_ai_service import BaseAIService
+from app.services.screenplay import ScreenplayService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Strong references to running job tasks so they are not garbage collected
+_tasks: Dict[UUID, asyncio.Task] = {}
+
+
+class ScreenplayBatchService:
+    """
+    Schedules screenplay generation for many episodes.
+    
+    Online jobs generate episodes concurrently (bounded by
+    SCREENPLAY_BATCH_CONCURRENCY); each AI call is paced by the shared
+    per-model rate limiter. Offline jobs submit every story to the provider's
+    batch API and persist the results once the batch completes.
+    
+    Jobs and their progress are stored in the database, so any worker can
+    report on them. The process running a job holds a lease on it; if that
+    process stops, ``python -m app.cli resume-screenplay-batches`` picks the
+    job up again: offline jobs resume polling their provider batch, online
+    jobs generate the episodes that were not finished. Finished jobs are
+    deleted after SCREENPLAY_BATCH_RETENTION_DAYS.
+    """
+    
+    def __init__(self, ai_service: BaseAIService, on_progress: Optional[Callable[[ScreenplayBatchEpisode], None]] = None):
+        self.ai_service = ai_service
+        self.on_progress = on_progress
+        self.concurrency = settings.SCREENPLAY_BATCH_CONCURRENCY
+        self.poll_seconds = settings.SCREENPLAY_BATCH_POLL_SECONDS
+        self.lease_seconds = settings.SCREENPLAY_BATCH_LEASE_SECONDS
+    
+    @staticmethod
+    def get_job(job_id: UUID) -> Optional[ScreenplayBatchJob]:
+        with SessionLocal() as db:
+            return ScreenplayBatchRepository(db).get_by_id(job_id)
+    
+    def create_job(
+        self,
+        project_id: Optional[UUID] = None,
+        episode_ids: Optional[List[UUID]] = None,
+        mode: str = "online"
+    ) -> ScreenplayBatchJob:
+        """
+        Create a job for every episode with a non-empty story, leased to the caller.
+        
+        Explicitly requested episodes without story content are reported as skipped.
+        
+        Raises:
+            ValueError: If mode is offline and the AI provider has no batch API
+        """
+        if mode == "offline" and not self.ai_service.supports_batch:
+            raise ValueError(f"{type(self.ai_service).__name__} does not support offline (batch API) generation")
+        if episode_ids:
+            episode_ids = list(dict.fromkeys(episode_ids))
+        with session_scope() as db:
+            repository = ScreenplayBatchRepository(db)
+            expired = repository.delete_finished_before(settings.SCREENPLAY_BATCH_RETENTION_DAYS * 86400)
+            if expired:
+                logger.info(f"Deleted {expired} screenplay batches past their retention period")
+            
+            ready_ids = StoryRepository(db).get_episode_ids_with_content(
+                project_id=project_id, episode_ids=episode_ids
+            )
+            episodes = [ScreenplayBatchEpisode(episode_id=episode_id) for episode_id in ready_ids]
+            if episode_ids:
+                ready = set(ready_ids)
+                episodes.extend(
+                    ScreenplayBatchEpisode(episode_id=episode_id, status="skipped", error="Story content is empty")
+                    for episode_id in episode_ids if episode_id not in ready
+                )
+            for position, episode in enumerate(episodes):
+                episode.position = position
+            job = repository.create(mode, episodes, self.lease_seconds)
+        
+        logger.info(f"Created {mode} screenplay batch {job.id} for {len(ready_ids)} episodes")
+        return job
+    
+    def claim_abandoned_jobs(self, limit: int = 100) -> List[UUID]:
+        """Take over unfinished jobs whose runner has stopped; returns their IDs."""
+        with session_scope() as db:
+            return ScreenplayBatchRepository(db).claim_abandoned(self.lease_seconds, limit)
+    
+    def start(self, job_id: UUID) -> None:
+        """Run a job in the background on the current event loop."""
+        task = asyncio.create_task(self.run(job_id))
+        _tasks[job_id] = task
+        task.add_done_callback(lambda _: _tasks.pop(job_id, None))
+    
+    async def run(self, job_id: UUID) -> ScreenplayBatchJob:
+        """Run a job the caller holds the lease on to completion, resuming any earlier progress."""
+        heartbeat = asyncio.create_task(self._keep_leased(job_id))
+        try:
+            job = await run_in_threadpool(self.get_job, job_id)
+            if job.mode == "online" and any(episode.status == "running" for episode in job.episodes):
+                # Generations cut off with their previous runner were rolled back; start them over
+                await self._write(lambda repository: repository.reset_interrupted_episodes(job_id))
+                for episode in job.episodes:
+                    if episode.status == "running":
+                        episode.status = "pending"
+            if job.status == "pending":
+                job.status = "running"
+                await self._write(lambda repository: repository.update_job(job_id, status="running"))
+            try:
+                if job.mode == "offline":
+                    await self._run_offline(job)
+                else:
+                    await self._run_online(job)
+                failed = any(episode.status == "failed" for episode in job.episodes)
+                status = "failed" if failed else "completed"
+            except Exception as e:
+                logger.error(f"Screenplay batch {job_id} failed: {str(e)}", exc_info=True)
+                status = "failed"
+                for episode in job.episodes:
+                    if episode.status in ("pending", "running"):
+                        await self._update(job, episode, "failed", error=str(e))
+            await self._write(lambda repository: repository.finish_job(job_id, status))
+        finally:
+            heartbeat.cancel()
+        return await run_in_threadpool(self.get_job, job_id)
+    
+    async def _keep_leased(self, job_id: UUID) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                await self._write(lambda repository: repository.renew_lease(job_id, self.lease_seconds))
+            except Exception as e:
+                logger.warning(f"Failed to renew the lease on screenplay batch {job_id}: {str(e)}")
+    
+    async def _run_online(self, job: ScreenplayBatchJob) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        
+        async def generate(episode: ScreenplayBatchEpisode) -> None:
+            async with semaphore:
+                try:
+                    await self._update(job, episode, "running")
+                    with session_scope() as db:
+                        service = ScreenplayService(db, self.ai_service)
+                        screenplay = await service.generate_screenplay(episode.episode_id)
+                    await self._update(
+                        job, episode, "completed", screenplay_id=screenplay.id, scene_count=len(screenplay.scenes)
+                    )
+                except Exception as e:
+                    await self._update(job, episode, "failed", error=str(e))
+        
+        await asyncio.gather(*(generate(episode) for episode in job.episodes if episode.status == "pending"))
+    
+    async def _run_offline(self, job: ScreenplayBatchJob) -> None:
+        # Running episodes belong to the provider batch submitted before a restart
+        pending = [episode for episode in job.episodes if episode.status in ("pending", "running")]
+        if not pending:
+            return
+        
+        if job.provider_batch_id is None:
+            def load_stories() -> Dict[str, str]:
+                with SessionLocal() as db:
+                    repository = StoryRepository(db)
+                    stories = {}
+                    for episode in pending:
+                        story = repository.get_by_episode_id(episode.episode_id)
+                        if story and story.content:
+                            stories[str(episode.episode_id)] = story.content
+                    return stories
+            
+            stories = await run_in_threadpool(load_stories)
+            job.provider_batch_id = await self.ai_service.submit_screenplay_batch(stories)
+            job.status = "submitted"
+            
+            def record_submission(repository: ScreenplayBatchRepository) -> None:
+                repository.update_job(job.id, provider_batch_id=job.provider_batch_id, status=job.status)
+                for episode in pending:
+                    repository.update_episode(job.id, episode.episode_id, status="running")
+            
+            await self._write(record_submission)
+            for episode in pending:
+                episode.status = "running"
+                self._report(episode)
+        
+        while True:
+            try:
+                results = await self.ai_service.get_screenplay_batch_results(job.provider_batch_id)
+                if results is not None:
+                    break
+            except APIError as e:
+                # The provider batch keeps running; only a terminal batch status fails the job
+                logger.warning(f"Polling provider batch {job.provider_batch_id} failed, retrying: {str(e)}")
+            await asyncio.sleep(self.poll_seconds)
+        # Measured from job creation, which also covers a runner that resumed the job
+        created_at = job.created_at.replace(tzinfo=timezone.utc)
+        generation_time_seconds = int((datetime.now(timezone.utc) - created_at).total_seconds())
+        ai_model = getattr(self.ai_service, "model", "unknown")
+        
+        for episode in pending:
+            scenes = results.get(str(episode.episode_id))
+            if not scenes:
+                await self._update(job, episode, "failed", error="No scenes returned by batch")
+                continue
+            try:
+                with session_scope() as db:
+                    service = ScreenplayService(db, self.ai_service)
+                    screenplay = await run_in_threadpool(
+                        service.save_screenplay, episode.episode_id, ai_model, generation_time_seconds, scenes
+                    )
+                await self._update(
+                    job, episode, "completed", screenplay_id=screenplay.id, scene_count=len(screenplay.scenes)
+                )
+            except Exception as e:
+                await self._update(job, episode, "failed", error=str(e))
+    
+    async def _write(self, operation: Callable[[ScreenplayBatchRepository], Any]) -> Any:
+        """Run operation in its own transaction, off the event loop."""
+        def write() -> Any:
+            with session_scope() as db:
+                return operation(ScreenplayBatchRepository(db))
+        
+        return await run_in_threadpool(write)
+    
+    async def _update(
+        self,
+        job: ScreenplayBatchJob,
+        episode: ScreenplayBatchEpisode,
+        status: str,
+        screenplay_id: Optional[UUID] = None,
+        scene_count: Optional[int] = None,
+        error: Optional[str] = None
+    ) -> None:
+        episode.status = status
+        episode.screenplay_id = screenplay_id
+        episode.scene_count = scene_count
+        episode.error = error
+        await self._write(lambda repository: repository.update_episode(
+            job.id, episode.episode_id, status=status, screenplay_id=screenplay_id, scene_count=scene_count, error=error
+        ))
+        self._report(episode)
+    
+    def _report(self, episode: ScreenplayBatchEpisode) -> None:
+        if episode.status == "failed":
+            logger.warning(f"Batch screenplay generation failed for episode {episode.episode_id}: {episode.error}")
+        if self.on_progress:
+            self.on_progress(episode)
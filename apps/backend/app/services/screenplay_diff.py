@@ -0,0 +1,60 @@
+"""
+Scene-level diff between two screenplay versions.
+
+Scenes are compared by content hash only, so a diff never loads dialogue or
+prompts. A scene whose hash appears in both versions is unchanged (or moved,
+if its scene number differs); an unmatched scene that takes the place of an
+unmatched scene with the same number is modified; everything else was added
+or removed.
+"""
+from typing import Dict, List, Sequence
+
+from app.schemas.screenplay import SceneDiffEntry
+
+
+def diff_scenes(old: Sequence, new: Sequence) -> List[SceneDiffEntry]:
+    """
+    Diff two scene outlines of (scene_number, content_hash, title) rows.
+    
+    Entries follow the new version's scene order, with removed scenes last.
+    """
+    unmatched_old: Dict[str, list] = {}
+    for scene in old:
+        unmatched_old.setdefault(scene.content_hash, []).append(scene)
+    
+    matches = {}
+    for scene in new:
+        candidates = unmatched_old.get(scene.content_hash)
+        if candidates:
+            # Prefer the copy at the same position so duplicated scenes don't show up as moves
+            same_place = [c for c in candidates if c.scene_number == scene.scene_number]
+            match = same_place[0] if same_place else candidates[0]
+            candidates.remove(match)
+            matches[id(scene)] = match
+    
+    old_left = {scene.scene_number: scene for scenes in unmatched_old.values() for scene in scenes}
+    entries = []
+    for scene in new:
+        match = matches.get(id(scene))
+        if match is not None:
+            status = "unchanged" if match.scene_number == scene.scene_number else "moved"
+        else:
+            match = old_left.pop(scene.scene_number, None)
+            status = "modified" if match is not None else "added"
+        entries.append(SceneDiffEntry(
+            status=status,
+            title=scene.title,
+            old_scene_number=match.scene_number if match is not None else None,
+            new_scene_number=scene.scene_number,
+            old_content_hash=match.content_hash if match is not None else None,
+            new_content_hash=scene.content_hash,
+        ))
+    
+    for scene in sorted(old_left.values(), key=lambda s: s.scene_number):
+        entries.append(SceneDiffEntry(
+            status="removed",
+            title=scene.title,
+            old_scene_number=scene.scene_number,
+            old_content_hash=scene.content_hash,
+        ))
+    return entries
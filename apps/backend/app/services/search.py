@@ -0,0 +1,38 @@
+from sqlalchemy.orm import Session
+from typing import Optional
+from uuid import UUID
+
+from app.core.pagination import Page
+from app.repositories.project import ProjectRepository
+from app.repositories.search import SearchRepository
+from app.schemas.search import SearchResultResponse
+
+
+class SearchService:
+    def __init__(self, db: Session):
+        self.repository = SearchRepository(db)
+        self.project_repository = ProjectRepository(db)
+
+    def search_project(
+        self,
+        project_id: UUID,
+        query: str,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Optional[Page[SearchResultResponse]]:
+        """
+        Search a project's stories and latest screenplays.
+        
+        Returns:
+            A page of results, or None if the project does not exist
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        if not self.project_repository.get_by_id(project_id):
+            return None
+        page = self.repository.search(project_id, query.strip(), limit=limit, cursor=cursor)
+        return Page(
+            items=[SearchResultResponse.model_validate(row) for row in page.items],
+            next_cursor=page.next_cursor
+        )
@@ -1,9 +1,41 @@
+import logging
+import time
 from sqlalchemy.orm import Session
 from typing import Optional
 from uuid import UUID
 
+from app.core.cache import story_cache
+from app.core.config import get_settings
+from app.core.http_cache import rows_etag
+from app.core.metrics import metrics
+from app.core.pagination import Page
+from app.models.story import Story
+from app.repositories.episode import EpisodeRepository
 from app.repositories.story import StoryRepository
-from app.schemas.story import StoryCreate, StoryUpdate, StoryResponse
+from app.schemas.story import (
+    StoryCreate,
+    StoryUpdate,
+    StoryResponse,
+    StoryRevisionSummaryResponse,
+    StoryRevisionResponse,
+)
+from app.services.story_buffer import story_buffer
+from app.services.story_delta import apply_ops, diff_text, compress_ops, compress_text, decompress_ops, decompress_text
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class StoryRevisionConflictError(Exception):
+    """Raised when an edit is based on a revision that is no longer the latest."""
+
+    def __init__(self, base_revision: int, current_revision: int):
+        self.base_revision = base_revision
+        self.current_revision = current_revision
+        super().__init__(
+            f"Story has changed: edit is based on revision {base_revision}, "
+            f"latest is {current_revision}"
+        )
 
 
 class StoryService:
@@ -11,27 +43,179 @@ class StoryService:
         self.repository = StoryRepository(db)
 
     def get_story_by_episode(self, episode_id: UUID) -> Optional[StoryResponse]:
+        """Get story by episode ID, served from the write buffer or read cache when possible"""
+        buffered = story_buffer.get(episode_id)
+        if buffered is not None:
+            return buffered
+        cached = story_cache.get(episode_id)
+        if cached is not None:
+            return cached
+        read_started = time.monotonic()
         story = self.repository.get_by_episode_id(episode_id)
         if story:
-            return StoryResponse.model_validate(story)
+            story_response = StoryResponse.model_validate(story)
+            story_cache.set(episode_id, story_response, read_started)
+            return story_response
         return None
 
-    def get_or_create_story(self, episode_id: UUID) -> StoryResponse:
-        """Get story by episode ID, creating it if it doesn't exist"""
-        story = self.repository.get_by_episode_id(episode_id)
+    def get_story_etag(self, episode_id: UUID) -> Optional[str]:
+        """ETag of an episode's story, from the cache or a version-only query."""
+        story = (
+            story_buffer.get(episode_id)
+            or story_cache.get(episode_id)
+            or self.repository.get_version_by_episode_id(episode_id)
+        )
         if story:
-            return StoryResponse.model_validate(story)
+            return rows_etag([story])
+        return None
+
+    def get_or_create_story(self, episode_id: UUID) -> Optional[StoryResponse]:
+        """Get story by episode ID, creating it if it doesn't exist; None if the episode doesn't exist"""
+        story = self.get_story_by_episode(episode_id)
+        if story:
+            return story
+        # Deleted episodes keep their story until purged, so check before creating
+        if not EpisodeRepository(self.repository.db).get_by_id(episode_id):
+            return None
         # Create if doesn't exist
         story_data = StoryCreate(episode_id=episode_id, content=None)
         return self.create_story(story_data)
 
     def create_story(self, story_data: StoryCreate) -> StoryResponse:
-        story = self.repository.create(story_data)
+        story = self.repository.create(StoryCreate(episode_id=story_data.episode_id, content=None))
+        if story_data.content is not None:
+            self._save_revision(story, story_data.content)
         return StoryResponse.model_validate(story)
 
     def update_story(self, episode_id: UUID, story_data: StoryUpdate) -> Optional[StoryResponse]:
-        story = self.repository.update(episode_id, story_data)
-        if story:
-            return StoryResponse.model_validate(story)
-        return None
+        """
+        Save a new revision of an episode's story.
+        
+        Accepts either full content or text operations against base_revision.
+        
+        Raises:
+            StoryRevisionConflictError: If base_revision is not the latest revision
+            ValueError: If an operation does not fit the base revision's text
+        """
+        if settings.STORY_WRITE_BEHIND:
+            return self._buffer_update(episode_id, story_data)
+        
+        story = self.repository.get_by_episode_id_for_update(episode_id)
+        if not story:
+            return None
+        
+        content = self._edited_content(story.content, story.revision, story_data)
+        if content != story.content:
+            self._save_revision(story, content)
+            self.repository.db.execute(story_cache.invalidation(episode_id))
+        return StoryResponse.model_validate(story)
+
+    def _buffer_update(self, episode_id: UUID, story_data: StoryUpdate) -> Optional[StoryResponse]:
+        """Apply an update to the write buffer and acknowledge it without writing to the database."""
+        while True:
+            # The story may have to be read from the database, so it is read
+            # outside the buffer lock; the edit is only applied if no other
+            # edit was buffered or flushed in the meantime, else it is re-read
+            version = story_buffer.version(episode_id)
+            current = self.get_story_by_episode(episode_id)
+            if not current:
+                return None
+            with story_buffer.lock:
+                if story_buffer.version(episode_id) != version:
+                    continue
+                content = self._edited_content(current.content, current.revision, story_data)
+                if content == current.content:
+                    return current
+                return story_buffer.put(current, content)
+
+    def _edited_content(self, content: Optional[str], revision: int, story_data: StoryUpdate) -> Optional[str]:
+        """Content after applying an update to the given revision."""
+        if story_data.base_revision is not None and story_data.base_revision != revision:
+            raise StoryRevisionConflictError(story_data.base_revision, revision)
+        if story_data.ops is not None:
+            return apply_ops(content or "", [(op.position, op.delete, op.insert) for op in story_data.ops])
+        if "content" in story_data.model_fields_set:
+            return story_data.content
+        return content
+
+    def persist_buffered_story(self, buffered: StoryResponse) -> bool:
+        """
+        Write a story's coalesced buffered edits as a single revision.
+        
+        The revision keeps the number already acknowledged to the client. If the
+        story was saved elsewhere in the meantime, the buffered text is written
+        as the next revision instead.
+        """
+        story = self.repository.get_by_episode_id_for_update(buffered.episode_id)
+        if not story:
+            return False
+        
+        revision = buffered.revision
+        if story.revision >= revision:
+            metrics.increment("story_buffer_conflicts_total")
+            logger.warning(
+                f"Story for episode {buffered.episode_id} reached revision {story.revision} "
+                f"while revision {revision} was buffered; saving buffered content as the next revision"
+            )
+            revision = story.revision + 1
+        
+        if buffered.content != story.content:
+            self._save_revision(story, buffered.content, revision)
+            self.repository.db.execute(story_cache.invalidation(buffered.episode_id))
+        return True
 
+    def _save_revision(self, story: Story, content: Optional[str], revision: Optional[int] = None) -> None:
+        """
+        Store a revision as a compressed delta, or as a full snapshot when it
+        starts a new block of STORY_SNAPSHOT_INTERVAL revisions (or when the
+        delta is no smaller).
+        """
+        revision = revision if revision is not None else story.revision + 1
+        interval = settings.STORY_SNAPSHOT_INTERVAL
+        text = content or ""
+        snapshot = compress_text(text)
+        kind, data = "snapshot", snapshot
+        # Buffered saves can skip revision numbers, so compare blocks rather than testing for a multiple
+        if story.revision > 0 and (revision - 1) // interval == (story.revision - 1) // interval:
+            delta = compress_ops(diff_text(story.content or "", text))
+            if len(delta) < len(snapshot):
+                kind, data = "delta", delta
+        
+        self.repository.save_revision(story, content, kind, data, revision)
+        metrics.increment(f"story_revisions_{kind}_total")
+        metrics.observe("story_revision_stored_bytes", len(data))
+
+    def get_revisions(
+        self,
+        episode_id: UUID,
+        limit: int = 100,
+        cursor: Optional[str] = None
+    ) -> Optional[Page[StoryRevisionSummaryResponse]]:
+        story = self.repository.get_by_episode_id(episode_id)
+        if not story:
+            return None
+        page = self.repository.get_revision_page(story.id, limit=limit, cursor=cursor)
+        return Page(
+            items=[StoryRevisionSummaryResponse.model_validate(row) for row in page.items],
+            next_cursor=page.next_cursor
+        )
+
+    def get_revision(self, episode_id: UUID, revision: int) -> Optional[StoryRevisionResponse]:
+        """Rebuild a story's content as of a revision from its nearest snapshot and the deltas after it."""
+        story = self.repository.get_by_episode_id(episode_id)
+        if not story:
+            return None
+        chain = self.repository.get_revision_chain(story.id, revision)
+        if not chain or chain[-1].revision != revision:
+            return None
+        
+        content = decompress_text(chain[0].data)
+        for delta in chain[1:]:
+            content = apply_ops(content, decompress_ops(delta.data))
+        
+        return StoryRevisionResponse(
+            story_id=story.id,
+            revision=revision,
+            content=content,
+            created_at=chain[-1].created_at
+        )
@@ -0,0 +1,199 @@
+"""
+Write-behind buffer for story autosaves.
+
+When STORY_WRITE_BEHIND is enabled, story updates are applied to an
+in-memory per-episode entry and acknowledged immediately. Consecutive edits
+to the same story coalesce into a single revision, which a background task
+writes to Postgres once the story has been idle for the debounce interval,
+once it has been pending for the maximum delay, or once enough edits have
+piled up. Readers in the same worker see buffered content straight away.
+Edits made while a flush is running stay buffered and are timed from the
+first of them. A failed flush is retried with exponential backoff.
+
+Pending edits are flushed on shutdown; after a crash at most
+STORY_FLUSH_MAX_DELAY_SECONDS of edits can be lost. The buffer is per worker
+process, so deployments with several workers should route a story's editor
+to one worker; if another worker saved in between, the flush still writes
+the buffered text as the newest revision (last writer wins).
+"""
+import asyncio
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from uuid import UUID
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.core.metrics import metrics
+from app.schemas.story import StoryResponse
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_TICK_SECONDS = 0.25
+# Backoff between attempts to flush a story whose last flush failed
+_RETRY_BASE_SECONDS = 1.0
+_RETRY_MAX_SECONDS = 60.0
+
+
+@dataclass
+class PendingStory:
+    """Acknowledged but not yet persisted state of one story."""
+    story: StoryResponse
+    first_edit_at: float
+    last_edit_at: float
+    edits: int = 1
+    # Edits covered by the flush in progress, and when the first edit after them arrived
+    flushing_edits: Optional[int] = None
+    first_edit_after_flush_at: Optional[float] = None
+    failed_flushes: int = 0
+    retry_at: float = 0.0
+
+
+class StoryWriteBuffer:
+    def __init__(self, debounce_seconds: float, max_delay_seconds: float, max_edits: int):
+        self.debounce_seconds = debounce_seconds
+        self.max_delay_seconds = max_delay_seconds
+        self.max_edits = max_edits
+        # Held by StoryService while it checks and replaces an entry; never held across database calls
+        self.lock = threading.RLock()
+        self._pending: Dict[UUID, PendingStory] = {}
+        # Counts entries removed after a flush, which moves their story on in the database
+        self._flushed = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def get(self, episode_id: UUID) -> Optional[StoryResponse]:
+        """Buffered state of a story, if it has unsaved edits."""
+        with self.lock:
+            entry = self._pending.get(episode_id)
+            return entry.story if entry else None
+
+    def version(self, episode_id: UUID) -> tuple:
+        """
+        Token that changes whenever the buffered state of a story may have changed.
+        
+        A writer takes it before reading the story and compares it again under
+        the lock: equal tokens mean nothing was buffered or flushed meanwhile.
+        """
+        with self.lock:
+            entry = self._pending.get(episode_id)
+            return self._flushed, entry.story.revision if entry else None
+
+    def put(self, current: StoryResponse, content: Optional[str]) -> StoryResponse:
+        """Buffer an edit on top of ``current`` and return the acknowledged story."""
+        now = time.monotonic()
+        story = current.model_copy(update={
+            "content": content,
+            "revision": current.revision + 1,
+            "updated_at": datetime.now(timezone.utc).replace(tzinfo=None),
+        })
+        with self.lock:
+            entry = self._pending.get(story.episode_id)
+            if entry is None:
+                self._pending[story.episode_id] = PendingStory(story=story, first_edit_at=now, last_edit_at=now)
+            else:
+                if entry.edits == entry.flushing_edits:
+                    entry.first_edit_after_flush_at = now
+                entry.story = story
+                entry.last_edit_at = now
+                entry.edits += 1
+        metrics.increment("story_buffer_edits_total")
+        return story
+
+    def _due(self, now: float) -> List[UUID]:
+        with self.lock:
+            return [
+                episode_id for episode_id, entry in self._pending.items()
+                if now >= entry.retry_at and (
+                    now - entry.last_edit_at >= self.debounce_seconds
+                    or now - entry.first_edit_at >= self.max_delay_seconds
+                    or entry.edits >= self.max_edits
+                )
+            ]
+
+    def flush(self, episode_id: UUID) -> None:
+        """Write a story's buffered state as one revision; edits made meanwhile stay buffered."""
+        # Imported lazily: the story service reads through this buffer
+        from app.db.session import session_scope
+        from app.services.story import StoryService
+        
+        with self.lock:
+            entry = self._pending.get(episode_id)
+            if entry is None:
+                return
+            story, edits, first_edit_at = entry.story, entry.edits, entry.first_edit_at
+            entry.flushing_edits, entry.first_edit_after_flush_at = edits, None
+        
+        started = time.monotonic()
+        try:
+            with session_scope() as db:
+                StoryService(db).persist_buffered_story(story)
+        except Exception as e:
+            metrics.increment("story_buffer_flush_errors_total")
+            with self.lock:
+                if entry.flushing_edits == edits:
+                    entry.flushing_edits = None
+                entry.failed_flushes += 1
+                attempt = entry.failed_flushes
+                delay = min(_RETRY_BASE_SECONDS * 2 ** (attempt - 1), _RETRY_MAX_SECONDS)
+                entry.retry_at = time.monotonic() + delay
+            logger.error(
+                f"Failed to flush buffered story for episode {episode_id} "
+                f"(attempt {attempt}, retrying in {delay:.0f} s): {str(e)}",
+                exc_info=True
+            )
+            return
+        
+        with self.lock:
+            if self._pending.get(episode_id) is entry and entry.story is story:
+                del self._pending[episode_id]
+                self._flushed += 1
+            elif self._pending.get(episode_id) is entry and entry.flushing_edits == edits:
+                # Keep only the edits made during the flush, counted from the first of them
+                entry.edits -= edits
+                entry.first_edit_at = entry.first_edit_after_flush_at
+                entry.flushing_edits = None
+                entry.failed_flushes = 0
+                entry.retry_at = 0.0
+        metrics.increment("story_buffer_flushes_total")
+        metrics.observe("story_buffer_edits_per_flush", edits)
+        metrics.observe("story_buffer_pending_age_seconds", started - first_edit_at)
+        metrics.observe("story_buffer_flush_seconds", time.monotonic() - started)
+
+    def flush_all(self) -> None:
+        with self.lock:
+            episode_ids = list(self._pending)
+        for episode_id in episode_ids:
+            self.flush(episode_id)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(_TICK_SECONDS)
+            for episode_id in self._due(time.monotonic()):
+                await run_in_threadpool(self.flush, episode_id)
+
+    def start(self) -> None:
+        """Start the background flusher on the running event loop."""
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flusher and persist everything still buffered."""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await run_in_threadpool(self.flush_all)
+
+
+story_buffer = StoryWriteBuffer(
+    debounce_seconds=settings.STORY_FLUSH_DEBOUNCE_SECONDS,
+    max_delay_seconds=settings.STORY_FLUSH_MAX_DELAY_SECONDS,
+    max_edits=settings.STORY_FLUSH_MAX_EDITS,
+)
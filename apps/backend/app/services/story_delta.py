@@ -0,0 +1,84 @@
+"""
+Text deltas for story revisions.
+
+A delta is a list of ``(position, delete, insert)`` operations against a base
+text: remove ``delete`` characters at ``position`` and put ``insert`` there.
+Positions count Unicode code points of the base text and operations must not
+overlap. The same format is accepted from clients in PATCH requests and
+stored, zlib-compressed, as story revision deltas.
+"""
+import difflib
+import json
+import zlib
+from typing import List, Sequence, Tuple
+
+TextOp = Tuple[int, int, str]
+
+# Above this many character comparisons the changed region is stored as one replacement
+_MAX_DIFF_WORK = 4_000_000
+
+
+def diff_text(old: str, new: str) -> List[TextOp]:
+    """
+    Compute the operations that turn ``old`` into ``new``.
+    
+    The common prefix and suffix are trimmed first, so a small edit in a long
+    story only runs the matcher over the changed region.
+    """
+    if old == new:
+        return []
+    
+    prefix = 0
+    limit = min(len(old), len(new))
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    
+    old_mid = old[prefix:len(old) - suffix]
+    new_mid = new[prefix:len(new) - suffix]
+    if not old_mid or not new_mid or len(old_mid) * len(new_mid) > _MAX_DIFF_WORK:
+        return [(prefix, len(old_mid), new_mid)]
+    
+    ops = []
+    matcher = difflib.SequenceMatcher(None, old_mid, new_mid, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        if tag != "equal":
+            ops.append((prefix + i1, i2 - i1, new_mid[j1:j2]))
+    return ops
+
+
+def apply_ops(text: str, ops: Sequence[TextOp]) -> str:
+    """
+    Apply operations to ``text``.
+    
+    Raises:
+        ValueError: If an operation is out of range or operations overlap
+    """
+    parts = []
+    cursor = 0
+    for position, delete, insert in sorted(ops, key=lambda op: op[0]):
+        if position < cursor or delete < 0 or position + delete > len(text):
+            raise ValueError(f"Invalid edit operation at position {position} (delete {delete}) for text of length {len(text)}")
+        parts.append(text[cursor:position])
+        parts.append(insert)
+        cursor = position + delete
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+def compress_text(text: str) -> bytes:
+    return zlib.compress(text.encode("utf-8"))
+
+
+def decompress_text(data: bytes) -> str:
+    return zlib.decompress(data).decode("utf-8")
+
+
+def compress_ops(ops: Sequence[TextOp]) -> bytes:
+    return zlib.compress(json.dumps([list(op) for op in ops], ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def decompress_ops(data: bytes) -> List[TextOp]:
+    return [tuple(op) for op in json.loads(zlib.decompress(data).decode("utf-8"))]
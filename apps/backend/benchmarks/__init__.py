@@ -0,0 +1,6 @@
+"""
+Load and latency benchmarks for the backend.
+
+Each module is a script that rebuilds the database in BENCHMARK_DATABASE_URL,
+seeds synthetic data and prints its measurements (see benchmarks.common).
+"""
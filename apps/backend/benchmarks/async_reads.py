@@ -0,0 +1,112 @@
+"""
+Concurrent latest-scene reads through the sync and async database stacks.
+
+The same read (the latest screenplay scenes of a random episode) is served
+three ways, each by its own route on a uvicorn server running in a
+background thread:
+
+- sync-on-loop: an async endpoint calling the sync repository, which blocks
+  the event loop for every query (how async endpoints read before the async
+  stack existed)
+- threadpool: a sync endpoint with get_db, run in Starlette's threadpool
+- async: an async endpoint with get_async_db and the aio repository
+
+CONCURRENCY clients keep one request each in flight over real connections for
+DURATION_SECONDS per route, so requests that wait behind a blocked event loop
+are counted; requests/s and latency percentiles are reported per route.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.async_reads
+"""
+import asyncio
+import random
+import socket
+import threading
+import time
+from typing import List
+from uuid import UUID
+
+import httpx
+import uvicorn
+from fastapi import Depends, FastAPI
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from benchmarks.common import engine, reset_database, seed_project, summary
+from app.db.session import SessionLocal, get_async_db, get_db
+from app.repositories.aio.scene import AsyncSceneRepository
+from app.repositories.scene import SceneRepository
+
+EPISODES = 50
+SCENES_PER_EPISODE = 40
+CONCURRENCY = 32
+DURATION_SECONDS = 5.0
+
+app = FastAPI()
+
+
+@app.get("/sync-on-loop/{episode_id}")
+async def sync_on_loop(episode_id: UUID):
+    db = SessionLocal()
+    try:
+        return len(SceneRepository(db).get_latest_by_episode_id(episode_id))
+    finally:
+        db.close()
+
+
+@app.get("/threadpool/{episode_id}")
+def threadpool(episode_id: UUID, db: Session = Depends(get_db)):
+    return len(SceneRepository(db).get_latest_by_episode_id(episode_id))
+
+
+@app.get("/async/{episode_id}")
+async def async_stack(episode_id: UUID, db: AsyncSession = Depends(get_async_db)):
+    return len(await AsyncSceneRepository(db).get_latest_by_episode_id(episode_id))
+
+
+def serve() -> str:
+    """Start the app on a free local port and return its base URL."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+async def load(base_url: str, route: str, episode_ids: List[UUID]) -> List[float]:
+    durations = []
+    limits = httpx.Limits(max_connections=CONCURRENCY)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + DURATION_SECONDS
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = await client.get(f"/{route}/{random.choice(episode_ids)}")
+                durations.append(time.perf_counter() - started)
+                assert response.json() == SCENES_PER_EPISODE, response.text
+
+        await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    return durations
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE)
+    with engine.connect() as connection:
+        episode_ids = connection.execute(
+            text("SELECT id FROM episodes WHERE project_id = :project_id"), {"project_id": project_id}
+        ).scalars().all()
+    base_url = serve()
+
+    print(f"{CONCURRENCY} concurrent clients, {DURATION_SECONDS:.0f}s per route, {SCENES_PER_EPISODE} scenes per read")
+    for route in ("sync-on-loop", "threadpool", "async"):
+        durations = asyncio.run(load(base_url, route, episode_ids))
+        print(f"{route:>13}: {len(durations) / DURATION_SECONDS:7.0f} requests/s, {summary(durations)}")
+
+
+if __name__ == "__main__":
+    main()
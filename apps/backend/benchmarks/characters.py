@@ -0,0 +1,44 @@
+"""
+The /characters endpoints on a large project.
+
+Seeds a project of EPISODES episodes with SCENES_PER_EPISODE scenes each and
+times, end to end through the API:
+
+- the scenes featuring a character who appears in many of them
+- that character's dialogue lines
+- a name that appears nowhere
+- per-character counts for one episode
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.characters
+"""
+from fastapi.testclient import TestClient
+
+from benchmarks.common import first_episode_id, measure, reset_database, seed_project, summary
+from app.main import app
+
+EPISODES = 200
+SCENES_PER_EPISODE = 500
+REPEAT = 10
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE)
+    episode_id = first_episode_id(project_id)
+
+    print(f"{EPISODES} episodes, {EPISODES * SCENES_PER_EPISODE} scenes")
+    with TestClient(app) as client:
+        for label, url, params in (
+            ("appearances", f"/characters/project/{project_id}/appearances", {"name": "Char7"}),
+            ("lines", f"/characters/project/{project_id}/lines", {"name": "Char7"}),
+            ("missing name", f"/characters/project/{project_id}/appearances", {"name": "Nobody"}),
+            ("episode counts", f"/characters/episode/{episode_id}", {}),
+        ):
+            response = client.get(url, params=params)
+            assert response.status_code == 200, response.text
+            durations = measure(lambda: client.get(url, params=params), repeat=REPEAT)
+            print(f"{label:>14}: {len(response.json()):5d} rows, {summary(durations)}")
+
+
+if __name__ == "__main__":
+    main()
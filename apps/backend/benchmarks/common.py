@@ -0,0 +1,202 @@
+"""
+Shared setup for the benchmarks.
+
+Benchmarks run against the PostgreSQL database in BENCHMARK_DATABASE_URL (the
+same postgres:// form as DATABASE_URL). Its public schema is dropped and
+rebuilt with ``create_all`` before each run and filled with synthetic data,
+so never point it at a database whose data you need.
+"""
+import os
+import statistics
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List
+from uuid import UUID
+
+BENCHMARK_DATABASE_URL = os.environ.get("BENCHMARK_DATABASE_URL", "")
+if not BENCHMARK_DATABASE_URL:
+    sys.exit("BENCHMARK_DATABASE_URL is not set; point it at a scratch PostgreSQL database")
+
+# The app reads its settings on import; make sure it can only ever reach the benchmark database
+os.environ["DATABASE_URL"] = BENCHMARK_DATABASE_URL
+os.environ["DATABASE_REPLICA_URL"] = ""
+os.environ.setdefault("AI_PROVIDER", "stub")
+# A purger running in the background would skew every timing
+os.environ.setdefault("PURGE_ENABLED", "false")
+
+from sqlalchemy import text  # noqa: E402
+
+from app.db import engine  # noqa: E402
+from app.db.base import Base  # noqa: E402
+
+CHARACTER_NAMES = 50
+
+
+def reset_database():
+    """Drop everything in the benchmark database and create the current schema."""
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(bind=engine)
+
+
+def seed_project(episodes: int = 200, scenes_per_episode: int = 500, name: str = "Synthetic") -> UUID:
+    """
+    Create a project whose episodes each have a story and one screenplay.
+
+    Every scene has its own body, with two of CHARACTER_NAMES characters
+    (Char0, Char1, ...) and three dialogue lines; the scene_characters index
+    is filled the way the migration backfills it. Rows are generated in SQL,
+    so a 100k-scene project takes seconds rather than minutes.
+    """
+    with engine.begin() as connection:
+        project_id = connection.execute(
+            text("INSERT INTO projects (id, name, status) VALUES (uuid_generate_v7(), :name, 'draft') RETURNING id"), {"name": name}
+        ).scalar_one()
+        # Hashes are unique per project so several seeded projects never share bodies
+        hash_seed = str(project_id)
+        connection.execute(
+            text(
+                """
+                INSERT INTO episodes (id, project_id, title, episode_number, status)
+                SELECT uuid_generate_v7(), :project_id, 'Episode ' || n, n, 'draft' FROM generate_series(1, :episodes) n
+                """
+            ),
+            {"project_id": project_id, "episodes": episodes},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO stories (id, episode_id, content)
+                SELECT uuid_generate_v7(), e.id,
+                       'Episode ' || e.episode_number || '. Char' || (e.episode_number % :names)
+                       || ' is walking home after the market. ' || repeat('The town is quiet tonight. ', 40)
+                FROM episodes e WHERE e.project_id = :project_id
+                """
+            ),
+            {"project_id": project_id, "names": CHARACTER_NAMES},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO screenplays (id, episode_id, ai_model, scene_count)
+                SELECT uuid_generate_v7(), e.id, 'synthetic', :scenes FROM episodes e WHERE e.project_id = :project_id
+                """
+            ),
+            {"project_id": project_id, "scenes": scenes_per_episode},
+        )
+        connection.execute(
+            text(
+                """
+                UPDATE episodes e SET latest_screenplay_id = s.id
+                FROM screenplays s WHERE s.episode_id = e.id AND e.project_id = :project_id
+                """
+            ),
+            {"project_id": project_id},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO scene_contents (content_hash, title, duration_seconds, characters, dialogue, prompt)
+                SELECT md5(:seed || 'c' || g) || md5(:seed || 'd' || g), 'Scene ' || g, 10,
+                       jsonb_build_array('Char' || (g % :names), 'Char' || ((g * 7) % :names)),
+                       jsonb_build_array(
+                           jsonb_build_object('character', 'Char' || (g % :names), 'line', 'line a ' || g),
+                           jsonb_build_object('character', 'Char' || ((g * 7) % :names), 'line', 'line b ' || g),
+                           jsonb_build_object('character', 'Char' || (g % :names), 'line', 'line c ' || g)
+                       ),
+                       repeat('prompt ', 40)
+                FROM generate_series(1, :scenes) g
+                """
+            ),
+            {"seed": hash_seed, "scenes": episodes * scenes_per_episode, "names": CHARACTER_NAMES},
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO scenes (id, screenplay_id, scene_number, content_hash)
+                SELECT uuid_generate_v7(), s.id, ((g - 1) % :per_episode) + 1, md5(:seed || 'c' || g) || md5(:seed || 'd' || g)
+                FROM generate_series(1, :scenes) g
+                JOIN (
+                    SELECT s.id, row_number() OVER (ORDER BY e.episode_number) AS position
+                    FROM screenplays s JOIN episodes e ON e.id = s.episode_id
+                    WHERE e.project_id = :project_id
+                ) s ON s.position = ((g - 1) / :per_episode) + 1
+                """
+            ),
+            {
+                "seed": hash_seed,
+                "project_id": project_id,
+                "per_episode": scenes_per_episode,
+                "scenes": episodes * scenes_per_episode,
+            },
+        )
+        connection.execute(
+            text(
+                """
+                INSERT INTO scene_characters (content_hash, name, line_count)
+                WITH bodies AS (
+                    SELECT c.* FROM scene_contents c
+                    JOIN scenes s ON s.content_hash = c.content_hash
+                    JOIN screenplays p ON p.id = s.screenplay_id
+                    JOIN episodes e ON e.id = p.episode_id
+                    WHERE e.project_id = :project_id
+                )
+                SELECT content_hash, name, sum(is_line)::int FROM (
+                    SELECT content_hash, jsonb_array_elements_text(characters) AS name, 0 AS is_line FROM bodies
+                    UNION ALL
+                    SELECT content_hash, line->>'character', 1 FROM bodies, jsonb_array_elements(dialogue) AS line
+                ) names
+                WHERE name <> '' GROUP BY content_hash, name
+                ON CONFLICT DO NOTHING
+                """
+            ),
+            {"project_id": project_id},
+        )
+    with engine.connect() as connection:
+        connection.execution_options(isolation_level="AUTOCOMMIT").execute(text("ANALYZE"))
+    return project_id
+
+
+def first_episode_id(project_id: UUID) -> UUID:
+    with engine.connect() as connection:
+        return connection.execute(
+            text("SELECT id FROM episodes WHERE project_id = :project_id ORDER BY episode_number LIMIT 1"),
+            {"project_id": project_id},
+        ).scalar_one()
+
+
+def measure(fn: Callable[[], object], repeat: int = 10) -> List[float]:
+    """Seconds taken by each of ``repeat`` calls."""
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        durations.append(time.perf_counter() - started)
+    return durations
+
+
+@contextmanager
+def timer() -> Iterator[Dict[str, float]]:
+    """Time a block; the elapsed seconds are in the yielded dict's "seconds"."""
+    elapsed = {}
+    started = time.perf_counter()
+    try:
+        yield elapsed
+    finally:
+        elapsed["seconds"] = time.perf_counter() - started
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def ms(seconds: float) -> str:
+    return f"{seconds * 1000:.1f} ms"
+
+
+def summary(durations: List[float]) -> str:
+    """Median and p99 of a list of durations in seconds."""
+    return f"p50 {ms(statistics.median(durations))}, p99 {ms(percentile(durations, 0.99))}"
@@ -0,0 +1,104 @@
+"""
+Bytes transferred and latency for repeated tab switches in the episode editor.
+
+A tab switch re-reads the project's episode list, the episode's story and its
+latest screenplay. The episode has a long Malayalam story and a screenplay of
+SCENES scenes with Malayalam dialogue. Each mode repeats SWITCHES tab switches:
+
+- plain: full bodies, no compression (how every read worked before ETags)
+- gzip: full bodies with Accept-Encoding: gzip
+- revalidate: gzip plus If-None-Match with the ETags from the first switch,
+  so unchanged resources come back as 304 with no body
+
+Bytes are response body bytes on the wire, before decompression. The read
+caches are off, so revalidation goes through the narrow version queries.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.conditional_get
+"""
+import random
+import statistics
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import first_episode_id, ms, reset_database, seed_project, timer
+from app.core.cache import scenes_cache, story_cache
+from app.db.session import session_scope
+from app.main import app
+from app.models.episode import Episode
+from app.models.screenplay import Screenplay
+from app.repositories.scene import SceneRepository
+
+EPISODES = 20
+SCENES = 60
+SWITCHES = 50
+WORDS = (
+    "രാജു മീര അമ്മ വൈകുന്നേരം ചന്തയിൽ നിന്ന് വീട്ടിലേക്ക് നടന്നു വാതിൽക്കൽ കാത്തുനിന്നു നീ ഇത്ര വൈകിയത് "
+    "എന്താ അന്വേഷിച്ചു നാളെ രാവിലെ നമുക്ക് അമ്പലത്തിൽ പോകണം മഴ പെയ്തു പുഴ കടന്ന് വയലിലൂടെ വിളക്ക് "
+    "കത്തിച്ചു കഥ പറഞ്ഞു ചിരിച്ചു കരഞ്ഞു ഓർമ്മ സ്കൂൾ കൂട്ടുകാരൻ കത്ത് വന്നു പണം ജോലി പട്ടണത്തിൽ"
+).split()
+# Random sentences rather than one repeated line, so gzip sees text that compresses like real prose
+rng = random.Random(42)
+
+
+def sentence(length: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(length)) + "."
+
+
+STORY = " ".join(sentence(12) for _ in range(300))
+
+
+def add_malayalam_screenplay(episode_id):
+    with session_scope() as db:
+        screenplay = Screenplay(episode_id=episode_id, ai_model="synthetic", scene_count=SCENES)
+        db.add(screenplay)
+        db.flush()
+        SceneRepository(db).insert_rows([
+            {
+                "screenplay_id": screenplay.id,
+                "scene_number": number,
+                "title": f"രംഗം {number}",
+                "duration_seconds": 12,
+                "characters": ["രാജു", "മീര"],
+                "dialogue": [{"character": name, "line": sentence(16)} for name in ("രാജു", "മീര", "രാജു", "മീര")],
+                "prompt": f"Evening, village lane, scene {number}. Raju walks home past the temple as lamps are lit.",
+            }
+            for number in range(1, SCENES + 1)
+        ])
+        db.get(Episode, episode_id).latest_screenplay_id = screenplay.id
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES)
+    episode_id = first_episode_id(project_id)
+    add_malayalam_screenplay(episode_id)
+    scenes_cache.enabled = False
+    story_cache.enabled = False
+    urls = [f"/episodes/project/{project_id}", f"/stories/episode/{episode_id}", f"/screenplays/episode/{episode_id}"]
+
+    with TestClient(app) as client:
+        assert client.patch(f"/stories/episode/{episode_id}", json={"content": STORY}).status_code == 200
+        etags: Dict[str, str] = {url: client.get(url).headers["etag"] for url in urls}
+
+        print(f"{SWITCHES} tab switches over {len(urls)} reads; story {len(STORY)} characters, {SCENES} scenes")
+        for mode in ("plain", "gzip", "revalidate"):
+            sent: List[int] = []
+            durations: List[float] = []
+            for _ in range(SWITCHES):
+                total = 0
+                with timer() as elapsed:
+                    for url in urls:
+                        headers = {"accept-encoding": "identity" if mode == "plain" else "gzip"}
+                        if mode == "revalidate":
+                            headers["if-none-match"] = etags[url]
+                        response = client.get(url, headers=headers)
+                        assert response.status_code == (304 if mode == "revalidate" else 200), response.text
+                        total += response.num_bytes_downloaded
+                durations.append(elapsed["seconds"])
+                sent.append(total)
+            print(f"{mode:>10}: {sent[0] / 1024:7.1f} KiB per switch, p50 {ms(statistics.median(durations))}")
+
+
+if __name__ == "__main__":
+    main()
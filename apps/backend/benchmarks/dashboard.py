@@ -0,0 +1,81 @@
+"""
+The dashboard endpoints against the call waterfall they replace.
+
+Before /dashboard existed, the project list and project detail pages called:
+- GET /projects, then GET /episodes/project/{id}
+- then GET /stories/episode/{id} and GET /screenplays/episode/{id} for every
+  episode
+
+The benchmark loads the same page both ways and reports requests, SQL
+statements (from the X-DB-Statement-Count header) and wall time per page
+load. The read caches are off so every load reaches the database.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.dashboard
+"""
+import statistics
+from typing import Callable, Tuple
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+
+from benchmarks.common import ms, reset_database, seed_project, timer
+from app.core.cache import scenes_cache, story_cache
+from app.db.statements import STATEMENT_COUNT_HEADER
+from app.main import app
+
+PROJECTS = 10
+EPISODES = 30
+SCENES_PER_EPISODE = 40
+REPEAT = 10
+
+
+def waterfall(client: TestClient, project_id: UUID) -> Tuple[int, int]:
+    requests = statements = 0
+
+    def get(url: str):
+        nonlocal requests, statements
+        response = client.get(url)
+        assert response.status_code == 200, response.text
+        requests += 1
+        statements += int(response.headers[STATEMENT_COUNT_HEADER])
+        return response.json()
+
+    get("/projects")
+    for episode in get(f"/episodes/project/{project_id}"):
+        get(f"/stories/episode/{episode['id']}")
+        get(f"/screenplays/episode/{episode['id']}")
+    return requests, statements
+
+
+def dashboard(client: TestClient, project_id: UUID) -> Tuple[int, int]:
+    statements = 0
+    for url in ("/dashboard/projects", f"/dashboard/projects/{project_id}"):
+        response = client.get(url)
+        assert response.status_code == 200, response.text
+        statements += int(response.headers[STATEMENT_COUNT_HEADER])
+    return 2, statements
+
+
+def run(label: str, load: Callable[[TestClient, UUID], Tuple[int, int]], client: TestClient, project_id: UUID):
+    durations = []
+    for _ in range(REPEAT):
+        with timer() as elapsed:
+            requests, statements = load(client, project_id)
+        durations.append(elapsed["seconds"])
+    print(f"{label:>9}: {requests:4d} requests, {statements:4d} statements, p50 {ms(statistics.median(durations))}")
+
+
+def main():
+    reset_database()
+    project_ids = [seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE) for _ in range(PROJECTS)]
+    scenes_cache.enabled = False
+    story_cache.enabled = False
+
+    print(f"{PROJECTS} projects of {EPISODES} episodes with {SCENES_PER_EPISODE} scenes each; one page load:")
+    with TestClient(app) as client:
+        run("waterfall", waterfall, client, project_ids[0])
+        run("dashboard", dashboard, client, project_ids[0])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+NDJSON project export and import on a large project.
+
+Seeds a project of EPISODES episodes with SCENES_PER_EPISODE scenes each, then
+runs the CLI commands, each in its own process so its peak RSS can be read:
+
+- export-project to a temporary file
+- import-project into an emptied database, so every scene body is new
+- import-project again, so every scene body is already stored
+
+The peak RSS of a process that only imports the modules involved is printed
+as the baseline.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.project_transfer
+"""
+import os
+import subprocess
+import sys
+import tempfile
+from typing import List
+
+from benchmarks.common import reset_database, seed_project, timer
+
+EPISODES = 200
+SCENES_PER_EPISODE = 500
+
+
+def run(label: str, arguments: List[str]):
+    """Run a Python subprocess and print its wall time and peak RSS."""
+    with timer() as elapsed:
+        process = subprocess.Popen([sys.executable, *arguments], stderr=subprocess.PIPE, text=True)
+        _, status, usage = os.wait4(process.pid, 0)
+    stderr = process.stderr.read()
+    process.stderr.close()
+    if os.waitstatus_to_exitcode(status) != 0:
+        sys.exit(f"{label} failed:\n{stderr}")
+    # ru_maxrss is in KiB on Linux
+    print(f"{label:>22}: {elapsed['seconds']:6.1f} s, peak RSS {usage.ru_maxrss / 1024:4.0f} MiB")
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE)
+
+    print(f"{EPISODES} episodes, {EPISODES * SCENES_PER_EPISODE} scenes")
+    run("modules only", ["-c", "import app.cli, app.services.project_transfer"])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "project.ndjson")
+        run("export", ["-m", "app.cli", "export-project", "--project-id", str(project_id), "--output", path])
+        print(f"{'export size':>22}: {os.path.getsize(path) / 2**20:6.1f} MiB")
+        reset_database()
+        run("import, new contents", ["-m", "app.cli", "import-project", "--input", path])
+        run("import, stored contents", ["-m", "app.cli", "import-project", "--input", path])
+
+
+if __name__ == "__main__":
+    main()
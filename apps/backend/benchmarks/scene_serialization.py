@@ -0,0 +1,68 @@
+"""
+Serializing 1k and 10k scenes into a JSON response body.
+
+The scenes are loaded once from the database, then only the serialization is
+timed, three ways:
+
+- previous: SceneResponse.model_validate per row, then FastAPI's
+  response_model handling (dump to dicts, validate again, encode) and the
+  standard library JSONResponse, as the scenes endpoint worked before
+- orjson: the same response_model handling rendered by ORJSONResponse, the
+  app's default response class for every other endpoint
+- current: SceneResponse.from_row per row and one SCENE_LIST_ADAPTER.dump_json
+  call, as the scenes endpoints now do through json_response
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.scene_serialization
+"""
+import asyncio
+from typing import List
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from benchmarks.common import first_episode_id, measure, reset_database, seed_project, summary
+from app.core.responses import json_response
+from app.db.session import SessionLocal
+from app.models.screenplay import Scene
+from app.repositories.scene import SceneRepository
+from app.schemas.screenplay import SCENE_LIST_ADAPTER, SceneResponse
+
+SIZES = (1_000, 10_000)
+REPEAT = 20
+
+response_field = create_model_field(name="Response", type_=List[SceneResponse], mode="serialization")
+
+
+def with_response_model(scenes: List[Scene], response_class) -> bytes:
+    responses = [SceneResponse.model_validate(scene) for scene in scenes]
+    content = asyncio.run(serialize_response(field=response_field, response_content=responses))
+    return response_class(content).body
+
+
+def current(scenes: List[Scene]) -> bytes:
+    return json_response(SCENE_LIST_ADAPTER, [SceneResponse.from_row(scene) for scene in scenes]).body
+
+
+def main():
+    reset_database()
+    episode_ids = [first_episode_id(seed_project(episodes=1, scenes_per_episode=size)) for size in SIZES]
+
+    for size, episode_id in zip(SIZES, episode_ids):
+        db = SessionLocal()
+        try:
+            scenes = SceneRepository(db).get_latest_by_episode_id(episode_id)
+        finally:
+            db.close()
+        assert len(scenes) == size
+        print(f"{size} scenes:")
+        for label, serialize in (
+            ("previous", lambda: with_response_model(scenes, JSONResponse)),
+            ("orjson", lambda: with_response_model(scenes, ORJSONResponse)),
+            ("current", lambda: current(scenes)),
+        ):
+            print(f"{label:>10}: {summary(measure(serialize, repeat=REPEAT))}, {len(serialize()) / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Project search on a large project.
+
+Seeds a project of EPISODES episodes with SCENES_PER_EPISODE scenes each and
+times the first page of GET /search/project/{id} for:
+
+- a selective term ("12345", one scene title and its dialogue)
+- a phrase found in every story ("walking home")
+- a term found in every scene ("line"), where ranking reads every match
+- a fragment that only the substring match finds ("ine a 1234")
+
+Each query runs twice: as the endpoint serves it, and with the substring
+match switched off so the full-text part is timed on its own. The substring
+match is indexed only where pg_trgm is available; the script says which case
+it ran.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.search
+"""
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from benchmarks.common import engine, measure, reset_database, seed_project, summary
+from app.main import app
+from app.repositories import search
+
+EPISODES = 200
+SCENES_PER_EPISODE = 500
+QUERIES = ("12345", "walking home", "line", "ine a 1234")
+REPEAT = 5
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE)
+    with engine.connect() as connection:
+        trigram_indexes = connection.execute(
+            text("SELECT count(*) FROM pg_indexes WHERE schemaname = 'public' AND indexname LIKE '%\\_trgm'")
+        ).scalar_one()
+
+    print(
+        f"{EPISODES} episodes, {EPISODES * SCENES_PER_EPISODE} scenes; "
+        f"substring match {'indexed' if trigram_indexes else 'unindexed (no pg_trgm)'}"
+    )
+    with TestClient(app) as client:
+        url = f"/search/project/{project_id}"
+        min_substring_length = search.MIN_SUBSTRING_LENGTH
+        for label, substring_length in (("with substring", min_substring_length), ("full-text only", float("inf"))):
+            print(f"{label}:")
+            search.MIN_SUBSTRING_LENGTH = substring_length
+            for query in QUERIES:
+                response = client.get(url, params={"q": query})
+                assert response.status_code == 200, response.text
+                durations = measure(lambda: client.get(url, params={"q": query}), repeat=REPEAT)
+                print(f"{query!r:>14}: {len(response.json()):3d} results on the page, {summary(durations)}")
+        search.MIN_SUBSTRING_LENGTH = min_substring_length
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Soft delete and background purge of a large project.
+
+Seeds a project of EPISODES episodes with SCENES_PER_EPISODE scenes each and
+measures:
+
+- the latest-scenes read of one episode, which now carries the soft-delete
+  filter: the repository query alone, and the endpoint (read cache off)
+- DELETE /projects/{id}, which only stamps deleted_at
+- purging the deleted rows in PURGE_BATCH_SIZE batches with no pause, as one
+  purger would: rows per second and per-batch latency
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.soft_delete
+"""
+import statistics
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from benchmarks.common import engine, first_episode_id, measure, ms, reset_database, seed_project, summary, timer
+from app.core.cache import scenes_cache
+from app.db.session import SessionLocal
+from app.main import app
+from app.repositories.scene import SceneRepository
+from app.services.purger import DeletedRowPurger
+
+EPISODES = 200
+SCENES_PER_EPISODE = 500
+PURGE_BATCH_SIZE = 1000
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EPISODES, scenes_per_episode=SCENES_PER_EPISODE)
+    episode_id = first_episode_id(project_id)
+    scenes_cache.enabled = False
+
+    print(f"{EPISODES} episodes, {EPISODES * SCENES_PER_EPISODE} scenes")
+    db = SessionLocal()
+    try:
+        durations = measure(lambda: SceneRepository(db).get_latest_by_episode_id(episode_id), repeat=30)
+    finally:
+        db.close()
+    print(f"latest scenes query: {summary(durations)}")
+    with TestClient(app) as client:
+        durations = measure(lambda: client.get(f"/screenplays/episode/{episode_id}").raise_for_status(), repeat=30)
+        print(f"latest scenes endpoint: {summary(durations)}")
+        with timer() as elapsed:
+            client.delete(f"/projects/{project_id}").raise_for_status()
+        print(f"project delete: {ms(elapsed['seconds'])}")
+
+    purger = DeletedRowPurger(batch_size=PURGE_BATCH_SIZE, batch_pause_seconds=0, idle_seconds=1)
+    batches = []
+    rows = 0
+    with timer() as elapsed:
+        while True:
+            with timer() as batch:
+                deleted = purger.purge_batch()
+            if not deleted:
+                break
+            batches.append(batch["seconds"])
+            rows += deleted
+    print(
+        f"purge: {rows} rows in {len(batches)} batches, {elapsed['seconds']:.1f} s, "
+        f"{rows / elapsed['seconds']:.0f} rows/s; batch p50 {ms(statistics.median(batches))}, max {ms(max(batches))}"
+    )
+    with engine.connect() as connection:
+        left = connection.execute(text("SELECT (SELECT count(*) FROM scenes) + (SELECT count(*) FROM episodes)")).scalar_one()
+    assert left == 0, f"{left} scenes and episodes left after the purge"
+
+
+if __name__ == "__main__":
+    main()
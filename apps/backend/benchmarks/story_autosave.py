@@ -0,0 +1,104 @@
+"""
+Database writes and save latency under simulated typing, with and without
+the story write-behind buffer.
+
+EDITORS editors work on their own episode's story at once. Each sends an
+autosave PATCH (a few typed characters as ops against base_revision) every
+TYPING_INTERVAL_SECONDS, with some jitter, for DURATION_SECONDS. The run is
+repeated with STORY_WRITE_BEHIND off and on, using the configured flush
+settings.
+
+Reported per run: client save latency, story revisions written per second,
+and transactions committed per second in the database (pg_stat_database, so
+it includes the app's background work). Revisions are counted after the app
+shuts down, which flushes anything still buffered.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.story_autosave
+"""
+import random
+import threading
+import time
+from typing import List
+from uuid import UUID
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from benchmarks.common import engine, reset_database, seed_project, summary
+from app.core.config import settings
+from app.main import app
+
+EDITORS = 10
+TYPING_INTERVAL_SECONDS = 0.3
+DURATION_SECONDS = 15.0
+
+
+def database_counters() -> tuple:
+    """Story revisions stored and transactions committed so far."""
+    with engine.connect() as connection:
+        connection.execute(text("SELECT pg_stat_clear_snapshot()"))
+        revisions = connection.execute(text("SELECT count(*) FROM story_revisions")).scalar_one()
+        commits = connection.execute(
+            text("SELECT xact_commit FROM pg_stat_database WHERE datname = current_database()")
+        ).scalar_one()
+    return revisions, commits
+
+
+def type_into(client: TestClient, episode_id: UUID, seed: int, durations: List[float]):
+    rng = random.Random(seed)
+    url = f"/stories/episode/{episode_id}"
+    story = client.get(url).json()
+    revision, length = story["revision"], len(story["content"] or "")
+    deadline = time.perf_counter() + DURATION_SECONDS
+    while time.perf_counter() < deadline:
+        time.sleep(TYPING_INTERVAL_SECONDS * rng.uniform(0.5, 1.5))
+        typed = "".join(rng.choice("abcdefghij ") for _ in range(rng.randint(1, 4)))
+        started = time.perf_counter()
+        response = client.patch(url, json={"ops": [{"position": length, "insert": typed}], "base_revision": revision})
+        durations.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.text
+        revision, length = response.json()["revision"], length + len(typed)
+
+
+def run(write_behind: bool, episode_ids: List[UUID]):
+    settings.STORY_WRITE_BEHIND = write_behind
+    durations: List[float] = []
+    revisions, commits = database_counters()
+    with TestClient(app) as client:
+        editors = [
+            threading.Thread(target=type_into, args=(client, episode_id, seed, durations))
+            for seed, episode_id in enumerate(episode_ids)
+        ]
+        for editor in editors:
+            editor.start()
+        for editor in editors:
+            editor.join()
+    # Statistics reach pg_stat_database shortly after each transaction ends
+    time.sleep(1)
+    written, committed = (after - before for after, before in zip(database_counters(), (revisions, commits)))
+    label = "write-behind" if write_behind else "direct"
+    print(
+        f"{label:>12}: {len(durations) / DURATION_SECONDS:5.1f} saves/s, save {summary(durations)}; "
+        f"{written / DURATION_SECONDS:5.1f} revisions/s, {committed / DURATION_SECONDS:5.1f} commits/s"
+    )
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=EDITORS, scenes_per_episode=1)
+    with engine.connect() as connection:
+        episode_ids = connection.execute(
+            text("SELECT id FROM episodes WHERE project_id = :project_id"), {"project_id": project_id}
+        ).scalars().all()
+
+    print(
+        f"{EDITORS} editors saving every ~{TYPING_INTERVAL_SECONDS}s for {DURATION_SECONDS:.0f}s; "
+        f"flush after {settings.STORY_FLUSH_DEBOUNCE_SECONDS}s idle, {settings.STORY_FLUSH_MAX_DELAY_SECONDS}s "
+        f"pending or {settings.STORY_FLUSH_MAX_EDITS} edits"
+    )
+    run(False, episode_ids)
+    run(True, episode_ids)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Revision storage growth and save latency for a long story with many small edits.
+
+A STORY_CHARACTERS-character story receives EDITS autosaves, each inserting a
+word or deleting a few characters at a random position. Saves are sent two
+ways, on separate stories:
+
+- content: the whole text on every PATCH, as the editor saved before
+- ops: only the edit operation against base_revision
+
+Reported per mode: save latency, request body size, and the on-disk size of story_revisions next
+to what keeping every revision as a full copy would take. Reading random old
+revisions back through GET .../revisions/{n} is timed at the end.
+
+Write-behind buffering is off (the default), so every save is a revision.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.story_revisions
+"""
+import json
+import random
+from typing import List
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from benchmarks.common import engine, measure, ms, reset_database, seed_project, summary, timer
+from app.main import app
+
+STORY_CHARACTERS = 50_000
+EDITS = 1_000
+REVISION_READS = 100
+WORDS = "Raju Meera market temple river evening lamp letter train rain quietly suddenly".split()
+
+
+def revision_bytes() -> int:
+    """story_revisions on disk, with its indexes and TOAST data."""
+    with engine.connect() as connection:
+        return connection.execute(text("SELECT pg_total_relation_size('story_revisions')")).scalar_one()
+
+
+def edit(rng: random.Random, content: str) -> dict:
+    position = rng.randrange(len(content))
+    if rng.random() < 0.7:
+        return {"position": position, "insert": f" {rng.choice(WORDS)}"}
+    return {"position": position, "delete": min(rng.randint(1, 5), len(content) - position)}
+
+
+def apply(content: str, op: dict) -> str:
+    position = op["position"]
+    return content[:position] + op.get("insert", "") + content[position + op.get("delete", 0):]
+
+
+def main():
+    reset_database()
+    project_id = seed_project(episodes=2, scenes_per_episode=1)
+    with engine.connect() as connection:
+        episode_ids = connection.execute(
+            text("SELECT id FROM episodes WHERE project_id = :project_id ORDER BY episode_number"),
+            {"project_id": project_id},
+        ).scalars().all()
+    rng = random.Random(42)
+    initial = " ".join(rng.choice(WORDS) for _ in range(STORY_CHARACTERS // 6))[:STORY_CHARACTERS]
+
+    print(f"{EDITS} small edits to a {len(initial)}-character story")
+    with TestClient(app) as client:
+        for mode, episode_id in zip(("content", "ops"), episode_ids):
+            url = f"/stories/episode/{episode_id}"
+            before = revision_bytes()
+            response = client.patch(url, json={"content": initial})
+            revision = response.json()["revision"]
+            content = initial
+            full_copies = len(content.encode())
+            durations: List[float] = []
+            sent = 0
+            for _ in range(EDITS):
+                op = edit(rng, content)
+                content = apply(content, op)
+                body = {"content": content} if mode == "content" else {"ops": [op], "base_revision": revision}
+                sent += len(json.dumps(body))
+                with timer() as elapsed:
+                    response = client.patch(url, json=body)
+                durations.append(elapsed["seconds"])
+                assert response.status_code == 200, response.text
+                revision = response.json()["revision"]
+                full_copies += len(content.encode())
+            assert client.get(url).json()["content"] == content
+            stored = revision_bytes() - before
+            print(
+                f"{mode:>8}: save {summary(durations)}, {sent / EDITS / 1024:.1f} KiB sent per save; revisions use {stored / 2**20:.1f} MiB on disk, "
+                f"full copies would be {full_copies / 2**20:.1f} MiB"
+            )
+
+        reads = iter(rng.randint(1, revision) for _ in range(REVISION_READS))
+        durations = measure(lambda: client.get(f"{url}/revisions/{next(reads)}").raise_for_status(), repeat=REVISION_READS)
+        print(f"random revision reads: {summary(durations)}, max {ms(max(durations))}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Insert throughput and primary key size with random (v4) and time-ordered (v7)
+UUID keys.
+
+Rows go into a scenes-shaped table (uuid primary key plus a (screenplay_id,
+scene_number) index) with INSERT ... SELECT in BATCH_SIZE-row batches, once
+with gen_random_uuid() and once with uuid_generate_v7(). Reported per key
+type: overall rows/s, rows/s over the last ten batches (where a random key
+index that no longer fits in shared_buffers slows down) and the primary key
+index size.
+
+    BENCHMARK_DATABASE_URL=postgres://... python -m benchmarks.uuid_keys [--rows 10000000]
+"""
+import argparse
+
+from sqlalchemy import text
+
+from benchmarks.common import engine, reset_database, timer
+
+BATCH_SIZE = 100_000
+KEY_FUNCTIONS = ("gen_random_uuid()", "uuid_generate_v7()")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Insert throughput and primary key size with v4 and v7 UUID keys")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="Rows inserted per key type")
+    args = parser.parse_args()
+    batches = max(1, args.rows // BATCH_SIZE)
+
+    reset_database()
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        print(f"{batches * BATCH_SIZE} rows per key type, {BATCH_SIZE}-row batches")
+        for key_function in KEY_FUNCTIONS:
+            connection.execute(text("DROP TABLE IF EXISTS benchmark_scenes"))
+            connection.execute(text(
+                "CREATE TABLE benchmark_scenes (id uuid PRIMARY KEY, screenplay_id uuid NOT NULL, "
+                "scene_number integer NOT NULL, created_at timestamp DEFAULT now())"
+            ))
+            connection.execute(text("CREATE INDEX ON benchmark_scenes (screenplay_id, scene_number)"))
+            connection.execute(text("CHECKPOINT"))
+            durations = []
+            with timer() as elapsed:
+                for batch in range(batches):
+                    with timer() as insert:
+                        # 500 scenes per screenplay, screenplay ids in insertion order
+                        connection.execute(
+                            text(
+                                f"INSERT INTO benchmark_scenes (id, screenplay_id, scene_number) "
+                                f"SELECT {key_function}, "
+                                f"('00000000-0000-0000-0000-' || lpad(to_hex(g / 500), 12, '0'))::uuid, g % 500 "
+                                f"FROM generate_series(:first, :last) g"
+                            ),
+                            {"first": batch * BATCH_SIZE, "last": (batch + 1) * BATCH_SIZE - 1},
+                        )
+                    durations.append(insert["seconds"])
+            primary_key = connection.execute(text("SELECT pg_relation_size('benchmark_scenes_pkey')")).scalar_one()
+            tail = durations[-10:]
+            print(
+                f"{key_function:>19}: {batches * BATCH_SIZE / elapsed['seconds']:8.0f} rows/s, "
+                f"last {len(tail)} batches {len(tail) * BATCH_SIZE / sum(tail):8.0f} rows/s, "
+                f"primary key {primary_key / 2**20:.0f} MiB"
+            )
+        connection.execute(text("DROP TABLE benchmark_scenes"))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Shared fixtures.
+
+Database tests run against the PostgreSQL database in TEST_DATABASE_URL. Its
+public schema is dropped and rebuilt once per test session, the way the app
+builds a fresh database (``create_all`` plus the objects in app.db.ddl), so
+never point it at a database whose data you need. Without TEST_DATABASE_URL
+those tests are skipped.
+"""
+import os
+from typing import Iterator
+
+import pytest
+
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL", "")
+
+# The app reads DATABASE_URL on import; make sure it can only ever reach the test database
+os.environ["DATABASE_URL"] = TEST_DATABASE_URL or "postgres://localhost/test_database_url_not_set"
+
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def database() -> Engine:
+    """An empty database with the current schema."""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+    from app.db import engine
+    from app.db.base import Base
+
+    with engine.begin() as connection:
+        connection.execute(text("DROP SCHEMA public CASCADE"))
+        connection.execute(text("CREATE SCHEMA public"))
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+@pytest.fixture
+def db(database: Engine) -> Iterator[Session]:
+    """A session whose changes, including commits, are rolled back after the test."""
+    from app.db.session import SessionLocal
+
+    connection = database.connect()
+    transaction = connection.begin()
+    session = SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
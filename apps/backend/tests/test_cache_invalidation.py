@@ -0,0 +1,42 @@
+"""
+A malformed invalidation on the shared NOTIFY channel is logged and ignored,
+without raising in the listener thread (which would reconnect and clear every
+cache), and without touching entries other invalidations did not name.
+"""
+import json
+import time
+from uuid import uuid4
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import TTLCache, _apply_invalidation
+
+
+@pytest.fixture
+def story_cache(monkeypatch: pytest.MonkeyPatch) -> TTLCache:
+    story_cache = TTLCache("story", max_entries=10, ttl_seconds=60)
+    monkeypatch.setitem(cache_module._caches, "story", story_cache)
+    return story_cache
+
+
+@pytest.mark.parametrize("payload", [
+    "not json",
+    json.dumps([1, 2]),
+    json.dumps({"cache": "story", "key": "not-a-uuid", "sent_at": 0}),
+    json.dumps({"cache": "story", "key": str(uuid4())}),
+    json.dumps({"cache": "story", "key": str(uuid4()), "sent_at": None}),
+    json.dumps({"cache": "story", "key": 7, "sent_at": 0}),
+])
+def test_malformed_invalidations_are_ignored(story_cache: TTLCache, payload: str):
+    key = uuid4()
+    story_cache.set(key, "Raju")
+    _apply_invalidation(payload)
+    assert story_cache.get(key) == "Raju"
+
+
+def test_an_invalidation_evicts_its_key(story_cache: TTLCache):
+    key = uuid4()
+    story_cache.set(key, "Raju")
+    _apply_invalidation(json.dumps({"cache": "story", "key": str(key), "sent_at": time.time()}))
+    assert story_cache.get(key) is None
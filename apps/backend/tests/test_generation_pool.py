@@ -0,0 +1,83 @@
+"""
+Screenplay generation must not hold a pooled connection while the AI call is
+in flight, or a handful of concurrent generations starves every other request.
+
+More generations than the pool has connections run at once against the stub
+provider, whose latency is well past the pool checkout timeout: holding a
+connection across the AI call would make the later checkouts time out.
+"""
+import asyncio
+from typing import Iterator, List
+from uuid import UUID
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+
+from app.db.replica import RoutingSession
+from app.db.session import DATABASE_URL, session_scope
+from app.models.episode import Episode
+from app.models.project import Project
+from app.models.story import Story
+
+GENERATIONS = 8
+POOL_SIZE = 2
+POOL_TIMEOUT_SECONDS = 0.5
+AI_LATENCY_SECONDS = 1.5
+
+
+@pytest.fixture
+def episode_ids(database: Engine) -> Iterator[List[UUID]]:
+    """Committed episodes with stories, visible to every connection; removed afterwards."""
+    with session_scope() as db:
+        project = Project(name="Pool")
+        db.add(project)
+        db.flush()
+        episodes = [Episode(project_id=project.id, title=f"Episode {n}", episode_number=n) for n in range(1, GENERATIONS + 1)]
+        db.add_all(episodes)
+        db.flush()
+        db.add_all(
+            Story(episode_id=episode.id, content=f"Raju arrives in town {n}.\n\nHe meets Meera at the market.")
+            for n, episode in enumerate(episodes)
+        )
+    try:
+        yield [episode.id for episode in episodes]
+    finally:
+        with database.begin() as connection:
+            connection.execute(text("DELETE FROM projects WHERE id = :id"), {"id": project.id})
+
+
+@pytest.fixture
+def small_pool() -> Iterator[Engine]:
+    engine = create_engine(DATABASE_URL, pool_size=POOL_SIZE, max_overflow=0, pool_timeout=POOL_TIMEOUT_SECONDS)
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_concurrent_generations_do_not_exhaust_the_pool(episode_ids: List[UUID], small_pool: Engine):
+    from app.services.ai.stub_ai_service import StubAIService
+    from app.services.screenplay import ScreenplayService
+
+    ai_service = StubAIService()
+    ai_service.latency_seconds = AI_LATENCY_SECONDS
+    Session = sessionmaker(bind=small_pool, class_=RoutingSession, autoflush=False, expire_on_commit=False)
+
+    async def generate(episode_id: UUID):
+        db = Session()
+        try:
+            return await ScreenplayService(db, ai_service).generate_screenplay(episode_id)
+        finally:
+            db.close()
+
+    async def generate_all():
+        return await asyncio.gather(*(generate(episode_id) for episode_id in episode_ids))
+
+    screenplays = asyncio.run(generate_all())
+
+    assert [screenplay.episode_id for screenplay in screenplays] == episode_ids
+    assert all(screenplay.scenes for screenplay in screenplays)
+    # Every connection went back to the pool
+    assert small_pool.pool.checkedout() == 0
@@ -0,0 +1,83 @@
+"""
+List endpoints keep the contract clients had before keyset pagination:
+GET /projects still honours skip, and GET /episodes/project/{id} returns every
+episode unless the client asks for a page with limit or cursor.
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.pagination import DEFAULT_PAGE_SIZE, NEXT_CURSOR_HEADER
+from app.models.episode import Episode
+from app.models.project import Project
+
+EPISODES = DEFAULT_PAGE_SIZE + 20
+
+
+@pytest.fixture
+def client(db: Session) -> Iterator[TestClient]:
+    """The app, answering requests from the test's session."""
+    from app.db.session import get_db
+    from app.main import app
+
+    app.dependency_overrides[get_db] = lambda: db
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_db)
+
+
+@pytest.fixture
+def projects(db: Session) -> List[Project]:
+    """Projects newest first, created after anything else in the database."""
+    created = datetime(2100, 1, 1)
+    projects = [Project(name=f"Project {n}", created_at=created - timedelta(minutes=n)) for n in range(5)]
+    db.add_all(projects)
+    db.flush()
+    return projects
+
+
+@pytest.fixture
+def project(db: Session) -> Project:
+    """A project with more episodes than fit on a default page."""
+    project = Project(name="Long series")
+    db.add(project)
+    db.flush()
+    db.add_all(Episode(project_id=project.id, title=f"Episode {n}", episode_number=n) for n in range(1, EPISODES + 1))
+    db.flush()
+    return project
+
+
+def test_projects_skip_offsets_the_first_page(client: TestClient, projects: List[Project]):
+    response = client.get("/projects", params={"skip": 2, "limit": 2})
+    assert response.status_code == 200, response.text
+    assert [p["name"] for p in response.json()] == ["Project 2", "Project 3"]
+
+    # The cursor continues after the skipped page
+    following = client.get("/projects", params={"limit": 1, "cursor": response.headers[NEXT_CURSOR_HEADER]})
+    assert [p["name"] for p in following.json()] == ["Project 4"]
+
+
+def test_projects_skip_cannot_be_combined_with_cursor(client: TestClient, projects: List[Project]):
+    cursor = client.get("/projects", params={"limit": 1}).headers[NEXT_CURSOR_HEADER]
+    response = client.get("/projects", params={"skip": 1, "cursor": cursor})
+    assert response.status_code == 400
+
+
+def test_episodes_are_all_returned_without_limit_or_cursor(client: TestClient, project: Project):
+    response = client.get(f"/episodes/project/{project.id}")
+    assert response.status_code == 200, response.text
+    assert [e["episode_number"] for e in response.json()] == list(range(1, EPISODES + 1))
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_episodes_are_paged_when_the_client_asks(client: TestClient, project: Project):
+    first = client.get(f"/episodes/project/{project.id}", params={"limit": 10})
+    assert len(first.json()) == 10
+
+    rest = client.get(f"/episodes/project/{project.id}", params={"cursor": first.headers[NEXT_CURSOR_HEADER]})
+    assert [e["episode_number"] for e in rest.json()] == list(range(11, DEFAULT_PAGE_SIZE + 11))
+    assert NEXT_CURSOR_HEADER in rest.headers
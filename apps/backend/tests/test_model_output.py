@@ -0,0 +1,68 @@
+"""
+Model output handling: prose after the JSON is ignored, and only a 400 that
+rejects the json_schema output format turns structured output off.
+"""
+import asyncio
+
+import httpx
+import pytest
+from openai import BadRequestError
+
+from app.services.ai import openai_service as openai_module
+from app.services.ai.json_repair import repair_json
+from app.services.ai.openai_service import OpenAIService
+
+
+def test_prose_after_the_json_is_ignored():
+    result = repair_json('Here it is:\n{"scenes": [{"scene_number": 1}]}\nHope this helps!')
+    assert result.data == {"scenes": [{"scene_number": 1}]}
+    assert not result.repaired
+
+
+def test_prose_after_repaired_json_is_ignored():
+    result = repair_json('```json\n{"scenes": [{"scene_number": 1},]}\n```\nLet me know {if} you need more.')
+    assert result.data == {"scenes": [{"scene_number": 1}]}
+    assert result.repaired and not result.truncated
+
+
+def bad_request(message: str, param: str = None) -> BadRequestError:
+    request = httpx.Request("POST", "http://localhost/v1/responses")
+    body = {"message": message, "type": "invalid_request_error", "param": param, "code": None}
+    return BadRequestError(message, response=httpx.Response(400, request=request), body=body)
+
+
+@pytest.fixture
+def service(monkeypatch: pytest.MonkeyPatch) -> OpenAIService:
+    monkeypatch.setattr(openai_module.settings, "OPENAI_STRUCTURED_OUTPUT", True)
+    return OpenAIService(base_url="http://localhost/v1")
+
+
+def respond_with(service: OpenAIService, error: BadRequestError) -> list:
+    """Fail structured output requests with ``error``; return the requests made."""
+    requests = []
+
+    async def call(tokens: int, **request):
+        requests.append(request)
+        if "text" in request:
+            raise error
+        return "plain"
+
+    service._call_with_rate_limit = call
+    return requests
+
+
+def test_unsupported_structured_output_falls_back(service: OpenAIService):
+    requests = respond_with(
+        service, bad_request("'text.format' of type 'json_schema' is not supported with this model.", "text.format")
+    )
+    assert asyncio.run(service._create_response("instructions", "story")) == "plain"
+    assert not service.structured_output
+    assert ["text" in request for request in requests] == [True, False]
+
+
+def test_other_bad_requests_keep_structured_output(service: OpenAIService):
+    requests = respond_with(service, bad_request("This model's maximum context length is 8192 tokens.", "input"))
+    with pytest.raises(BadRequestError):
+        asyncio.run(service._create_response("instructions", "story"))
+    assert service.structured_output
+    assert len(requests) == 1
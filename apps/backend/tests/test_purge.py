@@ -0,0 +1,50 @@
+"""
+Concurrent purgers work on different deleted episodes instead of queueing
+behind the one whose batch is still open.
+"""
+from datetime import datetime, timedelta
+from typing import Iterator, List
+from uuid import UUID
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.db.session import SessionLocal, session_scope
+from app.models.episode import Episode
+from app.models.project import Project
+from app.repositories.purge import PurgeRepository
+
+
+@pytest.fixture
+def deleted_episode_ids(database: Engine) -> Iterator[List[UUID]]:
+    """Committed deleted episodes, longest-deleted first; removed afterwards."""
+    deleted_at = datetime(2000, 1, 1)
+    with session_scope() as db:
+        project = Project(name="Purge")
+        db.add(project)
+        db.flush()
+        episodes = [
+            Episode(project_id=project.id, title=f"Episode {n}", episode_number=n, deleted_at=deleted_at + timedelta(minutes=n))
+            for n in range(1, 4)
+        ]
+        db.add_all(episodes)
+    try:
+        yield [episode.id for episode in episodes]
+    finally:
+        with database.begin() as connection:
+            connection.execute(text("DELETE FROM projects WHERE id = :id"), {"id": project.id})
+
+
+def test_purgers_skip_an_episode_another_purger_holds(deleted_episode_ids: List[UUID]):
+    first, second = SessionLocal(), SessionLocal()
+    try:
+        assert PurgeRepository(first).get_next_deleted_episode_id() == deleted_episode_ids[0]
+        # The first purger's batch is still open, so the second one moves on
+        assert PurgeRepository(second).get_next_deleted_episode_id() == deleted_episode_ids[1]
+        first.rollback()
+        second.rollback()
+        assert PurgeRepository(second).get_next_deleted_episode_id() == deleted_episode_ids[0]
+    finally:
+        first.close()
+        second.close()
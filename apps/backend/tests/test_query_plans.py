@@ -0,0 +1,161 @@
+"""
+The hot read queries must stay indexed.
+
+Each test runs a repository method, captures the SQL it sends and asserts on
+the EXPLAIN (FORMAT JSON) plan of that exact statement. Sequential scans are
+disabled so the tables can stay small: the plans show which index the
+planner can use, not whether a tiny table is cheaper to read in full.
+"""
+import json
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List
+
+import pytest
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+
+from app.models.episode import Episode
+from app.models.project import Project
+from app.models.screenplay import Screenplay
+from app.repositories.episode import EpisodeRepository
+from app.repositories.scene import SceneRepository
+from app.repositories.screenplay import ScreenplayRepository
+
+EPISODES = 30
+SCREENPLAYS_PER_EPISODE = 3
+SCENES_PER_SCREENPLAY = 8
+
+
+@pytest.fixture
+def episodes(db: Session) -> List[Episode]:
+    """The episodes of a project, each with several screenplays of several scenes."""
+    project = Project(name="Plans")
+    db.add(project)
+    db.flush()
+    episodes = [Episode(project_id=project.id, title=f"Episode {n}", episode_number=n) for n in range(1, EPISODES + 1)]
+    db.add_all(episodes)
+    db.flush()
+    for episode in episodes:
+        for version in range(SCREENPLAYS_PER_EPISODE):
+            screenplay = Screenplay(
+                episode_id=episode.id,
+                ai_model="test",
+                scene_count=SCENES_PER_SCREENPLAY,
+                created_at=datetime(2026, 1, 1) + timedelta(minutes=version)
+            )
+            db.add(screenplay)
+            db.flush()
+            SceneRepository(db).insert_rows([
+                {
+                    "screenplay_id": screenplay.id,
+                    "scene_number": number,
+                    "title": f"Scene {number}",
+                    "duration_seconds": 10,
+                    "characters": ["Raju"],
+                    "dialogue": [{"character": "Raju", "line": f"Line {version}.{number}"}],
+                    "prompt": f"Episode {episode.episode_number}, version {version}, scene {number}",
+                }
+                for number in range(1, SCENES_PER_SCREENPLAY + 1)
+            ])
+        episode.latest_screenplay_id = screenplay.id
+    db.flush()
+    db.execute(text("ANALYZE"))
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    return episodes
+
+
+@contextmanager
+def captured_statements(db: Session) -> Iterator[List[tuple]]:
+    statements = []
+
+    def capture(connection, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def explain(db: Session, statement: str, parameters: Any) -> Dict[str, Any]:
+    """The root plan node of a captured statement."""
+    result = db.connection().exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+    plan = result.scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+def plan_nodes(plan: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def index_names(plan: Dict[str, Any]) -> List[str]:
+    return [node["Index Name"] for node in plan_nodes(plan) if "Index Name" in node]
+
+
+def node_types(plan: Dict[str, Any]) -> List[str]:
+    return [node["Node Type"] for node in plan_nodes(plan)]
+
+
+def only_plan(db: Session, statements: List[tuple]) -> Dict[str, Any]:
+    assert len(statements) == 1, [statement for statement, _ in statements]
+    return explain(db, *statements[0])
+
+
+def test_latest_scenes_follow_the_pointer_and_scene_order_index(db: Session, episodes: List[Episode]):
+    episode = episodes[0]
+    with captured_statements(db) as statements:
+        scenes = SceneRepository(db).get_latest_by_episode_id(episode.id)
+    assert [scene.scene_number for scene in scenes] == list(range(1, SCENES_PER_SCREENPLAY + 1))
+
+    indexes = index_names(only_plan(db, statements))
+    assert "episodes_pkey" in indexes
+    assert "ix_scenes_screenplay_id_scene_number" in indexes
+
+
+def test_latest_scenes_fallback_uses_the_screenplay_date_index(db: Session, episodes: List[Episode]):
+    episode = episodes[0]
+    episode.latest_screenplay_id = None
+    db.flush()
+    with captured_statements(db) as statements:
+        scenes = SceneRepository(db).get_latest_by_episode_id(episode.id)
+    assert len(scenes) == SCENES_PER_SCREENPLAY
+
+    indexes = index_names(only_plan(db, statements))
+    assert "ix_screenplays_episode_id_created_at_id" in indexes
+    assert "ix_scenes_screenplay_id_scene_number" in indexes
+
+
+def test_latest_screenplay_uses_the_screenplay_date_index(db: Session, episodes: List[Episode]):
+    episode = episodes[0]
+    with captured_statements(db) as statements:
+        screenplay = ScreenplayRepository(db).get_by_episode_id(episode.id)
+    assert screenplay.id == episode.latest_screenplay_id
+
+    plan = only_plan(db, statements)
+    assert "ix_screenplays_episode_id_created_at_id" in index_names(plan)
+    # The newest screenplay is the first index entry; nothing is sorted
+    assert "Sort" not in node_types(plan)
+
+
+@pytest.mark.parametrize("versions_only", [False, True])
+def test_episode_pages_are_index_range_scans(db: Session, episodes: List[Episode], versions_only: bool):
+    repository = EpisodeRepository(db)
+    first = repository.get_page_by_project(episodes[0].project_id, limit=10, versions_only=versions_only)
+    with captured_statements(db) as statements:
+        second = repository.get_page_by_project(
+            episodes[0].project_id, limit=10, cursor=first.next_cursor, versions_only=versions_only
+        )
+    assert [episode.episode_number for episode in second.items] == list(range(11, 21))
+
+    plan = only_plan(db, statements)
+    assert "ix_episodes_project_id_episode_number_id" in index_names(plan)
+    # The page is read in key order straight after the cursor
+    assert "Sort" not in node_types(plan)
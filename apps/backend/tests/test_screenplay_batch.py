@@ -0,0 +1,81 @@
+"""
+Offline screenplay batches: a failed poll of a still-running provider batch is
+retried instead of failing the job, and offline mode is refused up front for
+providers without a batch API.
+"""
+import asyncio
+from typing import Dict, Iterator, List, Optional
+from uuid import UUID
+
+import httpx
+import pytest
+from openai import APIConnectionError
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+from app.db.session import session_scope
+from app.models.episode import Episode
+from app.models.project import Project
+from app.models.story import Story
+from app.schemas.screenplay import SceneBase
+from app.services.ai.base_ai_service import BaseAIService
+from app.services.ai.stub_ai_service import StubAIService
+from app.services.screenplay_batch import ScreenplayBatchService
+
+
+@pytest.fixture
+def episode_ids(database: Engine) -> Iterator[List[UUID]]:
+    """Committed episodes with stories, visible to every connection; removed afterwards."""
+    with session_scope() as db:
+        project = Project(name="Offline batch")
+        db.add(project)
+        db.flush()
+        episodes = [Episode(project_id=project.id, title=f"Episode {n}", episode_number=n) for n in range(1, 4)]
+        db.add_all(episodes)
+        db.flush()
+        db.add_all(
+            Story(episode_id=episode.id, content=f"Raju arrives in town {n}.\n\nHe meets Meera at the market.")
+            for n, episode in enumerate(episodes)
+        )
+    try:
+        yield [episode.id for episode in episodes]
+    finally:
+        with database.begin() as connection:
+            connection.execute(text("DELETE FROM projects WHERE id = :id"), {"id": project.id})
+
+
+class FlakyBatchStub(StubAIService):
+    """The stub provider, whose first batch poll fails with a network error."""
+
+    def __init__(self):
+        super().__init__()
+        self.polls = 0
+
+    async def get_screenplay_batch_results(self, batch_id: str) -> Optional[Dict[str, List[SceneBase]]]:
+        self.polls += 1
+        if self.polls == 1:
+            raise APIConnectionError(request=httpx.Request("GET", f"http://localhost/v1/batches/{batch_id}"))
+        return await super().get_screenplay_batch_results(batch_id)
+
+
+class OnlineOnlyAIService(BaseAIService):
+    async def generate_screenplay(self, story_content: str) -> List[SceneBase]:
+        return []
+
+
+def test_a_failed_poll_is_retried(episode_ids: List[UUID]):
+    ai_service = FlakyBatchStub()
+    service = ScreenplayBatchService(ai_service)
+    service.poll_seconds = 0
+    job = service.create_job(episode_ids=episode_ids, mode="offline")
+
+    job = asyncio.run(service.run(job.id))
+
+    assert job.status == "completed", [episode.error for episode in job.episodes]
+    assert ai_service.polls == 2
+    assert all(episode.scene_count == 2 for episode in job.episodes)
+
+
+def test_offline_mode_needs_a_batch_api(episode_ids: List[UUID]):
+    with pytest.raises(ValueError, match="does not support offline"):
+        ScreenplayBatchService(OnlineOnlyAIService()).create_job(episode_ids=episode_ids, mode="offline")
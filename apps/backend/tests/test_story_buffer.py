@@ -0,0 +1,166 @@
+"""
+Buffered story edits read the story outside the write buffer's lock, so a slow
+database read never stalls the flusher (which takes the lock on the event
+loop), and an edit buffered by someone else during that read is not lost.
+
+Flushes: edits made while one runs start a fresh debounce window, and a
+failing flush is retried with backoff rather than on every tick.
+"""
+import contextlib
+import threading
+import time
+from datetime import datetime
+from typing import Iterator
+from uuid import UUID, uuid4
+
+import pytest
+
+from app.db import session as session_module
+from app.models.story import Story
+from app.schemas.story import StoryResponse, StoryUpdate
+from app.services import story as story_module
+from app.services.story import StoryRevisionConflictError, StoryService
+from app.services.story_buffer import StoryWriteBuffer, story_buffer
+
+TIMEOUT_SECONDS = 5
+
+
+@pytest.fixture
+def episode_id(monkeypatch: pytest.MonkeyPatch) -> Iterator[UUID]:
+    monkeypatch.setattr(story_module.settings, "STORY_WRITE_BEHIND", True)
+    episode_id = uuid4()
+    try:
+        yield episode_id
+    finally:
+        with story_buffer.lock:
+            story_buffer._pending.pop(episode_id, None)
+
+
+def slow_service(episode_id: UUID, reading: threading.Event, release: threading.Event) -> StoryService:
+    """A story service whose database read of the story waits for ``release``."""
+    stored = Story(
+        id=uuid4(), episode_id=episode_id, content="Raju", revision=3,
+        created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1)
+    )
+
+    def get_by_episode_id(requested: UUID) -> Story:
+        reading.set()
+        assert release.wait(TIMEOUT_SECONDS)
+        return stored
+
+    service = StoryService(db=None)
+    service.repository.get_by_episode_id = get_by_episode_id
+    return service
+
+
+def start_update(service: StoryService, episode_id: UUID, update: StoryUpdate) -> tuple:
+    outcome = {}
+
+    def run():
+        try:
+            outcome["story"] = service.update_story(episode_id, update)
+        except Exception as e:
+            outcome["error"] = e
+
+    writer = threading.Thread(target=run)
+    writer.start()
+    return writer, outcome
+
+
+def test_the_lock_is_free_while_the_story_is_read(episode_id: UUID):
+    reading, release = threading.Event(), threading.Event()
+    service = slow_service(episode_id, reading, release)
+    writer, outcome = start_update(service, episode_id, StoryUpdate(content="Raju and Meera"))
+    try:
+        assert reading.wait(TIMEOUT_SECONDS)
+        assert story_buffer.lock.acquire(timeout=1), "the buffer lock is held across the story read"
+        story_buffer.lock.release()
+    finally:
+        release.set()
+        writer.join(TIMEOUT_SECONDS)
+
+    assert outcome["story"].revision == 4
+    assert story_buffer.get(episode_id).content == "Raju and Meera"
+
+
+def test_an_edit_buffered_during_the_read_is_not_overwritten(episode_id: UUID):
+    reading, release = threading.Event(), threading.Event()
+    service = slow_service(episode_id, reading, release)
+    writer, outcome = start_update(
+        service, episode_id, StoryUpdate(ops=[{"position": 4, "insert": " waits"}], base_revision=3)
+    )
+    try:
+        assert reading.wait(TIMEOUT_SECONDS)
+        # Another editor's save of revision 3 lands while the first one is still reading
+        revision_3 = StoryResponse(
+            id=uuid4(), episode_id=episode_id, content="Raju", revision=3,
+            created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1)
+        )
+        story_buffer.put(revision_3, "Raju went home")
+    finally:
+        release.set()
+        writer.join(TIMEOUT_SECONDS)
+
+    assert isinstance(outcome["error"], StoryRevisionConflictError)
+    assert outcome["error"].current_revision == 4
+    assert story_buffer.get(episode_id).content == "Raju went home"
+
+
+@pytest.fixture
+def buffer(monkeypatch: pytest.MonkeyPatch) -> StoryWriteBuffer:
+    """A write buffer whose flushes go to ``persist`` instead of the database."""
+    monkeypatch.setattr(session_module, "session_scope", contextlib.nullcontext)
+    return StoryWriteBuffer(debounce_seconds=60, max_delay_seconds=60, max_edits=3)
+
+
+def persist_with(monkeypatch: pytest.MonkeyPatch, persist) -> None:
+    monkeypatch.setattr(StoryService, "persist_buffered_story", lambda service, story: persist(story))
+
+
+def buffered(episode_id: UUID, revision: int = 1) -> StoryResponse:
+    return StoryResponse(
+        id=uuid4(), episode_id=episode_id, content="Raju", revision=revision,
+        created_at=datetime(2026, 1, 1), updated_at=datetime(2026, 1, 1)
+    )
+
+
+def test_edits_made_during_a_flush_are_counted_from_the_first_of_them(
+    buffer: StoryWriteBuffer, monkeypatch: pytest.MonkeyPatch
+):
+    episode_id = uuid4()
+    story = buffered(episode_id)
+    for _ in range(3):
+        story = buffer.put(story, "Raju")
+    assert buffer._due(time.monotonic()) == [episode_id]
+
+    def persist(flushed: StoryResponse):
+        # Another edit lands while the snapshot is being written
+        buffer.put(flushed, "Raju and Meera")
+
+    persist_with(monkeypatch, persist)
+    edited_after = time.monotonic()
+    buffer.flush(episode_id)
+
+    entry = buffer._pending[episode_id]
+    assert entry.story.content == "Raju and Meera"
+    assert entry.edits == 1
+    assert entry.first_edit_at >= edited_after
+    assert buffer._due(time.monotonic()) == []
+
+
+def test_failed_flushes_back_off(buffer: StoryWriteBuffer, monkeypatch: pytest.MonkeyPatch):
+    episode_id = uuid4()
+    buffer.put(buffered(episode_id), "Raju")
+
+    def persist(story: StoryResponse):
+        raise RuntimeError("database unavailable")
+
+    persist_with(monkeypatch, persist)
+    now = time.monotonic()
+    buffer.flush(episode_id)
+    first_retry = buffer._pending[episode_id].retry_at
+    assert buffer._due(now + 60) == [episode_id]
+    assert buffer._due(now) == []
+
+    buffer.flush(episode_id)
+    assert buffer._pending[episode_id].retry_at - time.monotonic() > first_retry - now